@@ -1,18 +1,32 @@
-from .morphology import TurkishMorphology
-from .normalization import TurkishSentenceNormalizer, TurkishSpellChecker
-from .tokenization import TurkishSentenceExtractor, TurkishTokenizer
-
+import importlib
 import logging
-import sys
 
 __version__ = '0.2.3'
 
-root = logging.getLogger()
-root.setLevel(logging.INFO)
+# top level names are imported on first access, so importing only a part of the library, e.g. the tokenizer, does
+# not load the whole package.
+_lazy_imports = {
+    "TurkishMorphology": "zemberek.morphology",
+    "TurkishSentenceNormalizer": "zemberek.normalization",
+    "TurkishSpellChecker": "zemberek.normalization",
+    "TurkishSentenceExtractor": "zemberek.tokenization",
+    "TurkishTokenizer": "zemberek.tokenization",
+}
+
+__all__ = list(_lazy_imports.keys())
+
+# library does not configure logging. Applications can add handlers to the "zemberek" logger or the root logger.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str):
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-handler = logging.StreamHandler(sys.stdout)
-handler.setLevel(logging.INFO)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s\nMsg: %(message)s\n')
-handler.setFormatter(formatter)
-root.addHandler(handler)
 
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -0,0 +1,56 @@
+"""
+Builds a full form table from a word frequency list. Words are analyzed once and their analyses are saved, so that a
+TurkishMorphology instance using the table answers them without a search.
+
+Usage:
+    python -m zemberek.build_full_form_table --words FREQUENCY_FILE --output TABLE_FILE [--lexicon LEXICON_CSV]
+        [--limit 300000] [--informal] [--ignore-diacritics]
+
+Table is used with:
+    TurkishMorphology.builder(lexicon).use_full_form_table(FullFormTable.load(TABLE_FILE)).build()
+"""
+import argparse
+import logging
+import sys
+
+from zemberek.morphology import TurkishMorphology
+from zemberek.morphology.analysis.analysis_cache import AnalysisCache
+from zemberek.morphology.analysis.full_form_table import FullFormTable
+from zemberek.morphology.lexicon import RootLexicon
+from zemberek.morphology.lexicon.root_lexicon import DictionaryReader
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s\nMsg: %(message)s\n')
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", required=True,
+                        help="utf-8 word frequency file, see AnalysisCache.load_frequency_list for the format")
+    parser.add_argument("--output", required=True, help="path of the table file to create")
+    parser.add_argument("--lexicon", help="lexicon csv file. Default lexicon is used if it is not given")
+    parser.add_argument("--limit", type=int, help="maximum amount of most frequent words to add")
+    parser.add_argument("--informal", action="store_true", help="use informal analysis")
+    parser.add_argument("--ignore-diacritics", action="store_true", help="ignore diacritics in analysis")
+    args = parser.parse_args()
+
+    lexicon = RootLexicon.get_default() if args.lexicon is None else \
+        DictionaryReader.load_from_resources(args.lexicon)
+    builder = TurkishMorphology.builder(lexicon).disable_cache()
+    if args.informal:
+        builder.use_informal_analysis()
+    if args.ignore_diacritics:
+        builder.ignore_diacritics_in_analysis_()
+    morphology = builder.build()
+
+    words = AnalysisCache.load_frequency_list(args.words, args.limit)
+    table = FullFormTable.build(morphology, words)
+    table.save(args.output)
+    correct = sum(1 for encoded in table.entries.values() if len(encoded) > 0)
+    logger.info(f"{len(table)} words, {correct} with analyses, {len(table.morpheme_data)} distinct morpheme "
+                f"surfaces saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
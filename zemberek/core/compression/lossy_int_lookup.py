@@ -69,9 +69,7 @@ class LossyIntLookup:
             raise ValueError(f"File does not carry expected value in the beginning. magic != LossyIntLookup.magid")
 
         length = np.int32(struct.unpack('>i', dis.read(4))[0])
-        data = np.empty((length, ), dtype=np.int32)
-        for i in range(length):
-            data[i] = struct.unpack('>i', dis.read(4))[0]
+        data = np.frombuffer(dis.read(length * 4), dtype='>i4').astype(np.int32)
 
         mphf: 'Mphf' = MultiLevelMphf.deserialize(dis)
         return cls(mphf, data)
@@ -25,9 +25,7 @@ class LargeNgramMphf(Mphf):
         page_shift, = unpack('>i', f.read(4))
         phf_count, = unpack('>i', f.read(4))
 
-        offsets: np.ndarray = np.zeros(phf_count, dtype=np.int32)
-        for i in range(phf_count):
-            offsets[i], = unpack('>i', f.read(4))
+        offsets: np.ndarray = np.frombuffer(f.read(phf_count * 4), dtype='>i4').astype(np.int32)
 
         hashes: List[MultiLevelMphf] = []
         for i in range(phf_count):
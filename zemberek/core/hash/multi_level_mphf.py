@@ -30,9 +30,7 @@ class MultiLevelMphf(Mphf):
             bucket_amount, = unpack('>i', f.read(4))
             hash_seed_values: bytes = f.read(bucket_amount)
             failed_indexes_count, = unpack('>i', f.read(4))
-            failed_indexes: np.ndarray = np.zeros(failed_indexes_count, dtype=np.int32)
-            for j in range(failed_indexes_count):
-                failed_indexes[j], = unpack('>i', f.read(4))
+            failed_indexes: np.ndarray = np.frombuffer(f.read(failed_indexes_count * 4), dtype='>i4').astype(np.int32)
 
             indexes.append(MultiLevelMphf.HashIndexes(key_count, bucket_amount, hash_seed_values, failed_indexes))
         return MultiLevelMphf(tuple(indexes))
@@ -20,11 +20,22 @@ class FloatLookup:
     @staticmethod
     def get_lookup_from_double(file) -> 'FloatLookup':
         range_, = unpack('>i', file.read(4))
-        values = np.asarray(unpack('>{}d'.format(range_), file.read(range_ * 8)), dtype=np.float32)
+        values = np.frombuffer(file.read(range_ * 8), dtype='>f8').astype(np.float32)
         return FloatLookup(values)
 
     def get(self, n: int) -> np.float32:
         if 0 <= n < self.range_:
             return self.data[n]
         else:
-            raise ValueError("Value is out of range")
\ No newline at end of file
+            raise ValueError("Value is out of range")
+
+    def get_all(self, ranks: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get. Returns values of all given ranks.
+
+        :param ranks: array of ranks
+        :return: float32 array of values
+        """
+        if ranks.shape[0] > 0 and (ranks.min() < 0 or ranks.max() >= self.range_):
+            raise ValueError("Value is out of range")
+        return self.data[ranks]
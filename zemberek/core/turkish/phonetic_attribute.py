@@ -1,7 +1,12 @@
 from enum import Enum
+from typing import Iterable, Set
 
 
 class PhoneticAttribute(Enum):
+    """
+    Phonetic attributes of morphemes. During analysis and generation, a set of attributes is represented as an int
+    bit mask, each attribute has its own bit given by `mask`. Bits are assigned in the order of declaration.
+    """
 
     LastLetterVowel = "LLV"
     LastLetterConsonant = "LLC"
@@ -24,6 +29,8 @@ class PhoneticAttribute(Enum):
 
     def __init__(self, short_form: str):
         self.short_form = short_form
+        # members declared before this one are already registered.
+        self.mask = 1 << len(type(self)._member_names_)
 
     def get_string_form(self) -> str:
         """
@@ -31,3 +38,14 @@ class PhoneticAttribute(Enum):
         :return: short form
         """
         return self.short_form
+
+    @staticmethod
+    def to_mask(attributes: Iterable['PhoneticAttribute']) -> int:
+        mask = 0
+        for attribute in attributes:
+            mask |= attribute.mask
+        return mask
+
+    @staticmethod
+    def from_mask(mask: int) -> Set['PhoneticAttribute']:
+        return {attribute for attribute in PhoneticAttribute if mask & attribute.mask}
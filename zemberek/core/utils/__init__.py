@@ -1 +1,2 @@
 from .thread_locks import ReadWriteLock
+from .resources import resource_path
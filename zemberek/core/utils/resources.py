@@ -0,0 +1,24 @@
+import os
+
+try:
+    from importlib.resources import files
+except ImportError:  # python < 3.9
+    files = None
+
+
+def resource_path(*parts: str) -> str:
+    """
+    Returns the file system path of a file in zemberek resources package.
+
+    resource_path("normalization", "split.txt") -> .../zemberek/resources/normalization/split.txt
+
+    :param parts: path components relative to resources directory
+    :return: path of the resource
+    """
+    if files is None:
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            "resources", *parts)
+    resource = files("zemberek.resources")
+    for part in parts:
+        resource = resource.joinpath(part)
+    return str(resource)
@@ -9,6 +9,14 @@ class ReadWriteLock:
         self._read_ready = threading.Condition(threading.Lock())
         self._readers = 0
 
+    def __getstate__(self):
+        """ Locks are not serialized, a fresh lock is created when the
+        owner object is unpickled. """
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
     def acquire_read(self):
         """ Acquire a read lock. Blocks only if a thread has
         acquired the write lock. """
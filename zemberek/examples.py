@@ -1,3 +1,4 @@
+import sys
 import time
 import logging
 
@@ -9,6 +10,8 @@ from zemberek import (
     TurkishTokenizer
 )
 
+logging.basicConfig(stream=sys.stdout, level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s\nMsg: %(message)s\n')
 logger = logging.getLogger(__name__)
 
 examples = ["Yrn okua gidicem",
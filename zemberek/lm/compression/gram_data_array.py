@@ -6,7 +6,14 @@ from struct import unpack
 class GramDataArray:
     MAX_BUF: np.int32 = np.int32(0x3fffffff)
 
-    def __init__(self, file):
+    def __init__(self, file, memory_map: bool = False):
+        """
+        Reads gram data from a binary stream.
+
+        :param file: binary file positioned at the beginning of the gram data block
+        :param memory_map: if True, data pages are memory mapped read-only instead of being copied into memory.
+            Processes that map the same file share one copy of it in the page cache.
+        """
         self.count, self.fp_size, self.prob_size, self.backoff_size = unpack('>4i', file.read(4 * 4))
 
         if self.fp_size == 4:
@@ -35,7 +42,6 @@ class GramDataArray:
         self.data = []
 
         total = 0
-        dt = np.dtype('>b')
         for i in range(page_counter):
             if i < (page_counter - 1):
                 read_count = page_length * self.block_size
@@ -43,7 +49,12 @@ class GramDataArray:
             else:
                 read_count = (self.count * self.block_size) - total
 
-            self.data.append(np.fromfile(file, dtype=dt, count=read_count))
+            if memory_map and read_count > 0:
+                offset = file.tell()
+                self.data.append(np.memmap(file.name, dtype=np.uint8, mode='r', offset=offset, shape=(read_count,)))
+                file.seek(offset + read_count)
+            else:
+                self.data.append(np.fromfile(file, dtype=np.uint8, count=read_count))
 
     def get_probability_rank(self, index: int) -> int:
         page_id = self.rshift(index, self.page_shift)
@@ -51,11 +62,11 @@ class GramDataArray:
 
         d = self.data[page_id]
         if self.prob_size == 1:
-            return d[page_index] & 255
+            return int(d[page_index])
         elif self.prob_size == 2:
-            return (d[page_index] & 255) << 8 | d[page_index + 1] & 255
+            return int(d[page_index]) << 8 | int(d[page_index + 1])
         elif self.prob_size == 3:
-            return (d[page_index] & 255) << 16 | (d[page_index + 1] & 255) << 8 | d[page_index + 2] & 255
+            return int(d[page_index]) << 16 | int(d[page_index + 1]) << 8 | int(d[page_index + 2])
         else:
             return -1
 
@@ -65,14 +76,41 @@ class GramDataArray:
 
         d = self.data[page_id]
         if self.backoff_size == 1:
-            return d[page_index] & 255
+            return int(d[page_index])
         elif self.backoff_size == 2:
-            return (d[page_index] & 255) << 8 | d[page_index + 1] & 255
+            return int(d[page_index]) << 8 | int(d[page_index + 1])
         elif self.backoff_size == 3:
-            return (d[page_index] & 255) << 16 | (d[page_index + 1] & 255) << 8 | d[page_index + 2] & 255
+            return int(d[page_index]) << 16 | int(d[page_index + 1]) << 8 | int(d[page_index + 2])
         else:
             return -1
 
+    def get_probability_ranks(self) -> np.ndarray:
+        """
+        Vectorized version of get_probability_rank. Returns probability ranks of all grams in index order.
+        """
+        return self.get_ranks(self.fp_size, self.prob_size)
+
+    def get_back_off_ranks(self) -> np.ndarray:
+        """
+        Vectorized version of get_back_off_rank. Returns back-off ranks of all grams in index order.
+        """
+        return self.get_ranks(self.fp_size + self.prob_size, self.backoff_size)
+
+    def get_ranks(self, offset: int, size: int) -> np.ndarray:
+        if size < 1 or size > 3:
+            return np.full(self.count, -1, dtype=np.int32)
+        pages = []
+        remaining = self.count
+        for d in self.data:
+            page_count = min(remaining, d.shape[0] // self.block_size)
+            blocks = d[:page_count * self.block_size].reshape(page_count, self.block_size)
+            ranks = np.zeros(page_count, dtype=np.int32)
+            for i in range(size):
+                ranks = (ranks << 8) | blocks[:, offset + i]
+            pages.append(ranks)
+            remaining -= page_count
+        return np.concatenate(pages) if len(pages) != 1 else pages[0]
+
     def check_finger_print(self, fp_to_check_: int, global_index: int) -> bool:
         fp_to_check = fp_to_check_ & self.fp_mask
         page_index = (global_index & self.index_mask) * self.block_size
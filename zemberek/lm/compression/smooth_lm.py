@@ -19,11 +19,14 @@ class SmoothLM:
     uses Minimal Perfect Hash functions for compression, This means actual n-gram values are not
     stored in the model.
     Detailed explanation can be found in original zemberek file
+
+    If `memory_map` is True, n-gram data blocks are memory mapped read-only instead of being read into memory.
+    They are not parsed while loading, and processes that load the same model file share its pages.
     """
     LOG_ZERO_FLOAT = -math.log(sys.float_info.max)
 
     def __init__(self, resource: str, log_base: float, unigram_weigth: float, unknown_backoff_penalty: float,
-                 use_stupid_backoff: bool, stupid_backoff_alpha: float, ngram_key_file):
+                 use_stupid_backoff: bool, stupid_backoff_alpha: float, ngram_key_file, memory_map: bool = False):
         with open(resource, "rb") as f:  # "zemberek/resources/lm-unigram.slm"
             self.version, = unpack('>i', f.read(4))
             self.type_int, = unpack('>i', f.read(4))
@@ -53,7 +56,7 @@ class SmoothLM:
 
             self.ngram_data = [None]
             for unigram_count in range(1, self.order + 1):
-                self.ngram_data.insert(unigram_count, GramDataArray(f))
+                self.ngram_data.insert(unigram_count, GramDataArray(f, memory_map=memory_map))
             self.ngram_data = tuple(self.ngram_data)
 
             unigram_count = self.ngram_data[1].count
@@ -64,12 +67,9 @@ class SmoothLM:
             else:
                 self.unigram_backoffs = np.zeros((1,), dtype=np.float32)
 
-            for vocabulary_size in range(unigram_count):
-                i = self.ngram_data[1].get_probability_rank(vocabulary_size)
-                self.unigram_probs[vocabulary_size] = self.probability_lookups[1].get(i)
-                if self.order > 1:
-                    backoff = self.ngram_data[1].get_back_off_rank(vocabulary_size)
-                    self.unigram_backoffs[vocabulary_size] = self.backoff_lookups[1].get(backoff)
+            self.unigram_probs[:] = self.probability_lookups[1].get_all(self.ngram_data[1].get_probability_ranks())
+            if self.order > 1:
+                self.unigram_backoffs[:] = self.backoff_lookups[1].get_all(self.ngram_data[1].get_back_off_ranks())
 
             if self.type_ == SmoothLM.MphfType.LARGE:
                 self.mphfs: List[Optional[Mphf]] = [None] * (self.order + 1)
@@ -89,10 +89,8 @@ class SmoothLM:
                 self.unigram_backoffs = self.unigram_backoffs[:vocabulary_size] \
                     if len(self.unigram_backoffs) >= vocabulary_size \
                     else np.pad(self.unigram_backoffs, (0, vocabulary_size - len(self.unigram_backoffs)))
-
-                for i in range(unigram_count, vocabulary_size, 1):
-                    self.unigram_probs[i] = -20.0
-                    self.unigram_backoffs[i] = 0.0
+                self.unigram_probs[unigram_count:] = -20.0
+                self.unigram_backoffs[unigram_count:] = 0.0
 
         self.unigram_weight = unigram_weigth
         self.unknown_backoff_penalty = unknown_backoff_penalty
@@ -191,6 +189,11 @@ class SmoothLM:
             self._stupid_backoff_alpha = 0.4
             self.resource = resource
             self.ngram_ids = None
+            self._memory_map = False
+
+        def memory_map(self) -> 'SmoothLM.Builder':
+            self._memory_map = True
+            return self
 
         def log_base(self, log_base: float) -> 'SmoothLM.Builder':
             self._log_base = log_base
@@ -198,7 +201,7 @@ class SmoothLM:
 
         def build(self) -> 'SmoothLM':
             return SmoothLM(self.resource, self._log_base, self._unigram_weight, self._unknown_backoff_penalty,
-                            self._use_stupid_backoff, self._stupid_backoff_alpha, self.ngram_ids)
+                            self._use_stupid_backoff, self._stupid_backoff_alpha, self.ngram_ids, self._memory_map)
 
     class MphfType(Enum):
         SMALL = auto()
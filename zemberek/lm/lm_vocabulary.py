@@ -14,12 +14,7 @@ class LmVocabulary:
     DEFAULT_UNKNOWN_WORD = "<unk>"
 
     def __init__(self, f: BinaryIO):
-        vocabulary_length, = unpack(">i", f.read(4))
-
-        vocab: List[str] = []
-        for i in range(vocabulary_length):
-            utf_length, = unpack(">H", f.read(2))
-            vocab.append(f.read(utf_length).decode("utf-8"))
+        vocab = self.read_words(f)
 
         self.vocabulary_index_map: Dict[str, int] = {}
         self.unknown_word = None
@@ -32,6 +27,31 @@ class LmVocabulary:
 
         self.generate_map(vocab)
 
+    @staticmethod
+    def read_words(f: BinaryIO) -> List[str]:
+        """
+        Reads the vocabulary block, a word count followed by length prefixed utf-8 words. If the stream is seekable,
+        rest of the stream is read at once and the stream is positioned right after the vocabulary block.
+        """
+        vocabulary_length, = unpack(">i", f.read(4))
+        vocab: List[str] = []
+        if not f.seekable():
+            for i in range(vocabulary_length):
+                utf_length, = unpack(">H", f.read(2))
+                vocab.append(f.read(utf_length).decode("utf-8"))
+            return vocab
+
+        start = f.tell()
+        data = f.read()
+        offset = 0
+        for i in range(vocabulary_length):
+            utf_length = (data[offset] << 8) | data[offset + 1]
+            offset += 2
+            vocab.append(data[offset:offset + utf_length].decode("utf-8"))
+            offset += utf_length
+        f.seek(start + offset)
+        return vocab
+
     def index_of(self, word: str) -> int:
         k = self.vocabulary_index_map.get(word)
         return self.unknown_word_index if k is None else k
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING, DefaultDict, Any, Optional, Tuple, Dict
+from typing import List, TYPE_CHECKING, DefaultDict, Any, Optional
 
 from operator import attrgetter
 from collections import defaultdict, OrderedDict
@@ -14,6 +14,7 @@ from zemberek.core.turkish.secondary_pos import SecondaryPos
 from zemberek.morphology.ambiguity.ambiguity_resolver import AmbiguityResolver
 from zemberek.morphology.analysis.sentence_analysis import SentenceAnalysis
 from zemberek.morphology.analysis.word_analysis import WordAnalysis
+from zemberek.morphology.analysis.analysis_cache import AnalysisCache
 from zemberek.morphology.analysis.single_analysis import SingleAnalysis
 from zemberek.morphology.analysis.sentence_word_analysis import SentenceWordAnalysis
 
@@ -52,7 +53,7 @@ class PerceptronAmbiguityResolver(AmbiguityResolver):
 
             igs: List[str] = []
 
-            for i in range(sa.group_boundaries.shape[0]):
+            for i in range(len(sa.group_boundaries)):
                 s: str = sa.get_group(0).lexical_form()
 
                 if i == 0:
@@ -64,17 +65,24 @@ class PerceptronAmbiguityResolver(AmbiguityResolver):
             return self.igs[-1]
 
     class FeatureExtractor:
+        """
+        Attributes
+        ----------
+        feature_cache : AnalysisCache
+            bounded cache of extracted features keyed by analysis trigrams. It belongs to the extractor and it is
+            thread safe. None if use_cache is False
+        """
 
-        feature_cache: Dict[Tuple[SingleAnalysis, ...], DefaultDict[Any, np.int32]] = dict()
+        DEFAULT_FEATURE_CACHE_SIZE = 10000
 
-        def __init__(self, use_cache: bool):
+        def __init__(self, use_cache: bool, cache_size: int = DEFAULT_FEATURE_CACHE_SIZE):
             self.use_cache = use_cache
+            self.feature_cache: Optional[AnalysisCache] = AnalysisCache(cache_size) if use_cache else None
 
         def extract_from_trigram(self, trigram: List[SingleAnalysis]) -> DefaultDict[Any, np.int32]:
 
             if self.use_cache:
-                # raise ValueError(f"feature cache for FeatureExtractor has not been implemented yet!")
-                cached = self.feature_cache.get(tuple(trigram))
+                cached = self.feature_cache.get_if_present(tuple(trigram))
                 if cached is not None:
                     return cached
 
@@ -121,14 +129,14 @@ class PerceptronAmbiguityResolver(AmbiguityResolver):
             for k, ig in enumerate(w3.igs):
                 feats["20:" + str(k) + "-" + ig] += 1
 
-            feats[f"22:{trigram[2].group_boundaries.shape[0]}"] += 1
+            feats[f"22:{len(trigram[2].group_boundaries)}"] += 1
 
             # do this outside
             # for k in feats.keys():
             #     feats[k] = np.int32(feats[k])
 
             if self.use_cache:
-                self.feature_cache[tuple(trigram)] = feats
+                self.feature_cache.put(tuple(trigram), feats)
 
             return feats
 
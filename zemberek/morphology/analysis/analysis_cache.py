@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from enum import Enum, auto
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, Any
+
+
+class AnalysisCache:
+    """
+    A bounded, thread safe cache for morphological analysis results.
+
+    Keys are normalized inputs (see TurkishMorphology.normalize_for_analysis), so different spellings of the same
+    word such as "Kalemin" and "kalemin" share one entry. Results of the unidentified token analyzer depend on the
+    token, they are kept under (token content, token type) keys. Values are stored as they are given, usually tuples
+    of SingleAnalysis objects.
+
+    Attributes
+    ----------
+    max_size : int
+        maximum amount of entries kept in the cache
+    eviction_policy : AnalysisCache.EvictionPolicy
+        policy used for selecting the entry to remove when the cache is full
+    """
+
+    DEFAULT_MAX_SIZE = 50000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE,
+                 eviction_policy: 'AnalysisCache.EvictionPolicy' = None):
+        if max_size < 1:
+            raise ValueError(f"Cache size must be a positive number. But it is {max_size}")
+        self.max_size = max_size
+        self.eviction_policy = AnalysisCache.EvictionPolicy.LRU if eviction_policy is None else eviction_policy
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # LRU entries are kept in access order, least recently used first.
+        self.entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        # LFU bookkeeping. Keys with the same use count are kept in insertion order, so ties are broken by age.
+        self.counts: Dict[Hashable, int] = {}
+        self.count_buckets: Dict[int, 'OrderedDict[Hashable, None]'] = {}
+        self.min_count = 0
+
+    def __getstate__(self):
+        # only the configuration is serialized, cached entries and statistics are not.
+        return {"max_size": self.max_size, "eviction_policy": self.eviction_policy}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_size"], state["eviction_policy"])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def get_(self, key: Hashable, compute: Callable[[Hashable], Any]) -> Any:
+        """
+        Returns the cached value for the key. If it does not exist, value is computed with given function and added
+        to the cache, unless it is wrapped with AnalysisCache.Uncached. Value is computed outside of the lock, so two
+        threads may compute the same value concurrently.
+
+        :param key: normalized input
+        :param compute: function that calculates the value for a missing key
+        :return: cached or computed value
+        """
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.touch(key)
+                return self.entries[key]
+            self.misses += 1
+
+        value = compute(key)
+        if isinstance(value, AnalysisCache.Uncached):
+            return value.value
+        self.put(key, value)
+        return value
+
+    def get_if_present(self, key: Hashable) -> Optional[Any]:
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.touch(key)
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        with self.lock:
+            if key in self.entries:
+                self.entries[key] = value
+                self.touch(key)
+                return
+            while len(self.entries) >= self.max_size:
+                self.evict()
+            self.entries[key] = value
+            if self.eviction_policy == AnalysisCache.EvictionPolicy.LFU:
+                self.counts[key] = 1
+                self.count_buckets.setdefault(1, OrderedDict())[key] = None
+                self.min_count = 1
+
+    def touch(self, key: Hashable):
+        if self.eviction_policy == AnalysisCache.EvictionPolicy.LRU:
+            self.entries.move_to_end(key)
+        else:
+            count = self.counts[key]
+            bucket = self.count_buckets[count]
+            del bucket[key]
+            if len(bucket) == 0:
+                del self.count_buckets[count]
+                if self.min_count == count:
+                    self.min_count = count + 1
+            self.counts[key] = count + 1
+            self.count_buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def evict(self):
+        if self.eviction_policy == AnalysisCache.EvictionPolicy.LRU:
+            self.entries.popitem(last=False)
+        else:
+            if self.min_count not in self.count_buckets:
+                self.min_count = min(self.count_buckets.keys())
+            bucket = self.count_buckets[self.min_count]
+            key, _ = bucket.popitem(last=False)
+            if len(bucket) == 0:
+                del self.count_buckets[self.min_count]
+            del self.counts[key]
+            del self.entries[key]
+        self.evictions += 1
+
+    def resize(self, max_size: int):
+        """
+        Changes the capacity of the cache. If new capacity is smaller than the current amount of entries, entries
+        are evicted according to the eviction policy.
+
+        :param max_size: new capacity
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be a positive number. But it is {max_size}")
+        with self.lock:
+            self.max_size = max_size
+            while len(self.entries) > self.max_size:
+                self.evict()
+
+    def clear(self, reset_stats: bool = False):
+        with self.lock:
+            self.entries.clear()
+            self.counts.clear()
+            self.count_buckets.clear()
+            self.min_count = 0
+            if reset_stats:
+                self.hits = 0
+                self.misses = 0
+                self.evictions = 0
+
+    def warm_up(self, keys: Iterable[Hashable], compute: Callable[[Hashable], Any]):
+        """
+        Fills the cache with values of given keys. Keys should be ordered from the most frequent to the least
+        frequent, only the first `max_size` keys are used. Values wrapped with AnalysisCache.Uncached are not added.
+        Warm up does not change hit and miss statistics.
+
+        :param keys: normalized inputs to analyze
+        :param compute: function that calculates the value for a key
+        """
+        selected = []
+        for key in keys:
+            if len(selected) >= self.max_size:
+                break
+            selected.append(key)
+        # most frequent keys are added last, so they are the most recently used ones for LRU.
+        for key in reversed(selected):
+            if key not in self.entries:
+                value = compute(key)
+                if not isinstance(value, AnalysisCache.Uncached):
+                    self.put(key, value)
+
+    def stats(self) -> 'AnalysisCache.Stats':
+        with self.lock:
+            return AnalysisCache.Stats(self.hits, self.misses, self.evictions, len(self.entries), self.max_size)
+
+    @staticmethod
+    def load_frequency_list(path: str, limit: int = None) -> Tuple[str, ...]:
+        """
+        Reads a word frequency list. Each line contains a word optionally followed by its count, separated with
+        whitespace. Lines are sorted by count in descending order if counts exist.
+
+        :param path: path of the utf-8 encoded frequency file
+        :param limit: maximum amount of words to return. Default is None, meaning all words
+        :return: words, most frequent first
+        """
+        words = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 0:
+                    continue
+                count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+                words.append((parts[0], count))
+        words.sort(key=lambda x: x[1], reverse=True)
+        if limit is not None:
+            words = words[:limit]
+        return tuple(word for word, _ in words)
+
+    class Uncached:
+        """
+        A computed value that is returned to the caller but not stored, e.g. analyses of a search that is cut off by
+        a limit. Compute functions of `get_` and `warm_up` return it instead of the value.
+        """
+
+        __slots__ = ("value",)
+
+        def __init__(self, value: Any):
+            self.value = value
+
+    class EvictionPolicy(Enum):
+        LRU = auto()
+        LFU = auto()
+
+    class Stats:
+        def __init__(self, hits: int, misses: int, evictions: int, size: int, max_size: int):
+            self.hits = hits
+            self.misses = misses
+            self.evictions = evictions
+            self.size = size
+            self.max_size = max_size
+
+        def hit_rate(self) -> float:
+            total = self.hits + self.misses
+            return 0.0 if total == 0 else self.hits / total
+
+        def __str__(self):
+            return f"Stats{{hits={self.hits}, misses={self.misses}, evictions={self.evictions}, size={self.size}, " \
+                   f"max_size={self.max_size}, hit_rate={self.hit_rate():.4f}}}"
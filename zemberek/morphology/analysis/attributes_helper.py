@@ -1,60 +1,69 @@
-from copy import deepcopy
-from typing import Set
-
 from zemberek.core.turkish import TurkishAlphabet, PhoneticAttribute
 
 
 class AttributesHelper:
+    """
+    Calculates phonetic attributes of morphemes. Attribute sets are int bit masks of PhoneticAttribute.mask values.
+    """
 
     alphabet = TurkishAlphabet.INSTANCE
-    NO_VOWEL_ATTRIBUTES = (PhoneticAttribute.LastLetterConsonant, PhoneticAttribute.FirstLetterConsonant,
-                           PhoneticAttribute.HasNoVowel)
 
-    @classmethod
-    def get_morphemic_attributes(cls, seq: str, predecessor_attrs: Set[PhoneticAttribute] = None) -> \
-            Set[PhoneticAttribute]:
+    LAST_LETTER_VOWEL = PhoneticAttribute.LastLetterVowel.mask
+    LAST_LETTER_CONSONANT = PhoneticAttribute.LastLetterConsonant.mask
+    LAST_VOWEL_FRONTAL = PhoneticAttribute.LastVowelFrontal.mask
+    LAST_VOWEL_BACK = PhoneticAttribute.LastVowelBack.mask
+    LAST_VOWEL_ROUNDED = PhoneticAttribute.LastVowelRounded.mask
+    LAST_VOWEL_UNROUNDED = PhoneticAttribute.LastVowelUnrounded.mask
+    LAST_LETTER_VOICELESS = PhoneticAttribute.LastLetterVoiceless.mask
+    LAST_LETTER_VOICED = PhoneticAttribute.LastLetterVoiced.mask
+    LAST_LETTER_VOICELESS_STOP = PhoneticAttribute.LastLetterVoicelessStop.mask
+    FIRST_LETTER_VOWEL = PhoneticAttribute.FirstLetterVowel.mask
+    FIRST_LETTER_CONSONANT = PhoneticAttribute.FirstLetterConsonant.mask
+    EXPECTS_CONSONANT = PhoneticAttribute.ExpectsConsonant.mask
 
-        if predecessor_attrs is None:
-            predecessor_attrs = set()
+    NO_VOWEL_ATTRIBUTES = PhoneticAttribute.to_mask((PhoneticAttribute.LastLetterConsonant,
+                                                     PhoneticAttribute.FirstLetterConsonant,
+                                                     PhoneticAttribute.HasNoVowel))
+
+    @classmethod
+    def get_morphemic_attributes(cls, seq: str, predecessor_attrs: int = 0) -> int:
 
         if not seq:
-            return deepcopy(predecessor_attrs)
+            return predecessor_attrs
         else:
-            attrs = set()
+            attrs = 0
             if cls.alphabet.contains_vowel(seq):
                 last = cls.alphabet.get_last_letter(seq)
                 if last.is_vowel():
-                    attrs.add(PhoneticAttribute.LastLetterVowel)
+                    attrs |= cls.LAST_LETTER_VOWEL
                 else:
-                    attrs.add(PhoneticAttribute.LastLetterConsonant)
+                    attrs |= cls.LAST_LETTER_CONSONANT
 
                 last_vowel = last if last.is_vowel() else cls.alphabet.get_last_vowel(seq)
                 if last_vowel.is_frontal():
-                    attrs.add(PhoneticAttribute.LastVowelFrontal)
+                    attrs |= cls.LAST_VOWEL_FRONTAL
                 else:
-                    attrs.add(PhoneticAttribute.LastVowelBack)
+                    attrs |= cls.LAST_VOWEL_BACK
 
                 if last_vowel.is_rounded():
-                    attrs.add(PhoneticAttribute.LastVowelRounded)
+                    attrs |= cls.LAST_VOWEL_ROUNDED
                 else:
-                    attrs.add(PhoneticAttribute.LastVowelUnrounded)
+                    attrs |= cls.LAST_VOWEL_UNROUNDED
 
                 if cls.alphabet.get_first_letter(seq).is_vowel():
-                    attrs.add(PhoneticAttribute.FirstLetterVowel)
+                    attrs |= cls.FIRST_LETTER_VOWEL
                 else:
-                    attrs.add(PhoneticAttribute.FirstLetterConsonant)
+                    attrs |= cls.FIRST_LETTER_CONSONANT
             else:
-                attrs = deepcopy(predecessor_attrs)
-                attrs.update(cls.NO_VOWEL_ATTRIBUTES)
-                attrs.discard(PhoneticAttribute.LastLetterVowel)
-                attrs.discard(PhoneticAttribute.ExpectsConsonant)
+                attrs = (predecessor_attrs | cls.NO_VOWEL_ATTRIBUTES) & \
+                    ~(cls.LAST_LETTER_VOWEL | cls.EXPECTS_CONSONANT)
 
             last = cls.alphabet.get_last_letter(seq)
             if last.is_voiceless():
-                attrs.add(PhoneticAttribute.LastLetterVoiceless)
+                attrs |= cls.LAST_LETTER_VOICELESS
                 if last.is_stop_consonant():
-                    attrs.add(PhoneticAttribute.LastLetterVoicelessStop)
+                    attrs |= cls.LAST_LETTER_VOICELESS_STOP
             else:
-                attrs.add(PhoneticAttribute.LastLetterVoiced)
+                attrs |= cls.LAST_LETTER_VOICED
 
             return attrs
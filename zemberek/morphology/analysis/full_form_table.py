@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import time
+
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zemberek.morphology.turkish_morphology import TurkishMorphology
+    from zemberek.morphology.lexicon import DictionaryItem, RootLexicon
+
+from zemberek.core.turkish import TurkishAlphabet
+from zemberek.morphology.analysis.single_analysis import SingleAnalysis
+from zemberek.morphology.morphotactics import InformalTurkishMorphotactics
+from zemberek.morphology.morphotactics.turkish_morphotactics import get_morpheme_map
+
+logger = logging.getLogger(__name__)
+
+
+class FullFormTable:
+    """
+    Precompiled analyses of frequent word forms. Keys are normalized inputs (see
+    TurkishMorphology.normalize_for_analysis) and values are what TurkishMorphology.analyze_normalized returns for
+    them, so a hit replaces the whole search with one dictionary lookup. Words without analyses are kept too, they are
+    answered without a search as well.
+
+    Analyses are not stored as objects. Every analysis is encoded as the id of its dictionary item, indexes of its
+    (morpheme id, surface) pairs in `morpheme_data` and its group boundaries. Table is built with `build` and saved
+    with `save`, usually by the `zemberek.build_full_form_table` tool. It reflects the lexicon it is built with,
+    entries whose items do not exist in the lexicon are treated as misses.
+
+    Attributes
+    ----------
+    informal : bool
+        True if analyses are created with informal morphotactics
+    ignore_diacritics : bool
+        True if analyses are created with an ascii tolerant analyzer
+    morpheme_data : Tuple[Tuple[str, str], ...]
+        distinct (morpheme id, surface) pairs of all analyses
+    entries : Dict[str, Tuple[Tuple[str, Tuple[int, ...], Tuple[int, ...]], ...]]
+        encoded analyses of normalized inputs
+    """
+
+    FORMAT = "zemberek-full-form-table"
+    VERSION = 1
+
+    def __init__(self, informal: bool, ignore_diacritics: bool, morpheme_data: Tuple[Tuple[str, str], ...],
+                 entries: Dict[str, Tuple[Tuple[str, Tuple[int, ...], Tuple[int, ...]], ...]]):
+        self.informal = informal
+        self.ignore_diacritics = ignore_diacritics
+        self.morpheme_data = morpheme_data
+        self.entries = entries
+        # MorphemeData objects of morpheme_data, created when they are first used.
+        self.resolved: List[Optional[SingleAnalysis.MorphemeData]] = [None] * len(morpheme_data)
+
+    def __getstate__(self):
+        return {"informal": self.informal, "ignore_diacritics": self.ignore_diacritics,
+                "morpheme_data": self.morpheme_data, "entries": self.entries}
+
+    def __setstate__(self, state):
+        self.__init__(state["informal"], state["ignore_diacritics"], state["morpheme_data"], state["entries"])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, s: str) -> bool:
+        return s in self.entries
+
+    def is_correct(self, s: str) -> Optional[bool]:
+        """
+        Checks if a normalized input has analyses without decoding them.
+
+        :param s: normalized input
+        :return: True or False if the input is in the table, None otherwise
+        """
+        encoded = self.entries.get(s)
+        return None if encoded is None else len(encoded) > 0
+
+    def get(self, s: str, lexicon: RootLexicon) -> Optional[Tuple[SingleAnalysis, ...]]:
+        """
+        Returns analyses of a normalized input.
+
+        :param s: normalized input
+        :param lexicon: lexicon to get dictionary items from
+        :return: analyses of the input, or None if it is not in the table or it cannot be decoded
+        """
+        encoded = self.entries.get(s)
+        if encoded is None:
+            return None
+        result = []
+        for item_id, data_indexes, group_boundaries in encoded:
+            item = lexicon.get_item_by_id(item_id)
+            if item is None:
+                return None
+            morphemes = []
+            for i in data_indexes:
+                morpheme_data = self.resolved[i]
+                if morpheme_data is None:
+                    morpheme_data = self.resolve(i)
+                    if morpheme_data is None:
+                        return None
+                morphemes.append(morpheme_data)
+            result.append(SingleAnalysis(item, morphemes, group_boundaries))
+        return tuple(result)
+
+    def get_items(self, s: str, lexicon: RootLexicon) -> Optional[Tuple[DictionaryItem, ...]]:
+        """
+        Returns dictionary items of the analyses of a normalized input without decoding the analyses.
+
+        :param s: normalized input
+        :param lexicon: lexicon to get dictionary items from
+        :return: items of the analyses in the same order, or None if the input is not in the table or an item does not
+            exist in the lexicon
+        """
+        encoded = self.entries.get(s)
+        if encoded is None:
+            return None
+        items = tuple(lexicon.get_item_by_id(item_id) for item_id, _, _ in encoded)
+        return None if None in items else items
+
+    def resolve(self, index: int) -> Optional[SingleAnalysis.MorphemeData]:
+        morpheme_id, surface = self.morpheme_data[index]
+        morpheme = get_morpheme_map().get(morpheme_id)
+        if morpheme is None:
+            return None
+        # pairs are distinct, so each resolved instance is already shared by all analyses of the table. Threads
+        # that resolve the same pair create equal instances, the one that is stored last does not matter.
+        morpheme_data = SingleAnalysis.MorphemeData(morpheme, surface)
+        self.resolved[index] = morpheme_data
+        return morpheme_data
+
+    @staticmethod
+    def build(morphology: TurkishMorphology, words: Iterable[str]) -> 'FullFormTable':
+        """
+        Analyzes given words with the morphology and creates a table of their analyses.
+
+        :param morphology: morphology to create the analyses with
+        :param words: words to add to the table, for example words of a frequency list
+        :return: created table
+        """
+        start_time = time.time()
+        data_indexes: Dict[Tuple[str, str], int] = {}
+        entries: Dict[str, Tuple[Tuple[str, Tuple[int, ...], Tuple[int, ...]], ...]] = {}
+        for word in words:
+            s = TurkishAlphabet.INSTANCE.normalize_apostrophe(morphology.normalize_for_analysis(word))
+            if len(s) == 0 or s in entries:
+                continue
+            encoded = []
+            for analysis in morphology.analyze_normalized(s):
+                indexes = tuple(data_indexes.setdefault((m.morpheme.id_, m.surface), len(data_indexes))
+                                for m in analysis.morpheme_data_list)
+                encoded.append((analysis.item.id_, indexes, analysis.group_boundaries))
+            entries[s] = tuple(encoded)
+
+        morpheme_data = tuple(data_indexes.keys())
+        logger.info(f"Full form table of {len(entries)} words created in {time.time() - start_time} seconds")
+        return FullFormTable(isinstance(morphology.morphotactics, InformalTurkishMorphotactics),
+                             morphology.analyzer.ascii_tolerant, morpheme_data, entries)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            pickle.dump((FullFormTable.FORMAT, FullFormTable.VERSION), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path: str) -> 'FullFormTable':
+        """
+        Loads a table saved with `save`. Tables should only be loaded from trusted sources, as they are pickle files.
+
+        :param path: path of the table file
+        :return: loaded table
+        """
+        start_time = time.time()
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header != (FullFormTable.FORMAT, FullFormTable.VERSION):
+                raise ValueError(f"File {path} is not a compatible full form table. Header: {header}")
+            table = pickle.load(f)
+        logger.debug(f"Full form table loaded in {time.time() - start_time}")
+        return table
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zemberek.core.turkish import PrimaryPos
+    from zemberek.morphology.lexicon import DictionaryItem
+    from zemberek.morphology.analysis.single_analysis import SingleAnalysis
+
+
+class LemmaAnalysis:
+    """
+    Lemma of a word without the rest of its analysis. Words are lemmatized without creating SingleAnalysis objects,
+    see TurkishMorphology.lemmatize.
+
+    Attributes
+    ----------
+    item : DictionaryItem
+        dictionary item of the lemma
+    lemma : str
+        lemma of the dictionary item
+    pos : PrimaryPos
+        primary part of speech of the dictionary item
+    """
+
+    __slots__ = ("item", "lemma", "pos")
+
+    def __init__(self, item: DictionaryItem):
+        self.item = item
+        self.lemma: str = item.lemma
+        self.pos: PrimaryPos = item.primary_pos
+
+    def __str__(self):
+        return f"[{self.lemma}:{self.pos.short_form}]"
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif isinstance(other, LemmaAnalysis):
+            return self.item == other.item
+        else:
+            return False
+
+    def __hash__(self):
+        return hash(self.item)
+
+    @staticmethod
+    def from_items(items: Iterable[DictionaryItem]) -> Tuple['LemmaAnalysis', ...]:
+        """
+        :param items: dictionary items, may contain duplicates
+        :return: lemmas of distinct items, in the order of their first occurrences
+        """
+        result: List[LemmaAnalysis] = []
+        seen: Set[DictionaryItem] = set()
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                result.append(LemmaAnalysis(item))
+        return tuple(result)
+
+    @staticmethod
+    def from_analyses(analyses: Iterable[SingleAnalysis]) -> Tuple['LemmaAnalysis', ...]:
+        return LemmaAnalysis.from_items(a.item for a in analyses if not a.is_unknown())
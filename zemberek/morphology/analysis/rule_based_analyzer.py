@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import logging
+import time
 
-from copy import deepcopy
-from typing import List, Dict, Tuple, TYPE_CHECKING
+from enum import Enum, auto
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from zemberek.morphology.lexicon import DictionaryItem
     from zemberek.morphology.morphotactics import TurkishMorphotactics
+    from zemberek.morphology.morphotactics.stem_transition import StemTransition
+    from zemberek.morphology.morphotactics.suffix_transition import SuffixTransition
 
-from zemberek.core.turkish import PhoneticAttribute, TurkishAlphabet
+from zemberek.core.turkish import PhoneticAttribute, RootAttribute, TurkishAlphabet
 from zemberek.morphology.analysis.surface_transitions import SurfaceTransition
 from zemberek.morphology.analysis.single_analysis import SingleAnalysis
+from zemberek.morphology.analysis.lemma_analysis import LemmaAnalysis
 from zemberek.morphology.analysis.search_path import SearchPath
 from zemberek.morphology.analysis.attributes_helper import AttributesHelper
 
@@ -18,6 +23,18 @@ logger = logging.getLogger(__name__)
 
 
 class RuleBasedAnalyzer:
+    """
+    Finds analyses of a word by searching the morphotactic graph from all stems that are prefixes of the word.
+
+    Attributes
+    ----------
+    search_limits : RuleBasedAnalyzer.SearchLimits
+        limits used by analyses that do not pass their own limits. None means search is not bounded
+    """
+
+    CANNOT_TERMINATE = PhoneticAttribute.CannotTerminate.mask
+    EXPECTS_CONSONANT = PhoneticAttribute.ExpectsConsonant.mask
+    EXPECTS_VOWEL = PhoneticAttribute.ExpectsVowel.mask
 
     def __init__(self, morphotactics: TurkishMorphotactics):
         self.lexicon = morphotactics.get_root_lexicon()
@@ -25,6 +42,7 @@ class RuleBasedAnalyzer:
         self.morphotactics = morphotactics
         self.debug_mode = False
         self.ascii_tolerant = False
+        self.search_limits: Optional[RuleBasedAnalyzer.SearchLimits] = None
 
     @staticmethod
     def instance(morphotactics: TurkishMorphotactics) -> 'RuleBasedAnalyzer':
@@ -36,11 +54,102 @@ class RuleBasedAnalyzer:
         analyzer.ascii_tolerant = True
         return analyzer
 
-    def analyze(self, inp: str) -> Tuple[SingleAnalysis, ...]:
+    def set_search_limits(self, limits: Optional['RuleBasedAnalyzer.SearchLimits']):
+        self.search_limits = limits
+
+    def analyze(self, inp: str, stem_filter: Optional[Callable[[StemTransition], bool]] = None,
+                extra_stems: Sequence[StemTransition] = (),
+                limits: Optional['RuleBasedAnalyzer.SearchLimits'] = None) -> Tuple[SingleAnalysis, ...]:
+        """
+        :param inp: input word
+        :param stem_filter: optional predicate for stem candidates. Stems it rejects are not searched
+        :param extra_stems: stem transitions to use in addition to the ones of the lexicon, e.g. transitions of
+            runtime dictionary items. They are only used for this call and shared stem transitions are not modified
+        :param limits: search limits for this call. Default is `search_limits` of the analyzer
+        :return: analyses of the input. If a limit is exceeded, only the analyses found until then
+        """
+        return self.analyze_with_report(inp, stem_filter, extra_stems, limits).analyses
+
+    def analyze_with_report(self, inp: str, stem_filter: Optional[Callable[[StemTransition], bool]] = None,
+                            extra_stems: Sequence[StemTransition] = (),
+                            limits: Optional['RuleBasedAnalyzer.SearchLimits'] = None) \
+            -> 'RuleBasedAnalyzer.AnalysisReport':
+        """
+        Same as `analyze`, but also reports whether a search limit truncated the analyses.
+        """
+        if limits is None:
+            limits = self.search_limits
+        deadline = None if limits is None or limits.time_limit is None else time.monotonic() + limits.time_limit
+
         if self.debug_mode:
             raise NotImplementedError("Debug mode is not implemented")
 
+        paths = self.initial_paths(inp, stem_filter, extra_stems)
+
+        truncation: Optional[RuleBasedAnalyzer.Truncation] = None
+        if limits is None:
+            result_paths: Tuple[SearchPath] = self.search(paths)
+        else:
+            result_paths, truncation = self.bounded_search(paths, limits, deadline)
+            if truncation is not None:
+                logger.warning(f"Analysis of {inp} is truncated, {truncation.name} limit is exceeded. "
+                               f"{len(result_paths)} analyses are found until then.")
+        result: List[SingleAnalysis] = []
+
+        for path in result_paths:
+            analysis: SingleAnalysis = SingleAnalysis.from_search_path(path)
+            result.append(analysis)
+
+        return RuleBasedAnalyzer.AnalysisReport(tuple(result), truncation)
+
+    def lemmatize(self, inp: str, stem_filter: Optional[Callable[[StemTransition], bool]] = None,
+                  extra_stems: Sequence[StemTransition] = (),
+                  limits: Optional['RuleBasedAnalyzer.SearchLimits'] = None) -> Tuple[LemmaAnalysis, ...]:
+        """
+        Finds lemmas of the input with the same search as `analyze`, but analyses are not created. Once a path of a
+        dictionary item is accepted, other paths of that item are not searched further. Parameters are the same as
+        `analyze`.
+
+        :return: distinct lemmas in the order of the analyses `analyze` returns
+        """
+        return self.lemmatize_with_report(inp, stem_filter, extra_stems, limits).analyses
+
+    def lemmatize_with_report(self, inp: str, stem_filter: Optional[Callable[[StemTransition], bool]] = None,
+                              extra_stems: Sequence[StemTransition] = (),
+                              limits: Optional['RuleBasedAnalyzer.SearchLimits'] = None) \
+            -> 'RuleBasedAnalyzer.AnalysisReport':
+        """
+        Same as `lemmatize`, but also reports whether a search limit truncated the lemmas. Lemmas are the `analyses`
+        of the report.
+        """
+        if limits is None:
+            limits = self.search_limits
+        paths = self.initial_paths(inp, stem_filter, extra_stems)
+        truncation: Optional[RuleBasedAnalyzer.Truncation] = None
+        if limits is None:
+            items = self.search_items(paths)
+        else:
+            deadline = None if limits.time_limit is None else time.monotonic() + limits.time_limit
+            result_paths, truncation = self.bounded_search(paths, limits, deadline)
+            if truncation is not None:
+                logger.warning(f"Lemmatization of {inp} is truncated, {truncation.name} limit is exceeded.")
+            items = [path.get_dictionary_item() for path in result_paths]
+        # dummy items are replaced with their reference items as SingleAnalysis.from_search_path does.
+        lemmas = LemmaAnalysis.from_items(item.reference_item if item.has_attribute(RootAttribute.Dummy) else item
+                                          for item in items)
+        return RuleBasedAnalyzer.AnalysisReport(lemmas, truncation)
+
+    def initial_paths(self, inp: str, stem_filter: Optional[Callable[[StemTransition], bool]],
+                      extra_stems: Sequence[StemTransition]) -> List[SearchPath]:
         candidates = self.stem_transitions.get_prefix_matches(inp, self.ascii_tolerant)
+        # in ascii tolerant mode input is folded once. Tails and suffix surfaces are then compared with plain string
+        # operations. Folding does not change the length of the input.
+        if self.ascii_tolerant:
+            inp = TurkishAlphabet.INSTANCE.to_ascii(inp)
+        if len(extra_stems) > 0:
+            candidates = self.add_extra_stem_matches(inp, list(candidates), extra_stems)
+        if stem_filter is not None:
+            candidates = [candidate for candidate in candidates if stem_filter(candidate)]
 
         paths: List[SearchPath] = []
 
@@ -48,15 +157,26 @@ class RuleBasedAnalyzer:
             length = len(candidate.surface)
             tail = inp[length:]
             paths.append(SearchPath.initial_path(candidate, tail))
-
-        result_paths: Tuple[SearchPath] = self.search(paths)
-        result: List[SingleAnalysis] = []
-
-        for path in result_paths:
-            analysis: SingleAnalysis = SingleAnalysis.from_search_path(path)
-            result.append(analysis)
-
-        return tuple(result)
+        return paths
+
+    def add_extra_stem_matches(self, inp: str, candidates: List[StemTransition],
+                               extra_stems: Sequence[StemTransition]) -> List[StemTransition]:
+        """
+        Adds extra stems that are prefixes of the input to the prefix matches. Matches are ordered by surface length,
+        an extra stem comes after the lexicon stems with the same length as if it was added to the lexicon. In ascii
+        tolerant mode input should be folded.
+        """
+        for transition in extra_stems:
+            surface = transition.surface
+            if self.ascii_tolerant:
+                surface = TurkishAlphabet.INSTANCE.to_ascii(surface)
+            if not inp.startswith(surface):
+                continue
+            index = len(candidates)
+            while index > 0 and len(candidates[index - 1].surface) > len(surface):
+                index -= 1
+            candidates.insert(index, transition)
+        return candidates
 
     def search(self, current_paths: List[SearchPath]) -> Tuple[SearchPath, ...]:
         if len(current_paths) > 30:
@@ -68,7 +188,7 @@ class RuleBasedAnalyzer:
             for path in current_paths:
 
                 if len(path.tail) == 0:
-                    if path.terminal and PhoneticAttribute.CannotTerminate not in path.phonetic_attributes:
+                    if path.terminal and not path.phonetic_attributes & RuleBasedAnalyzer.CANNOT_TERMINATE:
                         result.append(path)
                         continue
                     if self.debug_mode:
@@ -81,70 +201,180 @@ class RuleBasedAnalyzer:
 
         return tuple(result)
 
+    def search_items(self, current_paths: List[SearchPath]) -> List[DictionaryItem]:
+        """
+        Same as `search`, but returns dictionary items of the result paths. Paths of an item that is already found
+        are dropped, so items are in the order of their first result paths in `search`.
+        """
+        if len(current_paths) > 30:
+            current_paths = self.prune_cyclic_paths(current_paths)
+        items: List[DictionaryItem] = []
+        found: Set[DictionaryItem] = set()
+
+        while len(current_paths) > 0:
+            all_new_paths = []
+            for path in current_paths:
+                item = path.stem_transition.item
+                if item in found:
+                    continue
+
+                if len(path.tail) == 0:
+                    if path.terminal and not path.phonetic_attributes & RuleBasedAnalyzer.CANNOT_TERMINATE:
+                        found.add(item)
+                        items.append(item)
+                        continue
+
+                all_new_paths.extend(self.advance(path))
+
+            current_paths = all_new_paths
+
+        return items
+
+    def bounded_search(self, current_paths: List[SearchPath], limits: 'RuleBasedAnalyzer.SearchLimits',
+                       deadline: Optional[float]) \
+            -> Tuple[Tuple[SearchPath, ...], Optional['RuleBasedAnalyzer.Truncation']]:
+        """
+        Same as `search`, but the search is bounded by given limits. When the frontier is too large, paths that
+        consumed less of the input are dropped and search continues. When too many paths are expanded or the
+        deadline passes, search stops.
+
+        :param current_paths: initial paths
+        :param limits: search limits
+        :param deadline: `time.monotonic` value to stop the search at. None if there is no time limit
+        :return: result paths and the limit that truncated the search, or None if no limit is exceeded
+        """
+        if len(current_paths) > 30:
+            current_paths = self.prune_cyclic_paths(current_paths)
+        result = []
+        truncation: Optional[RuleBasedAnalyzer.Truncation] = None
+        expanded = 0
+
+        while len(current_paths) > 0:
+            if limits.max_frontier_size is not None and len(current_paths) > limits.max_frontier_size:
+                current_paths = sorted(current_paths, key=lambda p: len(p.tail))[:limits.max_frontier_size]
+                truncation = RuleBasedAnalyzer.Truncation.FRONTIER_SIZE
+
+            all_new_paths = []
+            for path in current_paths:
+
+                if len(path.tail) == 0:
+                    if path.terminal and not path.phonetic_attributes & RuleBasedAnalyzer.CANNOT_TERMINATE:
+                        result.append(path)
+                        continue
+
+                if limits.max_expanded_paths is not None and expanded >= limits.max_expanded_paths:
+                    return tuple(result), RuleBasedAnalyzer.Truncation.EXPANDED_PATHS
+                if deadline is not None and time.monotonic() > deadline:
+                    return tuple(result), RuleBasedAnalyzer.Truncation.TIME_LIMIT
+                expanded += 1
+
+                all_new_paths.extend(self.advance(path))
+
+            current_paths = all_new_paths
+
+        return tuple(result), truncation
+
     def advance(self, path: SearchPath) -> List[SearchPath]:
         new_paths: List[SearchPath] = []
+        for suffix_transition, surface_transition, attributes in self.find_candidates(path):
+            if suffix_transition.local_condition or suffix_transition.can_pass(path):
+                new_paths.append(path.get_copy(surface_transition, attributes))
+        return new_paths
 
-        for transition in path.current_state.outgoing:
-            # assert transition.__class__ == SuffixTransition
-            suffix_transition = transition
+    def find_candidates(self, path: SearchPath) -> Tuple[Tuple[SuffixTransition, SurfaceTransition, int], ...]:
+        """
+        Finds outgoing transitions of the path whose surface matches the tail. Local conditions of the transitions
+        are checked here, other conditions depend on the whole path and should be checked by the caller.
+        Result only depends on the state, phonetic attributes and tail of the path. In ascii tolerant mode tail is
+        folded and it is compared with folded surfaces.
+
+        :param path: path to advance
+        :return: matching transitions with their surface transitions and the phonetic attributes after them
+        """
+        candidates = []
+
+        # only transitions that can match the first letter of the tail are checked.
+        for suffix_transition, surface, match_surface in path.current_state.outgoing_for(
+                path.phonetic_attributes, path.tail, self.ascii_tolerant):
             if len(path.tail) == 0 and suffix_transition.has_surface_form():
                 # NO DEBUG
                 continue
             else:
-                surface = SurfaceTransition.generate_surface(suffix_transition, path.phonetic_attributes)
-                tail_starts_with = TurkishAlphabet.INSTANCE.starts_with_ignore_diacritics(path.tail, surface) if\
-                    self.ascii_tolerant else path.tail.startswith(surface)
-                if not tail_starts_with:
+                if not path.tail.startswith(match_surface):
                     if self.debug_mode:
                         raise NotImplementedError("Not implemented debug_mode")
                 else:
                     if self.debug_mode:
                         raise NotImplementedError("Not implemented debug_mode")
-                    if suffix_transition.can_pass(path):
+                    if not suffix_transition.local_condition or suffix_transition.can_pass(path):
                         if not suffix_transition.has_surface_form():
-                            new_paths.append(path.get_copy(SurfaceTransition("", suffix_transition),
-                                                           path.phonetic_attributes))
+                            candidates.append((suffix_transition, SurfaceTransition("", suffix_transition),
+                                               path.phonetic_attributes))
                         else:
                             surface_transition = SurfaceTransition(surface, suffix_transition)
-                            tail_equals_surface = TurkishAlphabet.INSTANCE.equals_ignore_diacritics(path.tail, surface)\
-                                if self.ascii_tolerant else path.tail == surface
-
-                            attributes = deepcopy(path.phonetic_attributes) if tail_equals_surface else \
+                            attributes = path.phonetic_attributes if path.tail == match_surface else \
                                 AttributesHelper.get_morphemic_attributes(surface, path.phonetic_attributes)
-                            attributes.discard(PhoneticAttribute.CannotTerminate)
+                            attributes &= ~RuleBasedAnalyzer.CANNOT_TERMINATE
                             last_token = suffix_transition.get_last_template_token()
                             if last_token.type_ == SurfaceTransition.TemplateTokenType.LAST_VOICED:
-                                attributes.add(PhoneticAttribute.ExpectsConsonant)
+                                attributes |= RuleBasedAnalyzer.EXPECTS_CONSONANT
                             elif last_token.type_ == SurfaceTransition.TemplateTokenType.LAST_NOT_VOICED:
-                                attributes.add(PhoneticAttribute.ExpectsVowel)
-                                attributes.add(PhoneticAttribute.CannotTerminate)
+                                attributes |= RuleBasedAnalyzer.EXPECTS_VOWEL | RuleBasedAnalyzer.CANNOT_TERMINATE
 
-                            p: SearchPath = path.get_copy(surface_transition, attributes)
-                            new_paths.append(p)
-        return new_paths
+                            candidates.append((suffix_transition, surface_transition, attributes))
+        return tuple(candidates)
 
     @staticmethod
     def prune_cyclic_paths(tokens: List[SearchPath]) -> List[SearchPath]:
-        def add_or_increment(dict_: Dict[str, int], key: str):
-            if key in dict_.keys():
-                dict_[key] += 1
-                return dict_[key]
-            else:
-                dict_[key] = 1
-                return 1
-
-        result: List[SearchPath] = []
-
-        for token in tokens:
-            remove = False
-            type_counts: Dict[str, int] = {}
-
-            for node in token.transitions:
-                if add_or_increment(type_counts, node.get_state().id_) > 3:
-                    remove = True
-                    break
-
-            if not remove:
-                result.append(token)
-
-        return result
+        return [token for token in tokens if token.max_state_visits() <= 3]
+
+    class SearchLimits:
+        """
+        Limits of a single analysis. Long, noisy inputs may create too many search paths, limits bound the time spent
+        for them. None means there is no limit.
+
+        Attributes
+        ----------
+        max_frontier_size : int
+            maximum amount of paths kept at each step of the search
+        max_expanded_paths : int
+            maximum amount of paths advanced during the search
+        time_limit : float
+            maximum duration of an analysis in seconds
+        """
+
+        def __init__(self, max_frontier_size: int = None, max_expanded_paths: int = None, time_limit: float = None):
+            for name, value in (("max_frontier_size", max_frontier_size), ("max_expanded_paths", max_expanded_paths),
+                                ("time_limit", time_limit)):
+                if value is not None and value <= 0:
+                    raise ValueError(f"{name} must be a positive number. But it is {value}")
+            self.max_frontier_size = max_frontier_size
+            self.max_expanded_paths = max_expanded_paths
+            self.time_limit = time_limit
+
+        def __str__(self):
+            return f"SearchLimits{{max_frontier_size={self.max_frontier_size}, " \
+                   f"max_expanded_paths={self.max_expanded_paths}, time_limit={self.time_limit}}}"
+
+    class Truncation(Enum):
+        FRONTIER_SIZE = auto()
+        EXPANDED_PATHS = auto()
+        TIME_LIMIT = auto()
+
+    class AnalysisReport:
+        """
+        Attributes
+        ----------
+        analyses : Tuple[SingleAnalysis, ...]
+            analyses found by the search. LemmaAnalysis objects if the report is created by `lemmatize_with_report`
+        truncation : RuleBasedAnalyzer.Truncation
+            limit that truncated the search. None if analyses are complete
+        """
+
+        def __init__(self, analyses: Tuple[Union[SingleAnalysis, LemmaAnalysis], ...],
+                     truncation: Optional['RuleBasedAnalyzer.Truncation']):
+            self.analyses = analyses
+            self.truncation = truncation
+
+        def is_truncated(self) -> bool:
+            return self.truncation is not None
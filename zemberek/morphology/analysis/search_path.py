@@ -1,71 +1,116 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import List, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zemberek.morphology.morphotactics.morpheme_state import MorphemeState
     from zemberek.morphology.morphotactics.stem_transition import StemTransition
 
-from zemberek.core.turkish import PhoneticAttribute
 from zemberek.morphology.analysis.surface_transitions import SurfaceTransition
 
 
 class SearchPath:
-
-    def __init__(self, tail: str, current_state: MorphemeState, transitions: List[SurfaceTransition],
-                 phonetic_attributes: Set[PhoneticAttribute], terminal: bool):
+    """
+    A partial analysis of a word. Paths are immutable and a copy only links to the path it is created from, so
+    expanding a path does not copy its transition history. Paths that share a prefix share the same objects.
+
+    Attributes
+    ----------
+    tail : str
+        part of the input that is not consumed yet
+    current_state : MorphemeState
+        state of the last transition
+    transition : SurfaceTransition
+        last transition of the path
+    previous : SearchPath
+        path this path is created from. None for the initial path, whose transition is the stem transition
+    depth : int
+        number of transitions in the path, including the stem transition
+    max_state_visits_ : int
+        highest number of times a state is visited in the path. None until max_state_visits is called
+    """
+
+    __slots__ = ("tail", "current_state", "transition", "previous", "depth", "phonetic_attributes", "terminal",
+                 "contains_derivation", "contains_suffix_with_surface", "stem_transition", "max_state_visits_")
+
+    def __init__(self, tail: str, current_state: MorphemeState, transition: SurfaceTransition,
+                 previous: Optional['SearchPath'], phonetic_attributes: int, terminal: bool):
         self.tail = tail
         self.current_state = current_state
-        self.transitions = transitions
+        self.transition = transition
+        self.previous = previous
         self.phonetic_attributes = phonetic_attributes
         self.terminal = terminal
 
-        self.contains_derivation = False
-        self.contains_suffix_with_surface = False
+        if previous is None:
+            self.depth = 1
+            self.stem_transition = transition.lexical_transition
+            self.contains_derivation = False
+            self.contains_suffix_with_surface = False
+        else:
+            self.depth = previous.depth + 1
+            self.stem_transition = previous.stem_transition
+            self.contains_derivation = previous.contains_derivation or current_state.derivative
+            self.contains_suffix_with_surface = previous.contains_suffix_with_surface or len(transition.surface) != 0
+        self.max_state_visits_: Optional[int] = None
+
+    @property
+    def transitions(self) -> List[SurfaceTransition]:
+        """
+        Transitions of the path from the stem transition to the last one. The list is created on every call.
+        """
+        result: List[SurfaceTransition] = [None] * self.depth
+        path = self
+        for i in range(self.depth - 1, -1, -1):
+            result[i] = path.transition
+            path = path.previous
+        return result
 
     def has_dictionary_item(self, item) -> bool:
-        return item == self.get_stem_transition().item
+        return item == self.stem_transition.item
 
     def contains_suffix_with_surface_(self):
         return self.contains_suffix_with_surface
 
     def get_stem_transition(self):
-        return self.transitions[0].lexical_transition
+        return self.stem_transition
 
     def get_last_transition(self) -> SurfaceTransition:
-        return self.transitions[-1]
+        return self.transition
 
     def get_dictionary_item(self):
-        return self.get_stem_transition().item
+        return self.stem_transition.item
 
     def get_previous_state(self) -> MorphemeState:
-        return None if len(self.transitions) < 2 else self.transitions[len(self.transitions) - 2].get_state()
-
-    def get_copy_for_generation(self, surface_node: SurfaceTransition, phonetic_attributes: Set[PhoneticAttribute]) -> \
+        return None if self.previous is None else self.previous.current_state
+
+    def max_state_visits(self) -> int:
+        """
+        Returns the highest number of times a state is visited in this path. Visits are counted with a single walk
+        over the path when it is first called, paths that are never checked do not pay for it.
+        """
+        if self.max_state_visits_ is None:
+            visits: Dict[str, int] = {}
+            path = self
+            while path is not None:
+                visits[path.current_state.id_] = visits.get(path.current_state.id_, 0) + 1
+                path = path.previous
+            self.max_state_visits_ = max(visits.values())
+        return self.max_state_visits_
+
+    def get_copy_for_generation(self, surface_node: SurfaceTransition, phonetic_attributes: int) -> \
             'SearchPath':
-        is_terminal = surface_node.get_state().terminal_
-        hist: List[SurfaceTransition] = list(self.transitions)
-        hist.append(surface_node)
-        path = SearchPath(self.tail, surface_node.get_state(), hist, phonetic_attributes, is_terminal)
-        path.contains_suffix_with_surface = self.contains_suffix_with_surface or len(surface_node.surface) != 0
-        path.contains_derivation = self.contains_derivation or surface_node.get_state().derivative
-        return path
-
-    def get_copy(self, surface_node: SurfaceTransition, phonetic_attributes: Set[PhoneticAttribute]) -> 'SearchPath':
-        is_terminal = surface_node.get_state().terminal_
-        hist: List[SurfaceTransition] = self.transitions + [surface_node]
-        new_tail = self.tail[len(surface_node.surface):]
-        path: 'SearchPath' = SearchPath(new_tail, surface_node.get_state(), hist, phonetic_attributes, is_terminal)
-        path.contains_suffix_with_surface = self.contains_suffix_with_surface or len(surface_node.surface) != 0
-        path.contains_derivation = self.contains_derivation or surface_node.get_state().derivative
-        return path
+        state = surface_node.get_state()
+        return SearchPath(self.tail, state, surface_node, self, phonetic_attributes, state.terminal_)
+
+    def get_copy(self, surface_node: SurfaceTransition, phonetic_attributes: int) -> 'SearchPath':
+        state = surface_node.get_state()
+        return SearchPath(self.tail[len(surface_node.surface):], state, surface_node, self, phonetic_attributes,
+                          state.terminal_)
 
     @staticmethod
     def initial_path(stem_transition: StemTransition, tail: str) -> 'SearchPath':
-        morphemes: List[SurfaceTransition] = []
         root = SurfaceTransition(stem_transition.surface, stem_transition)
-        morphemes.append(root)
-        return SearchPath(tail, stem_transition.to, morphemes, deepcopy(stem_transition.phonetic_attributes),
+        return SearchPath(tail, stem_transition.to, root, None, stem_transition.phonetic_attributes,
                           stem_transition.to.terminal_)
 
     def __str__(self):
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import numpy as np
-
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zemberek.morphology.analysis.search_path import SearchPath
@@ -15,16 +13,27 @@ from zemberek.morphology.morphotactics.morpheme import Morpheme
 
 
 class SingleAnalysis:
-
-    empty_morpheme_cache: Dict[Morpheme, 'SingleAnalysis.MorphemeData'] = {}
-
-    def __init__(self, item: DictionaryItem, morpheme_data_list: List['SingleAnalysis.MorphemeData'],
-                 group_boundaries: np.ndarray):
+    """
+    Attributes
+    ----------
+    item : DictionaryItem
+        dictionary item of the analysis
+    morpheme_data_list : Tuple[SingleAnalysis.MorphemeData, ...]
+        morphemes and their surfaces, starting with the stem
+    group_boundaries : Tuple[int, ...]
+        index of the first morpheme of each inflectional group in morpheme_data_list. First value is always 0
+    hash_ : int
+        cached hash value. It is calculated on the first __hash__ call, 0 means it is not calculated yet
+    """
+
+    __slots__ = ("item", "morpheme_data_list", "group_boundaries", "hash_")
+
+    def __init__(self, item: DictionaryItem, morpheme_data_list: Sequence['SingleAnalysis.MorphemeData'],
+                 group_boundaries: Sequence[int]):
         self.item = item
-        self.morpheme_data_list = morpheme_data_list
-        self.group_boundaries = group_boundaries
+        self.morpheme_data_list: Tuple['SingleAnalysis.MorphemeData', ...] = tuple(morpheme_data_list)
+        self.group_boundaries: Tuple[int, ...] = tuple(group_boundaries)
         self.hash_ = 0
-        self.hash_ = hash(self)
 
     def __str__(self):
         return self.format_string()
@@ -61,7 +70,7 @@ class SingleAnalysis:
         if self is other:
             return True
         elif isinstance(other, SingleAnalysis):
-            if self.hash_ != other.hash_:
+            if hash(self) != hash(other):
                 return False
             else:
                 return False if self.item != other.item else self.morpheme_data_list == other.morpheme_data_list
@@ -69,14 +78,12 @@ class SingleAnalysis:
             return False
 
     def __hash__(self):
-        if self.hash_ != 0:
-            return self.hash_
-        else:
+        if self.hash_ == 0:
             result = hash(self.item)
             for h in self.morpheme_data_list:
                 result = 31 * result + (hash(h) if h is not None else 0)
-            result = 31 * result + self.hash_
-            return result
+            self.hash_ = result
+        return self.hash_
 
     def is_runtime(self) -> bool:
         return self.item.has_attribute(RootAttribute.Runtime)
@@ -103,11 +110,11 @@ class SingleAnalysis:
         return False
 
     def get_group(self, group_index: int) -> 'SingleAnalysis.MorphemeGroup':
-        if group_index < 0 or group_index > self.group_boundaries.shape[0]:
-            raise ValueError(f"There are only {self.group_boundaries.shape[0]} morpheme groups. "
+        if group_index < 0 or group_index > len(self.group_boundaries):
+            raise ValueError(f"There are only {len(self.group_boundaries)} morpheme groups. "
                              f"But input is {group_index}")
 
-        end_index = len(self.morpheme_data_list) if group_index == self.group_boundaries.shape[0] - 1 else \
+        end_index = len(self.morpheme_data_list) if group_index == len(self.group_boundaries) - 1 else \
             self.group_boundaries[group_index + 1]
         return SingleAnalysis.MorphemeGroup(self.morpheme_data_list[self.group_boundaries[group_index]: end_index])
 
@@ -118,55 +125,38 @@ class SingleAnalysis:
         return False
 
     def copy_for(self, item: DictionaryItem, stem: str) -> 'SingleAnalysis':
-        data: List['SingleAnalysis.MorphemeData'] = self.morpheme_data_list.copy()
-        data[0] = SingleAnalysis.MorphemeData(data[0].morpheme, stem)
-        return SingleAnalysis(item, data, self.group_boundaries.copy())
+        data = (SingleAnalysis.MorphemeData(self.morpheme_data_list[0].morpheme, stem),) + \
+            self.morpheme_data_list[1:]
+        return SingleAnalysis(item, data, self.group_boundaries)
 
     @classmethod
     def unknown(cls, input_: str) -> 'SingleAnalysis':
         item = DictionaryItem.UNKNOWN
         s = cls.MorphemeData(Morpheme.UNKNOWN, input_)
-        boundaries = np.asarray([0], dtype=np.int32)
-        return cls(item, [s], boundaries)
+        return cls(item, (s,), (0,))
 
     @staticmethod
     def dummy(inp: str, item: DictionaryItem) -> 'SingleAnalysis':
         s = SingleAnalysis.MorphemeData(Morpheme.UNKNOWN, inp)
-        boundaries: np.ndarray = np.zeros(1, dtype=np.int32)
-        return SingleAnalysis(item, [s], boundaries)
+        return SingleAnalysis(item, (s,), (0,))
 
     @staticmethod
     def from_search_path(search_path: SearchPath) -> 'SingleAnalysis':
-        morphemes: List['SingleAnalysis.MorphemeData'] = []
-        derivation_count = 0
-
-        for transition in search_path.transitions:
-            if transition.is_derivative():
-                derivation_count += 1
-
+        transitions = search_path.transitions
+        stem_transition = transitions[0]
+        # stem surfaces are not interned, runtime items (e.g. proper nouns with apostrophes) make them unbounded.
+        morphemes: List['SingleAnalysis.MorphemeData'] = [
+            SingleAnalysis.MorphemeData(stem_transition.get_morpheme(), stem_transition.surface)]
+        group_boundaries: List[int] = [0]
+
+        for i in range(1, len(transitions)):
+            transition = transitions[i]
             morpheme = transition.get_morpheme()
             if morpheme != TurkishMorphotactics.nom and morpheme != TurkishMorphotactics.pnon:
-                if len(transition.surface) == 0:
-                    morpheme_data = SingleAnalysis.empty_morpheme_cache.get(morpheme)
-                    if morpheme_data is None:
-                        morpheme_data = SingleAnalysis.MorphemeData(morpheme, "")
-                        SingleAnalysis.empty_morpheme_cache[morpheme] = morpheme_data
-
-                    morphemes.append(morpheme_data)
-                else:
-                    morpheme_data = SingleAnalysis.MorphemeData(morpheme, transition.surface)
-                    morphemes.append(morpheme_data)
-
-        group_boundaries: np.ndarray = np.zeros(derivation_count + 1, dtype=np.int32)
-        morpheme_counter = 0
-        derivation_counter = 1
-
-        for morpheme_data in morphemes:
-            if morpheme_data.morpheme.derivational_:
-                group_boundaries[derivation_counter] = morpheme_counter
-                derivation_counter += 1
-
-            morpheme_counter += 1
+                morpheme_data = SingleAnalysis.MorphemeData.of(morpheme, transition.surface)
+                if morpheme.derivational_:
+                    group_boundaries.append(len(morphemes))
+                morphemes.append(morpheme_data)
 
         item = search_path.get_dictionary_item()
         if item.has_attribute(RootAttribute.Dummy):
@@ -175,10 +165,37 @@ class SingleAnalysis:
         return SingleAnalysis(item, morphemes, group_boundaries)
 
     class MorphemeData:
+        """
+        A morpheme and its surface in an analysis. Instances are not modified after creation, so suffix morpheme
+        data are shared between analyses through MorphemeData.of.
+        """
+
+        __slots__ = ("morpheme", "surface")
+
+        interned: Dict[Tuple[Morpheme, str], 'SingleAnalysis.MorphemeData'] = {}
+
         def __init__(self, morpheme: Morpheme, surface: str):
             self.morpheme = morpheme
             self.surface = surface
 
+        @staticmethod
+        def of(morpheme: Morpheme, surface: str) -> 'SingleAnalysis.MorphemeData':
+            """
+            Returns the shared instance for the morpheme and surface, creating it on first use. Suffix surfaces are
+            generated from a limited set of templates, so the number of instances is bounded.
+
+            :param morpheme: suffix morpheme
+            :param surface: surface of the suffix
+            :return: shared MorphemeData
+            """
+            key = (morpheme, surface)
+            morpheme_data = SingleAnalysis.MorphemeData.interned.get(key)
+            if morpheme_data is None:
+                # setdefault is atomic, threads that create the same data concurrently get the same instance.
+                morpheme_data = SingleAnalysis.MorphemeData.interned.setdefault(
+                    key, SingleAnalysis.MorphemeData(morpheme, surface))
+            return morpheme_data
+
         def __str__(self):
             return self.to_morpheme_string()
 
@@ -202,7 +219,7 @@ class SingleAnalysis:
             return result
 
     class MorphemeGroup:
-        def __init__(self, morphemes: List['SingleAnalysis.MorphemeData']):
+        def __init__(self, morphemes: Sequence['SingleAnalysis.MorphemeData']):
             self.morphemes = morphemes
 
         def lexical_form(self) -> str:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Set, Union, TYPE_CHECKING
+from typing import Union, TYPE_CHECKING
 from enum import Enum, auto
 
 if TYPE_CHECKING:
@@ -7,12 +7,14 @@ if TYPE_CHECKING:
     from zemberek.morphology.morphotactics.morpheme_transition import MorphemeTransition
     from zemberek.morphology.morphotactics.stem_transition import StemTransition
 
-from zemberek.core.turkish import PhoneticAttribute, TurkishAlphabet
+from zemberek.core.turkish import TurkishAlphabet
 from zemberek.morphology.analysis.attributes_helper import AttributesHelper
 
 
 class SurfaceTransition:
 
+    __slots__ = ("surface", "lexical_transition")
+
     alphabet = TurkishAlphabet.INSTANCE
 
     def __init__(self, surface: str, transition: Union[SuffixTransition, StemTransition, MorphemeTransition]):
@@ -32,44 +34,45 @@ class SurfaceTransition:
         return ("" if len(self.surface) == 0 else self.surface + ":") + self.get_state().id_
 
     @staticmethod
-    def generate_surface(transition: SuffixTransition, phonetic_attributes: Set[PhoneticAttribute]):
+    def generate_surface(transition: SuffixTransition, phonetic_attributes: int):
         cached: str = transition.get_from_surface_cache(phonetic_attributes)
-        if cached:
+        if cached is not None:
             return cached
         else:
             sb = ""
 
             for index, token in enumerate(transition.token_list):
-                attrs: Set[PhoneticAttribute] = AttributesHelper.get_morphemic_attributes(sb, phonetic_attributes)
+                attrs: int = AttributesHelper.get_morphemic_attributes(sb, phonetic_attributes)
 
                 if token.type_ == SurfaceTransition.TemplateTokenType.LETTER:
                     sb += token.letter
                 elif token.type_ == SurfaceTransition.TemplateTokenType.A_WOVEL:
-                    if index != 0 or PhoneticAttribute.LastLetterVowel not in phonetic_attributes:
-                        if PhoneticAttribute.LastVowelBack in attrs:
+                    if index != 0 or not phonetic_attributes & AttributesHelper.LAST_LETTER_VOWEL:
+                        if attrs & AttributesHelper.LAST_VOWEL_BACK:
                             sb += 'a'
                         else:
-                            if PhoneticAttribute.LastVowelFrontal not in attrs:
+                            if not attrs & AttributesHelper.LAST_VOWEL_FRONTAL:
                                 raise ValueError("Cannot generate A form!")
                             sb += 'e'
                 elif token.type_ == SurfaceTransition.TemplateTokenType.I_WOVEL:
-                    if index != 0 or PhoneticAttribute.LastLetterVowel not in phonetic_attributes:
-                        if PhoneticAttribute.LastVowelFrontal in attrs and PhoneticAttribute.LastVowelUnrounded in attrs:
+                    if index != 0 or not phonetic_attributes & AttributesHelper.LAST_LETTER_VOWEL:
+                        if attrs & AttributesHelper.LAST_VOWEL_FRONTAL and attrs & AttributesHelper.LAST_VOWEL_UNROUNDED:
                             sb += 'i'
-                        elif PhoneticAttribute.LastVowelBack in attrs and PhoneticAttribute.LastVowelUnrounded in attrs:
+                        elif attrs & AttributesHelper.LAST_VOWEL_BACK and attrs & AttributesHelper.LAST_VOWEL_UNROUNDED:
                             sb += "ı"
-                        elif PhoneticAttribute.LastVowelBack in attrs and PhoneticAttribute.LastVowelRounded in attrs:
+                        elif attrs & AttributesHelper.LAST_VOWEL_BACK and attrs & AttributesHelper.LAST_VOWEL_ROUNDED:
                             sb += "u"
                         else:
-                            if PhoneticAttribute.LastVowelFrontal not in attrs or PhoneticAttribute.LastVowelRounded not in attrs:
+                            if not attrs & AttributesHelper.LAST_VOWEL_FRONTAL or \
+                                    not attrs & AttributesHelper.LAST_VOWEL_ROUNDED:
                                 raise ValueError("Cannot generate I form!")
                             sb += "ü"
                 elif token.type_ == SurfaceTransition.TemplateTokenType.APPEND:
-                    if PhoneticAttribute.LastLetterVowel in attrs:
+                    if attrs & AttributesHelper.LAST_LETTER_VOWEL:
                         sb += token.letter
                 elif token.type_ == SurfaceTransition.TemplateTokenType.DEVOICE_FIRST:
                     ld = token.letter
-                    if PhoneticAttribute.LastLetterVoiceless in attrs:
+                    if attrs & AttributesHelper.LAST_LETTER_VOICELESS:
                         ld = SurfaceTransition.alphabet.devoice(ld)
 
                     sb += ld
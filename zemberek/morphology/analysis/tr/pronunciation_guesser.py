@@ -1,12 +1,11 @@
 import logging
-import os
 import re
 
-from pkg_resources import resource_filename
 from typing import Dict, List
 
 from zemberek.core.turkish import TurkishSyllableExtractor, TurkishAlphabet
 from zemberek.morphology.analysis.tr.turkish_numbers import TurkishNumbers
+from zemberek.core.utils import resource_path
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +27,11 @@ class PronunciationGuesser:
     alphabet = TurkishAlphabet.INSTANCE
 
     turkish_letter_prons: Dict[str, str] = load_map(
-        resource_filename("zemberek", os.path.join("resources", "phonetics", "turkish-letter-names.txt")))
+        resource_path("phonetics", "turkish-letter-names.txt"))
     english_letter_prons: Dict[str, str] = load_map(
-        resource_filename("zemberek", os.path.join("resources", "phonetics", "english-letter-names.txt")))
+        resource_path("phonetics", "english-letter-names.txt"))
     english_phones_to_turkish: Dict[str, str] = load_map(
-        resource_filename("zemberek", os.path.join("resources", "phonetics", "english-phones-to-turkish.txt")))
+        resource_path("phonetics", "english-phones-to-turkish.txt"))
     extractor_for_abbrv: TurkishSyllableExtractor = TurkishSyllableExtractor.STRICT
 
     def to_turkish_letter_pronunciations(self, w: str) -> str:
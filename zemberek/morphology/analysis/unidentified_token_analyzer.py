@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import re
 
 from enum import Enum
@@ -7,6 +8,7 @@ from typing import List, Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .rule_based_analyzer import RuleBasedAnalyzer
+    from zemberek.morphology.morphotactics.stem_transition import StemTransition
 
 from zemberek.core.turkish import PrimaryPos, SecondaryPos, TurkishAlphabet, StemAndEnding, RootAttribute, Turkish
 from zemberek.tokenization.token import Token
@@ -14,6 +16,8 @@ from zemberek.morphology.lexicon import DictionaryItem
 from zemberek.morphology.analysis.tr import TurkishNumbers, TurkishNumeralEndingMachine, PronunciationGuesser
 from zemberek.morphology.analysis.single_analysis import SingleAnalysis
 
+logger = logging.getLogger(__name__)
+
 
 class UnidentifiedTokenAnalyzer:
     ALPHABET = TurkishAlphabet.INSTANCE
@@ -42,16 +46,7 @@ class UnidentifiedTokenAnalyzer:
             item = DictionaryItem(word, word, PrimaryPos.Noun, s_pos, pronunciation=normalized)
             if s_pos != SecondaryPos.HashTag and s_pos != SecondaryPos.Email and s_pos != SecondaryPos.Url and \
                     s_pos != SecondaryPos.Mention:
-                item_does_not_exist = item not in self.lexicon
-                if item_does_not_exist:
-                    item.attributes.add(RootAttribute.Runtime)
-                    self.analyzer.stem_transitions.add_dictionary_item(item)
-
-                results: Tuple[SingleAnalysis] = self.analyzer.analyze(word)
-                if item_does_not_exist:
-                    self.analyzer.stem_transitions.remove_dictionary_item(item)
-
-                return results
+                return self.analyzer.analyze(word, extra_stems=self.runtime_stems(item))
             else:
                 return self.analyze_word(word, s_pos)
         else:
@@ -116,16 +111,7 @@ class UnidentifiedTokenAnalyzer:
             result = (SingleAnalysis.dummy(word, item),)
             return result
         else:
-            item_does_not_exist: bool = item not in self.lexicon
-            if item_does_not_exist:
-                item.attributes.add(RootAttribute.Runtime)
-                self.analyzer.stem_transitions.add_dictionary_item(item)
-
-            results: Tuple[SingleAnalysis] = self.analyzer.analyze(normalized)
-            if item_does_not_exist:
-                self.analyzer.stem_transitions.remove_dictionary_item(item)
-
-            return results
+            return self.analyzer.analyze(normalized, extra_stems=self.runtime_stems(item))
 
     def try_word_with_apostrophe(self, word: str, secondary_pos: SecondaryPos) -> Tuple[SingleAnalysis, ...]:
         normalized = self.ALPHABET.normalize_apostrophe(word)
@@ -147,15 +133,9 @@ class UnidentifiedTokenAnalyzer:
                 result = (SingleAnalysis.dummy(word, item),)
                 return result
             else:
-                item_does_not_exist: bool = item not in self.lexicon
-                if item_does_not_exist:
-                    item.attributes.add(RootAttribute.Runtime)
-                    self.analyzer.stem_transitions.add_dictionary_item(item)
-
                 to_parse = stem_normalized + ending_normalized
-                no_quotes_parses: Tuple[SingleAnalysis] = self.analyzer.analyze(to_parse)
-                if item_does_not_exist:
-                    self.analyzer.stem_transitions.remove_dictionary_item(item)
+                no_quotes_parses: Tuple[SingleAnalysis] = self.analyzer.analyze(
+                    to_parse, extra_stems=self.runtime_stems(item))
 
                 analyses: Tuple[SingleAnalysis] = tuple(no_quotes_parse for no_quotes_parse in no_quotes_parses if
                                                         no_quotes_parse.get_stem() == stem_normalized)
@@ -163,6 +143,24 @@ class UnidentifiedTokenAnalyzer:
         else:
             return ()
 
+    def runtime_stems(self, item: DictionaryItem) -> Tuple[StemTransition, ...]:
+        """
+        Returns stem transitions of an item guessed for an unidentified token, or an empty tuple if the item is
+        already in the lexicon. Transitions are passed to the analyzer for a single analysis, so shared stem
+        transitions are not modified.
+
+        :param item: guessed item
+        :return: stem transitions of the item if it is a runtime item
+        """
+        if item in self.lexicon:
+            return ()
+        item.attributes.add(RootAttribute.Runtime)
+        try:
+            return self.analyzer.stem_transitions.generate(item)
+        except ValueError:
+            logger.debug(f"Cannot generate stem transition for {item.id_}")
+            return ()
+
     def guess_pronunciation(self, stem: str) -> str:
         return self.guesser.to_turkish_letter_pronunciations(stem) if not self.ALPHABET.contains_vowel(stem) else stem
 
@@ -5,6 +5,8 @@ if TYPE_CHECKING:
 
 
 class SingleAnalysisIterator:
+    __slots__ = ("analysis_results", "index")
+
     def __init__(self, analysis_results: Tuple['SingleAnalysis', ...]):
         self.analysis_results = analysis_results
         self.index = 0
@@ -20,6 +22,8 @@ class SingleAnalysisIterator:
 class WordAnalysis:
     EMPTY_INPUT_RESULT: 'WordAnalysis' = None
 
+    __slots__ = ("inp", "analysis_results", "normalized_input")
+
     def __init__(self, inp: str, analysis_results: Tuple['SingleAnalysis', ...], normalized_input: str = None):
         self.inp = inp
         self.analysis_results = analysis_results
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import multiprocessing
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zemberek.morphology.turkish_morphology import TurkishMorphology
+
+from zemberek.tokenization import TurkishSentenceExtractor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Morphology instance used by worker processes. It is set in the parent process before the worker pool is
+# created, so forked workers inherit the already loaded model instead of building their own.
+worker_morphology: Optional['TurkishMorphology'] = None
+# Sentence extractor of the current process, created when it is first used. Parent process creates it before the
+# worker pool, so workers inherit it too.
+sentence_extractor: Optional[TurkishSentenceExtractor] = None
+
+
+class CorpusChunk:
+    """
+    A byte range of a utf-8 corpus file. Ranges always start and end at line boundaries.
+
+    Attributes
+    ----------
+    chunk_id : int
+        order of the chunk among all chunks of the analyzed files
+    path : str
+        path of the corpus file
+    start : int
+        byte offset of the first line in the chunk
+    end : int
+        byte offset right after the last line in the chunk
+    """
+
+    def __init__(self, chunk_id: int, path: str, start: int, end: int):
+        self.chunk_id = chunk_id
+        self.path = path
+        self.start = start
+        self.end = end
+
+    def __str__(self):
+        return f"CorpusChunk{{id={self.chunk_id}, path={self.path}, start={self.start}, end={self.end}}}"
+
+
+class ChunkResult:
+    """
+    Analysis results of a CorpusChunk.
+
+    Attributes
+    ----------
+    chunk_id : int
+        id of the analyzed chunk
+    path : str
+        path of the corpus file
+    sentences : List[Tuple[str, List[Tuple[str, str]]]]
+        analyzed sentences in input order. Each item holds the sentence and (word, formatted analysis) pairs
+    """
+
+    def __init__(self, chunk_id: int, path: str, sentences: List[Tuple[str, List[Tuple[str, str]]]]):
+        self.chunk_id = chunk_id
+        self.path = path
+        self.sentences = sentences
+
+    def write_to(self, output: TextIO):
+        for sentence, words in self.sentences:
+            output.write(sentence + "\n")
+            for word, analysis in words:
+                output.write(word + "\t" + analysis + "\n")
+            output.write("\n")
+
+
+def split_into_chunks(paths: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[CorpusChunk]:
+    """
+    Splits files into chunks of roughly `chunk_size` bytes. Files are memory mapped and chunk ends are moved forward
+    to the next line break, so a line is never divided between two chunks.
+
+    :param paths: paths of utf-8 encoded corpus files. Each line is expected to hold one or more sentences
+    :param chunk_size: approximate chunk size in bytes
+    :return: chunks of all files in order
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be a positive number. But it is {chunk_size}")
+    chunks: List[CorpusChunk] = []
+    for path in paths:
+        size = os.path.getsize(path)
+        if size == 0:
+            continue
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = start + chunk_size
+                if end >= size:
+                    end = size
+                else:
+                    line_end = mm.find(b"\n", end - 1)
+                    end = size if line_end < 0 else line_end + 1
+                chunks.append(CorpusChunk(len(chunks), path, start, end))
+                start = end
+    return chunks
+
+
+def read_chunk(chunk: CorpusChunk) -> str:
+    with open(chunk.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[chunk.start:chunk.end].decode("utf-8")
+
+
+def get_sentence_extractor() -> TurkishSentenceExtractor:
+    global sentence_extractor
+    if sentence_extractor is None:
+        sentence_extractor = TurkishSentenceExtractor()
+    return sentence_extractor
+
+
+def analyze_chunk(chunk: CorpusChunk, disambiguate: bool = True, morphology: 'TurkishMorphology' = None) -> \
+        ChunkResult:
+    """
+    Analyzes the lines of a chunk. Each line is split into sentences with TurkishSentenceExtractor, and sentences
+    are analyzed and disambiguated separately. If morphology is not given, the instance inherited from the parent
+    process is used.
+
+    :param chunk: chunk to analyze
+    :param disambiguate: if True, only the best analysis of each word is reported
+    :param morphology: morphology instance to use
+    :return: analysis results of the chunk
+    """
+    morphology = worker_morphology if morphology is None else morphology
+    if morphology is None:
+        raise RuntimeError("No TurkishMorphology instance is available for corpus analysis")
+
+    extractor = get_sentence_extractor()
+    sentences: List[Tuple[str, List[Tuple[str, str]]]] = []
+    for sentence in (s for line in read_chunk(chunk).splitlines() for s in extractor.from_paragraph(line)):
+        if disambiguate:
+            word_analyses = morphology.analyze_sentence(sentence)
+            if len(word_analyses) == 0:
+                continue
+            analysis = morphology.disambiguate(sentence, word_analyses)
+            words = [(w.word_analysis.inp, w.best_analysis.format_string()) for w in analysis]
+        else:
+            words = [(w.inp, " | ".join(a.format_string() for a in w)) for w in morphology.analyze_sentence(sentence)]
+        sentences.append((sentence, words))
+    return ChunkResult(chunk.chunk_id, chunk.path, sentences)
+
+
+def iterate_corpus_analysis(paths: Iterable[str], workers: int = None, morphology: 'TurkishMorphology' = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, disambiguate: bool = True,
+                            ordered: bool = True) -> Iterator[ChunkResult]:
+    """
+    Analyzes corpus files with a pool of worker processes and yields results chunk by chunk.
+
+    Workers are forked after the morphology is loaded, so they share the loaded model with the parent process.
+    If the platform does not support fork or `workers` is 1, chunks are analyzed in the current process.
+
+    :param paths: paths of utf-8 encoded corpus files
+    :param workers: amount of worker processes. Default is None, meaning the cpu count
+    :param morphology: morphology instance to use. Default is None, meaning TurkishMorphology.create_with_defaults()
+    :param chunk_size: approximate chunk size in bytes
+    :param disambiguate: if True, only the best analysis of each word is reported
+    :param ordered: if True, results are yielded in input order. Otherwise in completion order
+    :return: iterator of chunk results
+    """
+    global worker_morphology
+
+    if morphology is None:
+        from zemberek.morphology.turkish_morphology import TurkishMorphology
+        morphology = TurkishMorphology.create_with_defaults()
+
+    chunks = split_into_chunks(paths, chunk_size)
+    get_sentence_extractor()
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError(f"Worker count must be a positive number. But it is {workers}")
+
+    if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning("Platform does not support fork, corpus is analyzed in a single process.")
+        workers = 1
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield analyze_chunk(chunk, disambiguate, morphology)
+        return
+
+    worker_morphology = morphology
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            # only a limited amount of chunks are submitted at once, so finished results do not pile up in memory.
+            max_pending = workers * 2
+            pending: Dict[Future, int] = {}
+            finished: Dict[int, ChunkResult] = {}
+            next_to_submit = 0
+            next_to_yield = 0
+
+            while next_to_yield < len(chunks):
+                while next_to_submit < len(chunks) and len(pending) + len(finished) < max_pending:
+                    future = executor.submit(analyze_chunk, chunks[next_to_submit], disambiguate)
+                    pending[future] = next_to_submit
+                    next_to_submit += 1
+
+                done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    result = future.result()
+                    if ordered:
+                        finished[result.chunk_id] = result
+                    else:
+                        next_to_yield += 1
+                        yield result
+
+                while ordered and next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+    finally:
+        worker_morphology = None
+
+
+def analyze_corpus(paths: Iterable[str], workers: int = None, morphology: 'TurkishMorphology' = None,
+                   output: TextIO = None, chunk_size: int = DEFAULT_CHUNK_SIZE, disambiguate: bool = True) -> int:
+    """
+    Analyzes corpus files in parallel and writes results to output in input order. For every sentence, the sentence
+    line is written first, followed by a `word<TAB>analysis` line for every word and an empty line.
+
+    :param paths: paths of utf-8 encoded corpus files
+    :param workers: amount of worker processes. Default is None, meaning the cpu count
+    :param morphology: morphology instance to use. Default is None, meaning TurkishMorphology.create_with_defaults()
+    :param output: text stream to write results. Default is sys.stdout
+    :param chunk_size: approximate chunk size in bytes
+    :param disambiguate: if True, only the best analysis of each word is written
+    :return: amount of analyzed sentences
+    """
+    output = sys.stdout if output is None else output
+    sentence_count = 0
+    for result in iterate_corpus_analysis(paths, workers=workers, morphology=morphology, chunk_size=chunk_size,
+                                          disambiguate=disambiguate, ordered=True):
+        result.write_to(output)
+        sentence_count += len(result.sentences)
+    return sentence_count
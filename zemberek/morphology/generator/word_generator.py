@@ -61,7 +61,7 @@ class WordGenerator:
 
             for path in current_paths:
                 if len(path.morphemes) == 0:
-                    if path.path.terminal and PhoneticAttribute.CannotTerminate not in path.path.phonetic_attributes:
+                    if path.path.terminal and not path.path.phonetic_attributes & PhoneticAttribute.CannotTerminate.mask:
                         result.append(path)
                         continue
 
@@ -95,14 +95,13 @@ class WordGenerator:
             surface_transition = SurfaceTransition(surface, suffix_transition)
             attributes = AttributesHelper.get_morphemic_attributes(surface, g_path.path.phonetic_attributes)
 
-            attributes.discard(PhoneticAttribute.CannotTerminate)
+            attributes &= ~PhoneticAttribute.CannotTerminate.mask
 
             last_token: SurfaceTransition.SuffixTemplateToken = suffix_transition.get_last_template_token()
             if last_token.type_ == SurfaceTransition.TemplateTokenType.LAST_VOICED:
-                attributes.add(PhoneticAttribute.ExpectsConsonant)
+                attributes |= PhoneticAttribute.ExpectsConsonant.mask
             elif last_token.type_ == SurfaceTransition.TemplateTokenType.LAST_NOT_VOICED:
-                attributes.add(PhoneticAttribute.ExpectsVowel)
-                attributes.add(PhoneticAttribute.CannotTerminate)
+                attributes |= PhoneticAttribute.ExpectsVowel.mask | PhoneticAttribute.CannotTerminate.mask
 
             p: SearchPath = g_path.path.get_copy_for_generation(surface_transition, attributes)
             new_paths.append(g_path.copy_(p))
@@ -1,13 +1,14 @@
-import csv
-import os
+import struct
 import time
 
-from pkg_resources import resource_filename
+import numpy as np
+
 from typing import List, Dict, Set, Tuple
 from logging import Logger
 
 from zemberek.core.turkish import RootAttribute, SecondaryPos, PrimaryPos
 from zemberek.morphology.lexicon.dictionary_item import DictionaryItem
+from zemberek.core.utils import resource_path
 
 logger = Logger("logger")
 
@@ -23,9 +24,21 @@ class DictionaryReader:
     -------
     load_from_resources(resource_path: str) -> RootLexicon
         Reads the lexicon dictionary from lexicon.csv file in the given path
+    load_binary(path: str) -> RootLexicon
+        Reads a lexicon that is saved with save_binary
+    save_binary(lexicon: RootLexicon, path: str)
+        Saves the lexicon in compact binary form
 
     """
 
+    BINARY_MAGIC = b"ZLEX"
+    BINARY_VERSION = 1
+
+    # attribute column values repeat a lot in lexicon.csv, so each distinct value is parsed only once.
+    attribute_cache: Dict[str, Tuple[RootAttribute, ...]] = {}
+    primary_pos_map: Dict[str, PrimaryPos] = {pos.value: pos for pos in PrimaryPos}
+    secondary_pos_map: Dict[str, SecondaryPos] = {pos.value: pos for pos in SecondaryPos}
+
     def __init__(self):
         pass
 
@@ -33,30 +46,33 @@ class DictionaryReader:
     def load_from_resources(resource_path: str) -> 'RootLexicon':
         """
         Reads the lexicon.csv file in the given path and creates and returns
-        a RootLexicon object
+        a RootLexicon object. Items are read in a single pass and references
+        are resolved to the already created items afterwards.
 
         :param resource_path: path to the lexicon.csv file to be read
         :return: RootLexicon instance with the read lexicon dictionary
         """
-        items = list()
-        csv.field_size_limit(100000000)
-        # relative path: os.path.join(os.path.dirname(os.path.dirname(os.getcwd())), "resources/lexicon.csv"
+        items: List[DictionaryItem] = []
+        items_by_id: Dict[str, DictionaryItem] = {}
+        references: List[Tuple[DictionaryItem, str]] = []
         with open(resource_path, 'r', encoding='utf-8') as f:
-            lex = list(csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE))
-
-            for i, line in enumerate(lex):
+            for line_number, line in enumerate(f, 1):
+                if len(line.strip()) == 0:
+                    continue
+                line = line.rstrip("\r\n").split("\t")
+                if len(line) < 9:
+                    raise ValueError(f"Line {line_number} of {resource_path} has {len(line)} columns instead of 9")
                 item = DictionaryReader.make_dict_item_from_line(line)
+                items_by_id.setdefault(line[0], item)
                 if line[7] != 'null':
-                    reference_item_line = None
-                    iterator = iter(lex)
-                    while reference_item_line is None:
-                        line_ref = next(iterator)
-                        if line[7] == line_ref[0]:
-                            reference_item_line = line_ref
-                    assert reference_item_line is not None
-                    item.set_reference_item(DictionaryReader.make_dict_item_from_line(reference_item_line))
-
+                    references.append((item, line[7]))
                 items.append(item)
+
+        for item, reference_id in references:
+            reference_item = items_by_id.get(reference_id)
+            if reference_item is None:
+                raise ValueError(f"Reference item {reference_id} of {item.id_} does not exist in lexicon")
+            item.set_reference_item(reference_item)
         return RootLexicon(items)
 
     @staticmethod
@@ -68,17 +84,122 @@ class DictionaryReader:
         :return: a DictionaryItem instance with the parameters parsed from the line
         """
         item_lemma, item_root, item_pron = line[1], line[2], line[5]
-        item_ppos, item_spos = PrimaryPos(line[3]), SecondaryPos(line[4])
+        item_ppos = DictionaryReader.primary_pos_map.get(line[3])
+        if item_ppos is None:
+            item_ppos = PrimaryPos(line[3])
+        item_spos = DictionaryReader.secondary_pos_map.get(line[4])
+        if item_spos is None:
+            item_spos = SecondaryPos(line[4])
         item_index = int(line[6])
 
         if line[8] == '0':
             item_attrs = None
         else:
-            item_attrs = set([RootAttribute[attr] for attr in line[8].split()])
+            attrs = DictionaryReader.attribute_cache.get(line[8])
+            if attrs is None:
+                attrs = tuple(RootAttribute[attr] for attr in line[8].split())
+                DictionaryReader.attribute_cache[line[8]] = attrs
+            # every item gets its own set, attributes of an item may be modified later.
+            item_attrs = set(attrs)
 
         return DictionaryItem(item_lemma, item_root, item_ppos, item_spos,
                               item_attrs, item_pron, item_index)
 
+    @staticmethod
+    def save_binary(lexicon: 'RootLexicon', path: str):
+        """
+        Saves the lexicon in a compact binary form that can be loaded with load_binary.
+
+        File starts with a header of magic bytes, version, item count and string block length. It is followed by
+        an utf-8 string block that holds lemma, root and pronunciation of items separated with tabs, and big endian
+        int32 columns of primary pos, secondary pos, index and reference item position of items. Attributes are
+        stored last as int64 bit masks.
+
+        :param lexicon: lexicon to save
+        :param path: path of the binary file
+        """
+        items = sorted(lexicon.item_set, key=lambda x: x.id_)
+        positions = {item.id_: i for i, item in enumerate(items)}
+        primary_pos_list = list(PrimaryPos)
+        secondary_pos_list = list(SecondaryPos)
+        attribute_list = list(RootAttribute)
+        if len(attribute_list) > 63:
+            raise ValueError(f"Root attributes do not fit in an int64 mask: {len(attribute_list)}")
+
+        strings = []
+        columns = np.empty((4, len(items)), dtype='>i4')
+        masks = np.zeros(len(items), dtype='>i8')
+        for i, item in enumerate(items):
+            strings.extend((item.lemma, item.root, item.pronunciation))
+            columns[0, i] = primary_pos_list.index(item.primary_pos)
+            columns[1, i] = secondary_pos_list.index(item.secondary_pos)
+            columns[2, i] = item.index
+            if item.reference_item is None:
+                columns[3, i] = -1
+            else:
+                if item.reference_item.id_ not in positions:
+                    raise ValueError(f"Reference item {item.reference_item.id_} of {item.id_} is not in lexicon")
+                columns[3, i] = positions[item.reference_item.id_]
+            mask = 0
+            for attribute in item.attributes:
+                mask |= 1 << attribute_list.index(attribute)
+            masks[i] = mask
+
+        string_block = "\t".join(strings).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(DictionaryReader.BINARY_MAGIC)
+            f.write(struct.pack(">iii", DictionaryReader.BINARY_VERSION, len(items), len(string_block)))
+            f.write(string_block)
+            f.write(columns.tobytes())
+            f.write(masks.tobytes())
+
+    @staticmethod
+    def load_binary(path: str) -> 'RootLexicon':
+        """
+        Reads a lexicon file created by save_binary. Whole file is read at once and numeric columns are decoded
+        with single numpy calls.
+
+        :param path: path of the binary file
+        :return: RootLexicon instance
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic_length = len(DictionaryReader.BINARY_MAGIC)
+        if data[:magic_length] != DictionaryReader.BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary lexicon file")
+        version, count, string_length = struct.unpack_from(">iii", data, magic_length)
+        if version != DictionaryReader.BINARY_VERSION:
+            raise ValueError(f"Unsupported binary lexicon version {version} in {path}")
+
+        offset = magic_length + 12
+        strings = data[offset:offset + string_length].decode("utf-8").split("\t") if count > 0 else []
+        offset += string_length
+        columns = np.frombuffer(data, dtype='>i4', count=4 * count, offset=offset).reshape(4, count).tolist()
+        offset += 16 * count
+        masks = np.frombuffer(data, dtype='>i8', count=count, offset=offset).tolist()
+
+        primary_pos_list = list(PrimaryPos)
+        secondary_pos_list = list(SecondaryPos)
+        attribute_list = list(RootAttribute)
+        attribute_cache: Dict[int, Tuple[RootAttribute, ...]] = {}
+
+        items: List[DictionaryItem] = []
+        for i in range(count):
+            mask = masks[i]
+            attrs = attribute_cache.get(mask)
+            if attrs is None:
+                attrs = tuple(a for j, a in enumerate(attribute_list) if mask & (1 << j))
+                attribute_cache[mask] = attrs
+            items.append(DictionaryItem(strings[3 * i], strings[3 * i + 1], primary_pos_list[columns[0][i]],
+                                        secondary_pos_list[columns[1][i]], set(attrs), strings[3 * i + 2],
+                                        columns[2][i]))
+
+        for item, reference in zip(items, columns[3]):
+            if reference >= 0:
+                item.set_reference_item(items[reference])
+        return RootLexicon(items)
+
 
 class DictionaryItemIterator:
     """
@@ -155,7 +276,7 @@ class RootLexicon:
     @staticmethod
     def get_default() -> 'RootLexicon':
         start = time.time()
-        lexicon_path = resource_filename("zemberek", os.path.join("resources", "lexicon.csv"))
+        lexicon_path = resource_path("lexicon.csv")
         lexicon = DictionaryReader.load_from_resources(lexicon_path)
         logger.debug(f"Dictionary generated in {time.time() - start} seconds")
         return lexicon
@@ -1,37 +1,41 @@
-from threading import Lock
-from typing import Dict, Set, Union
+from typing import Dict, Tuple, Union
 
-from zemberek.core.turkish.phonetic_attribute import PhoneticAttribute
+from zemberek.core.turkish import PhoneticAttribute
 
 
 class AttributeToSurfaceCache:
+    """
+    Keeps generated surfaces of a suffix template. Surface of a template only depends on a few phonetic attributes
+    of the preceding part of the word, so keys are phonetic attribute bit masks reduced to SURFACE_ATTRIBUTES.
+
+    Tables are filled for all SURFACE_ATTRIBUTE_COMBINATIONS when the morphotactics is built (see
+    TurkishMorphotactics.build_surface_tables). Lookups and additions do not use a lock, setting a dict item is
+    atomic and a surface is always generated the same for a key.
+    """
+
+    SURFACE_ATTRIBUTES = PhoneticAttribute.to_mask((PhoneticAttribute.LastLetterVowel,
+                                                    PhoneticAttribute.LastVowelFrontal,
+                                                    PhoneticAttribute.LastVowelBack,
+                                                    PhoneticAttribute.LastVowelRounded,
+                                                    PhoneticAttribute.LastVowelUnrounded,
+                                                    PhoneticAttribute.LastLetterVoiceless))
+
+    # consistent values of SURFACE_ATTRIBUTES. Last vowel is one of four kinds or there is no vowel.
+    SURFACE_ATTRIBUTE_COMBINATIONS: Tuple[int, ...] = tuple(
+        last_letter | vowel | voiceless
+        for last_letter in (0, PhoneticAttribute.LastLetterVowel.mask)
+        for vowel in (0,
+                      PhoneticAttribute.LastVowelFrontal.mask | PhoneticAttribute.LastVowelRounded.mask,
+                      PhoneticAttribute.LastVowelFrontal.mask | PhoneticAttribute.LastVowelUnrounded.mask,
+                      PhoneticAttribute.LastVowelBack.mask | PhoneticAttribute.LastVowelRounded.mask,
+                      PhoneticAttribute.LastVowelBack.mask | PhoneticAttribute.LastVowelUnrounded.mask)
+        for voiceless in (0, PhoneticAttribute.LastLetterVoiceless.mask))
 
     def __init__(self):
         self.attribute_map: Dict[int, str] = {}
-        self.lock = Lock()
-
-    def add_surface(self, attributes: Set[PhoneticAttribute], surface: str):
-        """
-        Method changed. Instead of original, this method uses hash value of concatenated short form of phonetic
-        attributes as key
-        :param attributes:
-        :param surface:
-        :return:
-        """
-        key_string = ""
-        for attribute in attributes:
-            key_string += attribute.get_string_form()
-        with self.lock:
-            self.attribute_map[hash(key_string)] = surface
-
-    def get_surface(self, attributes: Set[PhoneticAttribute]) -> Union[str, None]:
-        """
-        Method changed. Instead of original, this method uses hash value of concatenated short form of phonetic
-        attributes as key
-        :param attributes:
-        :return:
-        """
-        key_string = ""
-        for attribute in attributes:
-            key_string += attribute.get_string_form()
-        return self.attribute_map.get(hash(key_string))
+
+    def add_surface(self, attributes: int, surface: str):
+        self.attribute_map[attributes & AttributeToSurfaceCache.SURFACE_ATTRIBUTES] = surface
+
+    def get_surface(self, attributes: int) -> Union[str, None]:
+        return self.attribute_map.get(attributes & AttributeToSurfaceCache.SURFACE_ATTRIBUTES)
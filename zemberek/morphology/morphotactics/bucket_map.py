@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterator, List, Tuple
+
+
+class BucketMap(Mapping):
+    """
+    A map whose entries are split into dicts (buckets) by the hashes of their keys. Copies share their buckets, a
+    bucket is copied only when it is changed for the first time after copying. So copying a map and changing a few
+    keys costs time proportional to the bucket count and the bucket size, not to the size of the map. Stem
+    transition snapshots use it, they are copied for every lexicon update.
+
+    Buckets are selected with hashes of the current process, so entries are redistributed when a map is unpickled.
+
+    Attributes
+    ----------
+    buckets : List[Dict[Hashable, Any]]
+        entries of the map
+    owned : List[bool]
+        True for buckets that are not shared with a copy and can be changed in place
+    size : int
+        amount of entries
+    """
+
+    DEFAULT_BUCKET_COUNT = 1024
+
+    __slots__ = ("buckets", "owned", "size")
+
+    def __init__(self, bucket_count: int = DEFAULT_BUCKET_COUNT):
+        self.buckets: List[Dict[Hashable, Any]] = [{} for _ in range(bucket_count)]
+        self.owned: List[bool] = [True] * bucket_count
+        self.size = 0
+
+    def __getstate__(self):
+        return len(self.buckets), tuple(self.items())
+
+    def __setstate__(self, state):
+        bucket_count, entries = state
+        self.__init__(bucket_count)
+        buckets = self.buckets
+        for key, value in entries:
+            buckets[hash(key) % bucket_count][key] = value
+        self.size = len(entries)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for bucket in self.buckets:
+            yield from bucket
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.buckets[hash(key) % len(self.buckets)]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self.buckets[hash(key) % len(self.buckets)][key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.buckets[hash(key) % len(self.buckets)].get(key, default)
+
+    def values(self) -> Iterator[Any]:
+        for bucket in self.buckets:
+            yield from bucket.values()
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        for bucket in self.buckets:
+            yield from bucket.items()
+
+    def bucket_for_change(self, key: Hashable) -> Dict[Hashable, Any]:
+        i = hash(key) % len(self.buckets)
+        if not self.owned[i]:
+            self.buckets[i] = dict(self.buckets[i])
+            self.owned[i] = True
+        return self.buckets[i]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        bucket = self.bucket_for_change(key)
+        if key not in bucket:
+            self.size += 1
+        bucket[key] = value
+
+    def pop(self, key: Hashable, *default: Any) -> Any:
+        if key not in self:
+            if len(default) > 0:
+                return default[0]
+            raise KeyError(key)
+        self.size -= 1
+        return self.bucket_for_change(key).pop(key)
+
+    def copy(self) -> 'BucketMap':
+        """
+        :return: a map with the same entries. Buckets are shared by both maps until they are changed
+        """
+        result = BucketMap.__new__(BucketMap)
+        result.buckets = list(self.buckets)
+        result.owned = [False] * len(self.buckets)
+        result.size = self.size
+        # buckets of this map are shared now too.
+        self.owned = [False] * len(self.buckets)
+        return result
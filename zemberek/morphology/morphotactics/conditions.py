@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from abc import ABC
 
 if TYPE_CHECKING:
@@ -13,6 +13,12 @@ from zemberek.morphology.morphotactics.operator import Operator
 
 
 class Conditions(ABC):
+    # relative costs of checking conditions. A phonetic attribute test, a lookup on the stem or the last transitions
+    # and a walk over the transitions of the path.
+    COST_ATTRIBUTE = 0
+    COST_LOOKUP = 1
+    COST_PATH_WALK = 2
+
     HAS_TAIL = None
     HAS_SURFACE = None
     HAS_NO_SURFACE = None
@@ -83,6 +89,51 @@ class Conditions(ABC):
     def last_derivation_is(state) -> 'Conditions.Condition':  # state: MorphemeState
         return Conditions.LastDerivationIs(state)
 
+    @staticmethod
+    def compile_(condition: Optional['Conditions.Condition']) -> Optional['Conditions.Condition']:
+        """
+        Returns a condition equivalent to the given one that is faster to check. AND conditions are flattened, their
+        phonetic attribute tests are merged into bit masks that are checked first and the remaining conditions are
+        ordered by cost. Conditions do not have side effects, so the order does not change the result.
+
+        :param condition: condition to compile, may be None
+        :return: compiled condition
+        """
+        if condition is None:
+            return None
+        if isinstance(condition, Conditions.HasPhoneticAttribute):
+            return Conditions.CompiledCondition(present_mask=condition.mask)
+        if isinstance(condition, Conditions.NotCondition):
+            if isinstance(condition.condition, Conditions.HasPhoneticAttribute):
+                return Conditions.CompiledCondition(absent_mask=condition.condition.mask)
+            return Conditions.NotCondition(Conditions.compile_(condition.condition))
+        if not isinstance(condition, Conditions.CombinedCondition):
+            return condition
+
+        if len(condition.conditions) == 0:
+            return Conditions.CompiledCondition()
+        compiled = [Conditions.compile_(c) for c in condition.conditions]
+        if len(compiled) == 1:
+            return compiled[0]
+        if condition.operator == Operator.OR:
+            result = Conditions.CombinedCondition(Operator.OR, compiled[0], compiled[1])
+            for c in compiled[2:]:
+                result.add_(Operator.OR, c)
+            return result
+
+        absent_mask = 0
+        present_mask = 0
+        checks: List['Conditions.Condition'] = []
+        for c in compiled:
+            if isinstance(c, Conditions.CompiledCondition):
+                absent_mask |= c.absent_mask
+                present_mask |= c.present_mask
+                checks.extend(c.checks)
+            else:
+                checks.append(c)
+        checks.sort(key=lambda c: c.cost())
+        return Conditions.CompiledCondition(absent_mask, present_mask, tuple(checks))
+
     class Condition(ABC):
 
         def not_(self):
@@ -99,6 +150,16 @@ class Conditions(ABC):
 
         def accept_(self, path: SearchPath) -> bool:
             raise NotImplementedError
+
+        def is_local(self) -> bool:
+            """
+            Returns True if the condition depends only on the phonetic attributes and the tail of the path. Result
+            of a local condition does not change with the stem or the previous transitions of the path.
+            """
+            return False
+
+        def cost(self) -> int:
+            return Conditions.COST_PATH_WALK
     
     class AbstractCondition(Condition):
 
@@ -121,9 +182,16 @@ class Conditions(ABC):
         def __init__(self, attribute: PhoneticAttribute):
             super().__init__()
             self.attribute = attribute
+            self.mask = attribute.mask
 
         def accept_(self, visitor: SearchPath) -> bool:
-            return self.attribute in visitor.phonetic_attributes
+            return (visitor.phonetic_attributes & self.mask) != 0
+
+        def is_local(self) -> bool:
+            return True
+
+        def cost(self) -> int:
+            return Conditions.COST_ATTRIBUTE
 
         def __str__(self):
             return "HasPhoneticAttribute{" + self.attribute.name + '}'
@@ -136,6 +204,12 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return not self.condition.accept_(visitor)
 
+        def is_local(self) -> bool:
+            return self.condition.is_local()
+
+        def cost(self) -> int:
+            return self.condition.cost()
+
         def __str__(self):
             return "Not(" + str(self.condition) + ")"
 
@@ -207,6 +281,12 @@ class Conditions(ABC):
                             return True
                     return False
 
+        def is_local(self) -> bool:
+            return all(condition.is_local() for condition in self.conditions)
+
+        def cost(self) -> int:
+            return max((condition.cost() for condition in self.conditions), default=Conditions.COST_ATTRIBUTE)
+
         def __str__(self):
             if len(self.conditions) == 0:
                 return "[No-Condition]"
@@ -228,12 +308,13 @@ class Conditions(ABC):
             self.states = set(states)
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            for sf in reversed(suffixes[1:]):
-                if sf.get_state() in self.states:
+            path = visitor
+            while path.previous is not None:
+                if path.current_state in self.states:
                     return True
-                if sf.get_state().derivative:
+                if path.current_state.derivative:
                     return False
+                path = path.previous
 
             return False
 
@@ -247,6 +328,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.get_dictionary_item() in self.items
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "DictionaryItemIsAny{" + str(self.items) + "}"
 
@@ -257,6 +341,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.get_dictionary_item().has_attribute(self.attribute)
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "HasRootAttribute{" + self.attribute.name + "}"
 
@@ -265,10 +352,11 @@ class Conditions(ABC):
             self.state = state
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            for sf in reversed(suffixes[1:]):
-                if sf.get_state().derivative:
-                    return sf.get_state() == self.state
+            path = visitor
+            while path.previous is not None:
+                if path.current_state.derivative:
+                    return path.current_state == self.state
+                path = path.previous
             return False
 
         def __str__(self):
@@ -279,10 +367,11 @@ class Conditions(ABC):
             self.states = set(states)
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            for sf in reversed(suffixes[1:]):
-                if sf.get_state().derivative:
-                    return sf.get_state() in self.states
+            path = visitor
+            while path.previous is not None:
+                if path.current_state.derivative:
+                    return path.current_state in self.states
+                path = path.previous
             return False
 
         def __str__(self):
@@ -295,6 +384,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.contains_suffix_with_surface_()
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "HasAnySuffixSurface{}"
 
@@ -306,6 +398,9 @@ class Conditions(ABC):
             previous_state = visitor.get_previous_state()
             return previous_state is not None and previous_state.morpheme == self.morpheme
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "PreviousMorphemeIs{" + str(self.morpheme) + "}"
 
@@ -316,6 +411,12 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return len(visitor.tail) != 0
 
+        def is_local(self) -> bool:
+            return True
+
+        def cost(self) -> int:
+            return Conditions.COST_ATTRIBUTE
+
         def __str__(self):
             return "HasTail{}"
 
@@ -324,10 +425,11 @@ class Conditions(ABC):
             self.morphemes = set(morphemes)
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            for suffix in suffixes:
-                if suffix.get_state().morpheme in self.morphemes:
+            path = visitor
+            while path is not None:
+                if path.current_state.morpheme in self.morphemes:
                     return True
+                path = path.previous
             return False
 
         def __str__(self):
@@ -341,6 +443,9 @@ class Conditions(ABC):
             previous_state = visitor.get_previous_state()
             return previous_state is not None and previous_state == self.state
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "PreviousStateIs{" + str(self.state) + "}"
 
@@ -352,6 +457,9 @@ class Conditions(ABC):
             previous_state = visitor.get_previous_state()
             return previous_state is None or not previous_state == self.state
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "PreviousStateIsNot{" + str(self.state) + "}"
 
@@ -363,6 +471,9 @@ class Conditions(ABC):
             previous_state = visitor.get_previous_state()
             return previous_state is not None and previous_state in self.states
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "PreviousStateIsAny{}"
 
@@ -373,6 +484,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.get_stem_transition().surface == self.surface
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "RootSurfaceIs§{" + self.surface + "}"
 
@@ -386,6 +500,9 @@ class Conditions(ABC):
                     return True
             return False
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "RootSurfaceIsAny{" + str(self.surfaces) + "}"
 
@@ -397,6 +514,9 @@ class Conditions(ABC):
             previous_state = visitor.get_previous_state()
             return previous_state is not None and previous_state.morpheme in self.morphemes
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "PreviousMorphemeIsAny{" + str(self.morphemes) + "}"
 
@@ -405,23 +525,21 @@ class Conditions(ABC):
             self.states = states
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            last_index = len(suffixes) - 1
-
-            sf = suffixes[last_index]
-            while not sf.get_state().derivative:
-                if last_index == 0:
+            path = visitor
+            while not path.current_state.derivative:
+                if path.previous is None:
                     return False
-                last_index -= 1
-                sf = suffixes[last_index]
+                path = path.previous
 
-            for i in range(last_index - 1, 0, -1):
-                sf = suffixes[i]
-                if sf.get_state() in self.states:
+            # stem transition is not checked.
+            path = path.previous
+            while path is not None and path.previous is not None:
+                if path.current_state in self.states:
                     return True
 
-                if sf.get_state().derivative:
+                if path.current_state.derivative:
                     return False
+                path = path.previous
 
             return False
 
@@ -435,6 +553,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return self.item is not None and visitor.has_dictionary_item(self.item)
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "DictionaryItemIs{" + str(self.item) + "}"
 
@@ -445,6 +566,9 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.get_dictionary_item() not in self.items
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "DictionaryItemIsNone{" + str(self.items) + "}"
 
@@ -453,20 +577,15 @@ class Conditions(ABC):
             self.morphemes = morphemes
 
         def accept_(self, visitor: SearchPath) -> bool:
-            forms = visitor.transitions
-            if len(forms) < len(self.morphemes):
-                return False
-            else:
-                i = 0
-                j = len(forms) - len(self.morphemes)
-                if i >= len(self.morphemes):
-                    return True
-                while self.morphemes[i] == forms[j].get_morpheme():
-                    i += 1
-                    j += 1
-                    if i >= len(self.morphemes):
-                        return True
+            if visitor.depth < len(self.morphemes):
                 return False
+            # last transitions of the path are compared with the sequence starting from the end.
+            path = visitor
+            for i in range(len(self.morphemes) - 1, -1, -1):
+                if self.morphemes[i] != path.current_state.morpheme:
+                    return False
+                path = path.previous
+            return True
 
         def __str__(self):
             return "HasTailSequence{" + str(self.morphemes) + "}"
@@ -476,12 +595,11 @@ class Conditions(ABC):
             self.morphemes = morphemes
 
         def accept_(self, visitor: SearchPath) -> bool:
-            forms = visitor.transitions
-            if len(forms) < len(self.morphemes):
+            if visitor.depth < len(self.morphemes):
                 return False
             else:
                 m = 0
-                for form in forms:
+                for form in visitor.transitions:
                     if form.get_morpheme() == self.morphemes[m]:
                         m += 1
                         if m == len(self.morphemes):
@@ -498,23 +616,21 @@ class Conditions(ABC):
             self.morphemes = morphemes
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-            last_index = len(suffixes) - 1
-
-            sf = suffixes[last_index]
-            while not sf.get_state().derivative:
-                if last_index == 0:
+            path = visitor
+            while not path.current_state.derivative:
+                if path.previous is None:
                     return False
-                last_index -= 1
-                sf = suffixes[last_index]
+                path = path.previous
 
-            for i in range(last_index - 1, 0, -1):
-                sf = suffixes[i]
-                if sf.get_state().morpheme in self.morphemes:
+            # stem transition is not checked.
+            path = path.previous
+            while path is not None and path.previous is not None:
+                if path.current_state.morpheme in self.morphemes:
                     return True
 
-                if sf.get_state().derivative:
+                if path.current_state.derivative:
                     return False
+                path = path.previous
             return False
 
         def __str__(self):
@@ -525,14 +641,14 @@ class Conditions(ABC):
             pass
 
         def accept_(self, visitor: SearchPath) -> bool:
-            suffixes = visitor.transitions
-
-            for sf in reversed(suffixes[1:]):
-                if sf.get_state().derivative:
+            path = visitor
+            while path.previous is not None:
+                if path.current_state.derivative:
                     return True
 
-                if len(sf.surface) != 0:
+                if len(path.transition.surface) != 0:
                     return False
+                path = path.previous
             return True
 
         def __str__(self):
@@ -545,9 +661,51 @@ class Conditions(ABC):
         def accept_(self, visitor: SearchPath) -> bool:
             return visitor.get_dictionary_item().secondary_pos == self.pos
 
+        def cost(self) -> int:
+            return Conditions.COST_LOOKUP
+
         def __str__(self):
             return "SecondaryPosIs{" + self.pos.name + "}"
 
+    class CompiledCondition(AbstractCondition):
+        """
+        Flat AND condition created by Conditions.compile_.
+
+        Attributes
+        ----------
+        absent_mask : int
+            phonetic attributes that the path must not have
+        present_mask : int
+            phonetic attributes that the path must have, all of them
+        checks : Tuple[Conditions.Condition, ...]
+            other conditions, cheapest first
+        """
+
+        def __init__(self, absent_mask: int = 0, present_mask: int = 0,
+                     checks: Tuple['Conditions.Condition', ...] = ()):
+            self.absent_mask = absent_mask
+            self.present_mask = present_mask
+            self.checks = checks
+
+        def accept_(self, path: SearchPath) -> bool:
+            attributes = path.phonetic_attributes
+            if attributes & self.absent_mask or (attributes & self.present_mask) != self.present_mask:
+                return False
+            for check in self.checks:
+                if not check.accept_(path):
+                    return False
+            return True
+
+        def is_local(self) -> bool:
+            return all(check.is_local() for check in self.checks)
+
+        def cost(self) -> int:
+            return max((check.cost() for check in self.checks), default=Conditions.COST_ATTRIBUTE)
+
+        def __str__(self):
+            return "Compiled{absent=" + bin(self.absent_mask) + ", present=" + bin(self.present_mask) + ", " + \
+                " AND ".join(str(check) for check in self.checks) + "}"
+
 
 Conditions.HAS_TAIL = Conditions.HasTail()
 Conditions.HAS_SURFACE = Conditions.HasAnySuffixSurface()
@@ -50,6 +50,7 @@ class InformalTurkishMorphotactics(TurkishMorphotactics):
 
         # self.make_graph()
         self.add_graph()
+        self.build_surface_tables()
         # self.stem_transitions = StemTransitionsMapBased(lexicon, self)
 
     def add_graph(self):
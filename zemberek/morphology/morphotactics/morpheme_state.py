@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 
-from typing import List, Union,Tuple, TYPE_CHECKING
+from typing import Dict, List, Union,Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zemberek.morphology.morphotactics.morpheme import Morpheme
 
+from zemberek.core.turkish import TurkishAlphabet
+from zemberek.morphology.analysis.surface_transitions import SurfaceTransition
 from zemberek.morphology.morphotactics.conditions import Conditions
 from zemberek.morphology.morphotactics.morpheme_transition import MorphemeTransition
 from zemberek.morphology.morphotactics.suffix_transition import SuffixTransition
@@ -24,6 +26,10 @@ class MorphemeState:
         self.pos_root = pos_root
         self.outgoing: List[Union[SuffixTransition, MorphemeTransition]] = []
         self.incoming: List[Union[SuffixTransition, MorphemeTransition]] = []
+        # outgoing transitions indexed by the first letter of their surfaces, per phonetic attributes. Indexes are
+        # created when they are first used. See `outgoing_for`.
+        self.outgoing_index: Dict[int, Dict[str, Tuple[Tuple[SuffixTransition, str, str], ...]]] = {}
+        self.ascii_outgoing_index: Dict[int, Dict[str, Tuple[Tuple[SuffixTransition, str, str], ...]]] = {}
 
     def __str__(self):
         return "[" + self.id_ + ":" + self.morpheme.id_ + "]"
@@ -39,6 +45,15 @@ class MorphemeState:
     def __hash__(self):
         return hash(self.id_)
 
+    def __reduce__(self):
+        # states are part of a cyclic graph and they are hashed by id. Identity fields are passed to the constructor,
+        # so a state is hashable before its transitions are restored during unpickling. Outgoing indexes are not
+        # serialized, they are created again when needed.
+        state = self.__dict__.copy()
+        state["outgoing_index"] = {}
+        state["ascii_outgoing_index"] = {}
+        return MorphemeState, (self.id_, self.morpheme, self.terminal_, self.derivative, self.pos_root), state
+
     @staticmethod
     def builder(_id: str, morpheme: Morpheme, pos_root: bool = False):
         return MorphemeState.Builder(_id, morpheme, _pos_root=pos_root)
@@ -73,6 +88,50 @@ class MorphemeState:
             SuffixTransition.Builder(from_=self, to=to).build()
         return self
 
+    def outgoing_for(self, phonetic_attributes: int, tail: str, ascii_tolerant: bool = False) -> \
+            Tuple[Tuple[SuffixTransition, str, str], ...]:
+        """
+        Returns outgoing transitions that can match the tail of a path with given phonetic attributes, together
+        with their surfaces. These are the transitions with an empty surface and the ones whose surface starts with
+        the first letter of the tail, in the order of `outgoing`. Transitions rejected by the phonetic attributes
+        are not included. Caller still needs to check the whole surface.
+
+        :param phonetic_attributes: phonetic attributes of the path
+        :param tail: remaining input. It should be folded with `TurkishAlphabet.to_ascii` if ascii_tolerant is True
+        :param ascii_tolerant: if True, surfaces are matched ignoring diacritics
+        :return: transitions, their surfaces and the surfaces to compare with the tail. Last two are the same
+            unless ascii_tolerant is True, then surfaces to compare are folded
+        """
+        indexes = self.ascii_outgoing_index if ascii_tolerant else self.outgoing_index
+        index = indexes.get(phonetic_attributes)
+        if index is None:
+            index = self.index_outgoing(phonetic_attributes, ascii_tolerant)
+            indexes[phonetic_attributes] = index
+        if len(tail) == 0:
+            return index[""]
+        candidates = index.get(tail[0])
+        return index[""] if candidates is None else candidates
+
+    def index_outgoing(self, phonetic_attributes: int, ascii_tolerant: bool) -> \
+            Dict[str, Tuple[Tuple[SuffixTransition, str, str], ...]]:
+        entries = []
+        for transition in self.outgoing:
+            if not transition.rejects(phonetic_attributes):
+                try:
+                    surface = SurfaceTransition.generate_surface(transition, phonetic_attributes)
+                except ValueError:
+                    # template needs a vowel and attributes have none (e.g. abbreviations). Transition cannot
+                    # match any input for these attributes.
+                    continue
+                entries.append((transition, surface,
+                                TurkishAlphabet.INSTANCE.to_ascii(surface) if ascii_tolerant else surface))
+
+        # transitions with empty surfaces match any tail, so they are part of every letter's list.
+        index = {"": tuple(e for e in entries if len(e[2]) == 0)}
+        for letter in set(e[2][0] for e in entries if len(e[2]) > 0):
+            index[letter] = tuple(e for e in entries if len(e[2]) == 0 or e[2][0] == letter)
+        return index
+
     def copy_outgoing_transitions_from(self, state: 'MorphemeState'):
         for transition in state.outgoing:
             copy = transition.get_copy()
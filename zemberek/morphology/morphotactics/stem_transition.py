@@ -1,8 +1,7 @@
 from __future__ import annotations
-from typing import Set, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from zemberek.core.turkish import PhoneticAttribute
     from zemberek.morphology.lexicon import DictionaryItem
     from zemberek.morphology.morphotactics.morpheme_state import MorphemeState
 
@@ -11,8 +10,13 @@ from zemberek.morphology.morphotactics.morpheme_transition import MorphemeTransi
 
 class StemTransition(MorphemeTransition):
 
-    def __init__(self, surface: str, item: DictionaryItem, phonetic_attributes: Set[PhoneticAttribute],
-                 to_state: MorphemeState):
+    def __init__(self, surface: str, item: DictionaryItem, phonetic_attributes: int, to_state: MorphemeState):
+        """
+        :param surface: surface form of the stem
+        :param item: dictionary item of the stem
+        :param phonetic_attributes: PhoneticAttribute bit mask of the stem
+        :param to_state: root state of the stem
+        """
         super().__init__()
         self.surface = surface
         self.item = item
@@ -30,6 +34,13 @@ class StemTransition(MorphemeTransition):
         else:
             return False
 
+    def __getstate__(self):
+        # hashes of strings differ between processes, so a cached hash is not valid in the process that unpickles it.
+        # Unpickled transitions compute their hashes when they are needed.
+        state = self.__dict__.copy()
+        state["cached_hash"] = 0
+        return state
+
     def __hash__(self):
         return self.cached_hash if self.cached_hash != 0 else self.compute_hash()
 
@@ -39,8 +50,7 @@ class StemTransition(MorphemeTransition):
     def compute_hash(self) -> int:
         result = hash(self.surface)
         result = 31 * result + hash(self.item)
-        for a in self.phonetic_attributes:
-            result = 31 * result + hash(a)
+        result = 31 * result + self.phonetic_attributes
         return result
 
     def get_copy(self) -> 'StemTransition':
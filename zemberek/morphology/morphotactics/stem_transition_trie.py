@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zemberek.morphology.morphotactics.stem_transition import StemTransition
+
+
+class StemTransitionTrie:
+    """
+    A radix trie of stem transitions keyed by their surface forms, or by other keys of the same length such as ascii
+    folded surfaces. All stems that are prefixes of an input are found with a single walk over the input, without
+    creating prefix strings.
+
+    Edges are labeled with strings and each node keeps its children by the first character of their labels, so
+    a walk makes one dict lookup for every edge on the path.
+
+    Attributes
+    ----------
+    root : StemTransitionTrie.Node
+        root node. It represents the empty surface
+    """
+
+    def __init__(self):
+        self.root = StemTransitionTrie.Node("")
+
+    def add_(self, transition: StemTransition, key: str = None):
+        surface = transition.surface if key is None else key
+        node = self.root
+        pos = 0
+        while pos < len(surface):
+            child = node.children.get(surface[pos]) if node.children is not None else None
+            if child is None:
+                child = StemTransitionTrie.Node(surface[pos:])
+                node.add_child(child)
+                node = child
+                break
+
+            label = child.label
+            k = 1
+            while k < len(label) and pos + k < len(surface) and label[k] == surface[pos + k]:
+                k += 1
+            if k < len(label):
+                # surface diverges in the middle of the edge, edge is split from that point.
+                middle = StemTransitionTrie.Node(label[:k])
+                child.label = label[k:]
+                middle.add_child(child)
+                node.children[surface[pos]] = middle
+                child = middle
+            node = child
+            pos += k
+
+        if node.transitions is None:
+            node.transitions = [transition]
+        else:
+            node.transitions.append(transition)
+
+    def remove_(self, transition: StemTransition, key: str = None):
+        """
+        Removes the first transition on the node of transition's surface that is equal to it. Nodes are not
+        merged after removal, empty nodes are only harmless extra hops.
+
+        :param transition: transition to remove
+        :param key: key the transition is added with. Default is the surface of the transition
+        """
+        node = self.find_node(transition.surface if key is None else key)
+        if node is None or node.transitions is None:
+            return
+        for i, t in enumerate(node.transitions):
+            if t == transition:
+                del node.transitions[i]
+                break
+        if len(node.transitions) == 0:
+            node.transitions = None
+
+    def copy_path(self, surface: str) -> 'StemTransitionTrie':
+        """
+        Returns a trie that shares all nodes with this one, except the nodes add_ or remove_ of the surface may
+        change. These are copied, so the returned trie can be changed for the surface while this one is still read.
+
+        :param surface: surface that will be added or removed
+        :return: new trie
+        """
+        trie = StemTransitionTrie.__new__(StemTransitionTrie)
+        trie.root = self.root.copy()
+        node = trie.root
+        pos = 0
+        while pos < len(surface) and node.children is not None:
+            child = node.children.get(surface[pos])
+            if child is None:
+                break
+            child = child.copy()
+            node.children[surface[pos]] = child
+            if not surface.startswith(child.label, pos):
+                break
+            pos += len(child.label)
+            node = child
+        return trie
+
+    def find_node(self, surface: str) -> Optional['StemTransitionTrie.Node']:
+        node = self.root
+        pos = 0
+        while pos < len(surface):
+            child = node.children.get(surface[pos]) if node.children is not None else None
+            if child is None or not surface.startswith(child.label, pos):
+                return None
+            pos += len(child.label)
+            node = child
+        return node
+
+    def get_prefix_matches(self, inp: str) -> List[StemTransition]:
+        """
+        Returns transitions of all stems that are a prefix of the input, shorter stems first.
+
+        :param inp: input word
+        :return: matching transitions
+        """
+        matches: List[StemTransition] = []
+        node = self.root
+        pos = 0
+        length = len(inp)
+        while pos < length and node.children is not None:
+            child = node.children.get(inp[pos])
+            if child is None or not inp.startswith(child.label, pos):
+                break
+            pos += len(child.label)
+            if child.transitions is not None:
+                matches.extend(child.transitions)
+            node = child
+        return matches
+
+    class Node:
+        """
+        Attributes
+        ----------
+        label : str
+            label of the edge from the parent node
+        children : Dict[str, StemTransitionTrie.Node]
+            child nodes keyed by the first character of their labels. None if the node has no children
+        transitions : List[StemTransition]
+            transitions whose surface ends at this node. None if there is no such transition
+        """
+
+        def __init__(self, label: str):
+            self.label = label
+            self.children: Optional[Dict[str, 'StemTransitionTrie.Node']] = None
+            self.transitions: Optional[List[StemTransition]] = None
+
+        def copy(self) -> 'StemTransitionTrie.Node':
+            node = StemTransitionTrie.Node(self.label)
+            node.children = None if self.children is None else dict(self.children)
+            node.transitions = None if self.transitions is None else list(self.transitions)
+            return node
+
+        def add_child(self, child: 'StemTransitionTrie.Node'):
+            if self.children is None:
+                self.children = {}
+            self.children[child.label[0]] = child
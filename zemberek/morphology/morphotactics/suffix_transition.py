@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Set
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zemberek.morphology.analysis.search_path import SearchPath
@@ -26,6 +26,8 @@ class SuffixTransition(MorphemeTransition):
             self.conditions_from_template(self.surface_template)
             self.token_list = [item for item in SurfaceTransition.SuffixTemplateTokenizer(self.surface_template)]
             self.condition_count = self.count_conditions()
+            self.local_condition = self.condition is None or self.condition.is_local()
+            self.compile_condition()
             self.surface_cache = AttributeToSurfaceCache()
 
     def __str__(self):
@@ -52,13 +54,38 @@ class SuffixTransition(MorphemeTransition):
         return result
 
     def can_pass(self, path: SearchPath) -> bool:
-        return self.condition is None or self.condition.accept_(path)
+        return self.compiled_condition is None or self.compiled_condition.accept_(path)
+
+    def compile_condition(self):
+        """
+        Compiles the condition of the transition with Conditions.compile_. Phonetic attribute masks of the top level
+        AND condition are also kept in the transition, so `rejects` can be checked before generating the surface.
+        """
+        self.compiled_condition = Conditions.compile_(self.condition)
+        if isinstance(self.compiled_condition, Conditions.CompiledCondition):
+            self.absent_mask = self.compiled_condition.absent_mask
+            self.present_mask = self.compiled_condition.present_mask
+        else:
+            self.absent_mask = 0
+            self.present_mask = 0
+
+    def rejects(self, phonetic_attributes: int) -> bool:
+        """
+        Returns True if the condition fails for any path with given phonetic attributes. False does not mean that
+        the condition passes.
+        """
+        return (phonetic_attributes & self.absent_mask) != 0 or \
+            (phonetic_attributes & self.present_mask) != self.present_mask
 
     def get_copy(self) -> 'SuffixTransition':
         st = SuffixTransition(surface_template=self.surface_template)
         st.from_ = self.from_
         st.to = self.to
         st.condition = self.condition
+        st.local_condition = self.local_condition
+        st.compiled_condition = self.compiled_condition
+        st.absent_mask = self.absent_mask
+        st.present_mask = self.present_mask
         st.token_list = self.token_list.copy()
         st.surface_cache = self.surface_cache
         return st
@@ -91,10 +118,10 @@ class SuffixTransition(MorphemeTransition):
                 else:
                     self.condition = c.and_(self.condition)
 
-    def add_to_surface_cache(self, attributes: Set[PhoneticAttribute], value: str):
+    def add_to_surface_cache(self, attributes: int, value: str):
         self.surface_cache.add_surface(attributes=attributes, surface=value)
 
-    def get_from_surface_cache(self, attributes: Set[PhoneticAttribute]) -> str:
+    def get_from_surface_cache(self, attributes: int) -> str:
         return self.surface_cache.get_surface(attributes=attributes)
 
     def get_last_template_token(self) -> SurfaceTransition.SuffixTemplateToken:
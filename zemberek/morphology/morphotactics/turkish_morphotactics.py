@@ -1,20 +1,23 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
-from typing import Dict, Set, List, Tuple, Union, TYPE_CHECKING
+from threading import Lock
+from typing import Dict, Iterable, Mapping, Optional, Set, List, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zemberek.morphology.lexicon import RootLexicon
 
-from zemberek.core.utils import ReadWriteLock
 from zemberek.core.turkish import PrimaryPos, SecondaryPos, RootAttribute, PhoneticAttribute, TurkishAlphabet
 from zemberek.morphology.analysis.attributes_helper import AttributesHelper
+from zemberek.morphology.analysis.surface_transitions import SurfaceTransition
 from zemberek.morphology.lexicon import DictionaryItem
 from zemberek.morphology.morphotactics.morpheme import Morpheme
 from zemberek.morphology.morphotactics.morpheme_state import MorphemeState
+from zemberek.morphology.morphotactics.attribute_to_surface_cache import AttributeToSurfaceCache
 from zemberek.morphology.morphotactics.conditions import Conditions
 from zemberek.morphology.morphotactics.stem_transition import StemTransition
+from zemberek.morphology.morphotactics.stem_transition_trie import StemTransitionTrie
+from zemberek.morphology.morphotactics.bucket_map import BucketMap
 
 logger = logging.getLogger(__name__)
 
@@ -426,6 +429,7 @@ class TurkishMorphotactics:
         self.item_root_state_map = {}
         self.lexicon = lexicon
         self.make_graph()
+        self.build_surface_tables()
         self.stem_transitions = StemTransitionsMapBased(lexicon, self)
 
     def get_stem_transitions(self) -> StemTransitionsMapBased:
@@ -438,6 +442,33 @@ class TurkishMorphotactics:
         self.morpheme_map[morpheme.id_] = morpheme
         return morpheme
 
+    def get_states(self) -> List[MorphemeState]:
+        return [value for value in self.__dict__.values() if isinstance(value, MorphemeState)]
+
+    def build_surface_tables(self):
+        """
+        Generates the surfaces of all suffix transitions for every consistent combination of the phonetic
+        attributes that surface generation depends on, so no surface is generated during analysis. Transitions with
+        the same template share one table.
+        """
+        tables: Dict[str, AttributeToSurfaceCache] = {}
+        for state in self.get_states():
+            for transition in state.outgoing:
+                table = tables.get(transition.surface_template)
+                if table is not None:
+                    transition.surface_cache = table
+                    continue
+                table = AttributeToSurfaceCache()
+                tables[transition.surface_template] = table
+                transition.surface_cache = table
+                for attributes in AttributeToSurfaceCache.SURFACE_ATTRIBUTE_COMBINATIONS:
+                    try:
+                        SurfaceTransition.generate_surface(transition, attributes)
+                    except ValueError:
+                        # template needs a vowel that attributes do not have. Such paths fail during analysis as
+                        # they did before.
+                        pass
+
     def make_graph(self):
         self.map_special_items_to_root_state()
         self.connect_noun_states()
@@ -1393,11 +1424,11 @@ class TurkishMorphotactics:
         self.verbLastVowelDropUnmodRoot_S.copy_outgoing_transitions_from(self.verbRoot_S)
         self.verbLastVowelDropUnmodRoot_S.remove_transitions_to(self.pass_)
 
-    def get_root_state(self, item: DictionaryItem, phonetic_attributes: Set[PhoneticAttribute]) -> MorphemeState:
+    def get_root_state(self, item: DictionaryItem, phonetic_attributes: int) -> MorphemeState:
         root: MorphemeState = self.item_root_state_map.get(item.id_)
         if root is not None:
             return root
-        elif PhoneticAttribute.LastLetterDropped in phonetic_attributes:
+        elif phonetic_attributes & PhoneticAttribute.LastLetterDropped.mask:
             return self.verbRoot_VowelDrop_S
         elif item.has_attribute(RootAttribute.Reciprocal):
             return self.vImplicitRecipRoot_S
@@ -1480,7 +1511,7 @@ class StemTransitionsBase:
         elif self.has_modifier_attribute(item):
             return self.generate_modified_root_nodes(item)
         else:
-            phonetic_attributes: Set[PhoneticAttribute] = self.calculate_attributes(item.pronunciation)
+            phonetic_attributes: int = self.calculate_attributes(item.pronunciation)
             transition = StemTransition(item.root, item, phonetic_attributes,
                                         self.morphotactics.get_root_state(item, phonetic_attributes))
             return (transition,)
@@ -1491,14 +1522,14 @@ class StemTransitionsBase:
         return False
 
     @staticmethod
-    def calculate_attributes(input_: str) -> Set[PhoneticAttribute]:
+    def calculate_attributes(input_: str) -> int:
         return AttributesHelper.get_morphemic_attributes(input_)
 
     def generate_modified_root_nodes(self, dic_item: DictionaryItem) -> Tuple[StemTransition, ...]:
 
         modified_seq = dic_item.pronunciation
         original_attrs = self.calculate_attributes(dic_item.pronunciation)
-        modified_attrs = deepcopy(original_attrs)
+        modified_attrs = original_attrs
         modified_root_state = None  # MorphemeState
         unmodified_root_state = None  # MorphemeState
 
@@ -1513,47 +1544,34 @@ class StemTransitionsBase:
                     voiced = 'g'
 
                 modified_seq = modified_seq[: -1] + voiced
-                try:
-                    modified_attrs.remove(PhoneticAttribute.LastLetterVoicelessStop)
-                except KeyError as ke:
-                    logger.debug("Key error in modified_attrs in Voicing branch: " + str(ke))
-                original_attrs.add(PhoneticAttribute.ExpectsConsonant)
-                modified_attrs.add(PhoneticAttribute.ExpectsVowel)
-                modified_attrs.add(PhoneticAttribute.CannotTerminate)
+                modified_attrs &= ~PhoneticAttribute.LastLetterVoicelessStop.mask
+                original_attrs |= PhoneticAttribute.ExpectsConsonant.mask
+                modified_attrs |= PhoneticAttribute.ExpectsVowel.mask | PhoneticAttribute.CannotTerminate.mask
             elif attribute == RootAttribute.Doubling:
                 modified_seq = modified_seq + self.alphabet.last_char(modified_seq)
-                original_attrs.add(PhoneticAttribute.ExpectsConsonant)
-                modified_attrs.add(PhoneticAttribute.ExpectsVowel)
-                modified_attrs.add(PhoneticAttribute.CannotTerminate)
+                original_attrs |= PhoneticAttribute.ExpectsConsonant.mask
+                modified_attrs |= PhoneticAttribute.ExpectsVowel.mask | PhoneticAttribute.CannotTerminate.mask
 
             elif attribute == RootAttribute.LastVowelDrop:
                 last_letter = self.alphabet.get_last_letter(modified_seq)
                 if last_letter.is_vowel():
                     modified_seq = modified_seq[:-1]
-                    modified_attrs.add(PhoneticAttribute.ExpectsConsonant)
-                    modified_attrs.add(PhoneticAttribute.CannotTerminate)
+                    modified_attrs |= PhoneticAttribute.ExpectsConsonant.mask | PhoneticAttribute.CannotTerminate.mask
                 else:
                     modified_seq = modified_seq[: -2] + modified_seq[-1:]
                     if dic_item.primary_pos != PrimaryPos.Verb:
-                        original_attrs.add(PhoneticAttribute.ExpectsConsonant)
+                        original_attrs |= PhoneticAttribute.ExpectsConsonant.mask
                     else:
                         unmodified_root_state = self.morphotactics.verbLastVowelDropUnmodRoot_S
                         modified_root_state = self.morphotactics.verbLastVowelDropModRoot_S
 
-                    modified_attrs.add(PhoneticAttribute.ExpectsVowel)
-                    modified_attrs.add(PhoneticAttribute.CannotTerminate)
+                    modified_attrs |= PhoneticAttribute.ExpectsVowel.mask | PhoneticAttribute.CannotTerminate.mask
 
             elif attribute == RootAttribute.InverseHarmony:
-                original_attrs.add(PhoneticAttribute.LastVowelFrontal)
-                modified_attrs.add(PhoneticAttribute.LastVowelFrontal)
-                try:
-                    original_attrs.remove(PhoneticAttribute.LastVowelBack)
-                except KeyError as ke:
-                    logger.debug("Non existent key original_attrs: " + str(ke))
-                try:
-                    modified_attrs.remove(PhoneticAttribute.LastVowelBack)
-                except KeyError as ke:
-                    logger.debug("Non existent key modified_attrs: " + str(ke))
+                original_attrs = (original_attrs | PhoneticAttribute.LastVowelFrontal.mask) & \
+                    ~PhoneticAttribute.LastVowelBack.mask
+                modified_attrs = (modified_attrs | PhoneticAttribute.LastVowelFrontal.mask) & \
+                    ~PhoneticAttribute.LastVowelBack.mask
 
             elif attribute == RootAttribute.ProgressiveVowelDrop:
                 if len(modified_seq) > 1:
@@ -1561,7 +1579,7 @@ class StemTransitionsBase:
                     if self.alphabet.contains_vowel(modified_seq):
                         modified_attrs = self.calculate_attributes(modified_seq)
 
-                    modified_attrs.add(PhoneticAttribute.LastLetterDropped)
+                    modified_attrs |= PhoneticAttribute.LastLetterDropped.mask
 
         if unmodified_root_state is None:
             unmodified_root_state = self.morphotactics.get_root_state(dic_item, original_attrs)
@@ -1595,20 +1613,15 @@ class StemTransitionsBase:
                 raise Exception("No root morpheme state found for " + item.id_)
 
             m = item.root[:-1]
-            modified = StemTransition(m, item, self.calculate_attributes(m), root_for_modified)
-            modified.phonetic_attributes.add(PhoneticAttribute.ExpectsConsonant)
-            modified.phonetic_attributes.add(PhoneticAttribute.CannotTerminate)
+            modified = StemTransition(m, item, self.calculate_attributes(m) | PhoneticAttribute.ExpectsConsonant.mask |
+                                      PhoneticAttribute.CannotTerminate.mask, root_for_modified)
             return original, modified
         elif id_ == "ben_Pron_Pers" or id_ == "sen_Pron_Pers":
-            original = StemTransition(item.root, item, original_attrs, unmodified_root_state)
-            if item.lemma == "ben":
-                modified = StemTransition("ban", item, self.calculate_attributes("ban"),
-                                          self.morphotactics.pronPers_Mod_S)
-            else:
-                modified = StemTransition("san", item, self.calculate_attributes("san"),
-                                          self.morphotactics.pronPers_Mod_S)
-            original.phonetic_attributes.add(PhoneticAttribute.UnModifiedPronoun)
-            modified.phonetic_attributes.add(PhoneticAttribute.ModifiedPronoun)
+            original = StemTransition(item.root, item, original_attrs | PhoneticAttribute.UnModifiedPronoun.mask,
+                                      unmodified_root_state)
+            modified_surface = "ban" if item.lemma == "ben" else "san"
+            modified = StemTransition(modified_surface, item, self.calculate_attributes(modified_surface) |
+                                      PhoneticAttribute.ModifiedPronoun.mask, self.morphotactics.pronPers_Mod_S)
             return original, modified
         elif id_ == "demek_Verb" or id_ == "yemek_Verb":
             original = StemTransition(item.root, item, original_attrs, self.morphotactics.vDeYeRoot_S)
@@ -1625,22 +1638,19 @@ class StemTransitionsBase:
             return (original,)
         elif id_ == "birbiri_Pron_Quant" or id_ == "çoğu_Pron_Quant" or id_ == "öbürü_Pron_Quant" or \
                 id_ == "birçoğu_Pron_Quant":
-            original = StemTransition(item.root, item, original_attrs, self.morphotactics.pronQuant_S)
+            original = StemTransition(item.root, item, original_attrs | PhoneticAttribute.UnModifiedPronoun.mask,
+                                      self.morphotactics.pronQuant_S)
 
             if item.lemma == "birbiri":
-                modified = StemTransition("birbir", item, self.calculate_attributes("birbir"),
-                                          self.morphotactics.pronQuantModified_S)
+                modified_surface = "birbir"
             elif item.lemma == "çoğu":
-                modified = StemTransition("çok", item, self.calculate_attributes("çok"),
-                                          self.morphotactics.pronQuantModified_S)
+                modified_surface = "çok"
             elif item.lemma == "öbürü":
-                modified = StemTransition("öbür", item, self.calculate_attributes("öbür"),
-                                          self.morphotactics.pronQuantModified_S)
+                modified_surface = "öbür"
             else:
-                modified = StemTransition("birçok", item, self.calculate_attributes("birçok"),
-                                          self.morphotactics.pronQuantModified_S)
-            original.phonetic_attributes.add(PhoneticAttribute.UnModifiedPronoun)
-            modified.phonetic_attributes.add(PhoneticAttribute.ModifiedPronoun)
+                modified_surface = "birçok"
+            modified = StemTransition(modified_surface, item, self.calculate_attributes(modified_surface) |
+                                      PhoneticAttribute.ModifiedPronoun.mask, self.morphotactics.pronQuantModified_S)
             return original, modified
         else:
             raise Exception("Lexicon Item with special stem change cannot be handled:" + item.id_)
@@ -1650,173 +1660,302 @@ class StemTransitionsBase:
 # with TurkishMorphotactics class and due to the restrictions of Python on circular imports
 # we needed to move it here
 class StemTransitionsMapBased(StemTransitionsBase):
+    """
+    Stem transitions of a lexicon, keyed by surface forms.
+
+    Maps are never modified after they are published. Adding or removing items copies the maps, changes the copy
+    and replaces `stems` with it, so reads do not need a lock and always see a consistent state. Writers are
+    serialized with `write_lock`. Maps are BucketMaps and the trie is copied path by path, so an update copies only
+    the parts it changes, not the whole lexicon.
+
+    Attributes
+    ----------
+    stems : StemTransitionsMapBased.Stems
+        current snapshot of the stem maps
+    """
 
     def __init__(self, lexicon: RootLexicon, morphotactics: TurkishMorphotactics):
         super().__init__(morphotactics)
         self.lexicon = lexicon
         self.morphotactics = morphotactics
-        self.multi_stems: Dict[str, List[StemTransition]] = dict()
-        self.single_stems: Dict[str, StemTransition] = dict()
-        self.different_stem_items: Dict[DictionaryItem, List[StemTransition]] = dict()
+        self.write_lock = Lock()
 
-        self.ascii_keys = None  # MultiMap <String, String>
+        # snapshot is not visible to readers yet, so it is filled in place.
+        stems = StemTransitionsMapBased.Stems(BucketMap(), BucketMap(), BucketMap(), StemTransitionTrie(), None)
+        for item in lexicon:
+            self.add_to(stems, item)
+        self.stems = stems
 
-        self.lock = ReadWriteLock()
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["write_lock"]
+        return state
 
-        for item in lexicon:
-            self.add_dictionary_item(item)
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.write_lock = Lock()
 
-    def add_dictionary_item(self, item: DictionaryItem):
-        self.lock.acquire_write()
+    @property
+    def single_stems(self) -> Mapping[str, StemTransition]:
+        return self.stems.single_stems
+
+    @property
+    def multi_stems(self) -> Mapping[str, List[StemTransition]]:
+        return self.stems.multi_stems
+
+    @property
+    def different_stem_items(self) -> Mapping[DictionaryItem, List[StemTransition]]:
+        return self.stems.different_stem_items
+
+    @property
+    def stem_trie(self) -> StemTransitionTrie:
+        return self.stems.stem_trie
+
+    @property
+    def ascii_trie(self) -> Optional[StemTransitionTrie]:
+        return self.stems.ascii_trie
 
+    def add_dictionary_item(self, item: DictionaryItem):
+        """
+        Adds stem transitions of an item. Every call copies and publishes the changed parts of the maps, use
+        `add_dictionary_items` to add many items at once.
+
+        :param item: dictionary item to add
+        """
+        self.add_dictionary_items((item,))
+
+    def add_dictionary_items(self, items: Iterable[DictionaryItem]):
+        """
+        Adds stem transitions of given items. Maps are copied and published once for all items, readers see either
+        none or all of them.
+
+        :param items: dictionary items to add
+        """
+        with self.write_lock:
+            stems = self.stems.copy()
+            for item in items:
+                self.add_to(stems, item)
+            self.stems = stems
+
+    def add_to(self, stems: 'StemTransitionsMapBased.Stems', item: DictionaryItem):
         try:
             transitions: Tuple[StemTransition] = self.generate(item)
             for transition in transitions:
-                self.add_stem_transition(transition)
+                stems.add_stem_transition(transition)
 
             if len(transitions) > 1 or (len(transitions) == 1 and transitions[0].surface != item.root):
-                if item in self.different_stem_items.keys():
-                    self.different_stem_items[item].extend(transitions)
+                if item in stems.different_stem_items:
+                    stems.different_stem_items[item] = stems.different_stem_items[item] + list(transitions)
                 else:
-                    self.different_stem_items[item] = list(transitions)
+                    stems.different_stem_items[item] = list(transitions)
         except ValueError:
-            logger.debug('Cannot generate stem transition for %s: '.format(item.id_))
-        finally:
-            self.lock.release_write()
+            logger.debug(f"Cannot generate stem transition for {item.id_}")
+
+    def remove_dictionary_item(self, item: DictionaryItem):
+        """
+        Removes stem transitions of an item. Like `add_dictionary_item`, use `remove_dictionary_items` for many items.
+
+        :param item: dictionary item to remove
+        """
+        self.remove_dictionary_items((item,))
+
+    def remove_dictionary_items(self, items: Iterable[DictionaryItem]):
+        """
+        Removes stem transitions of given items. Like `add_dictionary_items`, maps are copied and published once.
 
-    def remove_dictionary_item(self, item):
-        self.lock.acquire_write()
+        :param items: dictionary items to remove
+        """
+        with self.write_lock:
+            stems = self.stems.copy()
+            for item in items:
+                self.remove_from(stems, item)
+            self.stems = stems
 
+    def remove_from(self, stems: 'StemTransitionsMapBased.Stems', item: DictionaryItem):
         try:
             transitions: Tuple[StemTransition] = self.generate(item)
             for transition in transitions:
-                self.remove_stem_node(transition)
+                stems.remove_stem_node(transition)
 
-            if item in self.different_stem_items.keys():
-                self.different_stem_items.pop(item)
+            if item in stems.different_stem_items:
+                stems.different_stem_items.pop(item)
         except ValueError as e:
             logger.warning("Cannot remove" + str(e))
-        finally:
-            self.lock.release_write()
-
-    def remove_stem_node(self, stem_transition: StemTransition):
-        surface_form = stem_transition.surface
-        if surface_form in self.multi_stems.keys():
-            self.multi_stems[surface_form].remove(stem_transition)
-        elif surface_form in self.single_stems.keys() and self.single_stems.get(
-                surface_form).item == stem_transition.item:
-            self.single_stems.pop(surface_form)
-
-        # BURADA HATA OLABILIR DIKKAT ET
-        # THERE WAS A NEGATION THAT NEGATES WHOLE IF STATEMENT BELOW, CHECK RESULTS
-        if not (stem_transition.item in self.different_stem_items.keys() and stem_transition in
-                self.different_stem_items[stem_transition.item]):
-            try:
-                self.different_stem_items[stem_transition.item].remove(stem_transition)
-            except KeyError:
-                logger.debug(f"Hata: {str(stem_transition.item)}")
-
-    def add_stem_transition(self, stem_transition: StemTransition):
-        surface_form = stem_transition.surface
-        if surface_form in self.multi_stems.keys():
-            self.multi_stems[surface_form].append(stem_transition)
-        elif surface_form in self.single_stems.keys():
-            self.multi_stems[surface_form] = [self.single_stems[surface_form], stem_transition]
-            self.single_stems.pop(surface_form)
-        else:
-            self.single_stems[surface_form] = stem_transition
 
     def get_transitions(self, stem: str = None) -> Union[Set[StemTransition], Tuple[StemTransition, ...]]:
+        stems = self.stems
         if not stem:
-            result = set(self.single_stems.values())
-            for value in self.multi_stems.values():
+            result = set(stems.single_stems.values())
+            for value in stems.multi_stems.values():
                 result |= set(value)
             return result
         else:
-            self.lock.acquire_read()
-            try:
-                if stem in self.single_stems.keys():
-                    return (self.single_stems[stem],)
-
-                if stem in self.multi_stems.keys():
-                    return tuple(self.multi_stems[stem])
+            if stem in stems.single_stems:
+                return (stems.single_stems[stem],)
 
-            finally:
-                self.lock.release_read()
+            if stem in stems.multi_stems:
+                return tuple(stems.multi_stems[stem])
 
             return ()
 
     def get_transitions_for_item(self, item: DictionaryItem) -> Tuple[StemTransition]:
-        self.lock.acquire_read()
-        try:
-            if item in self.different_stem_items.keys():
-                return tuple(self.different_stem_items[item])
-            else:
-                transitions: Tuple[StemTransition] = self.get_transitions(item.root)
-                return tuple(s for s in transitions if s.item == item)
-        finally:
-            self.lock.release_read()
-
-    def get_transitions_ascii_tolerant(self, stem: str) -> Set[StemTransition]:
-        self.lock.acquire_read()
-        try:
-            result: Set[StemTransition] = set()
-            if stem in self.single_stems.keys():
-                result.add(self.single_stems[stem])
-            elif stem in self.multi_stems.keys():
-                result |= set(self.multi_stems[stem])
-
-            ascii_stems: Set[str] = set(self.ascii_keys.get(TurkishAlphabet.INSTANCE.to_ascii(stem), []))
-            for st in ascii_stems:
-                if st in self.single_stems.keys():
-                    result.add(self.single_stems[st])
-                elif st in self.multi_stems.keys():
-                    result |= set(self.multi_stems[st])
-            return result
-        finally:
-            self.lock.release_read()
+        stems = self.stems
+        if item in stems.different_stem_items:
+            return tuple(stems.different_stem_items[item])
+        else:
+            transitions: Tuple[StemTransition] = stems.get_transitions(item.root)
+            return tuple(s for s in transitions if s.item == item)
 
-    def get_prefix_matches(self, inp: str, ascii_tolerant: bool) -> Tuple[StemTransition]:
-        if self.ascii_keys is None and ascii_tolerant:
+    def get_transitions_ascii_tolerant(self, stem: str) -> Tuple[StemTransition, ...]:
+        if self.ascii_trie is None:
             self.generate_ascii_tolerant_map()
+        return self.stems.get_transitions_ascii_tolerant(stem)
 
-        self.lock.acquire_read()
-
-        try:
-            matches: List[StemTransition] = []
+    def get_prefix_matches(self, inp: str, ascii_tolerant: bool) -> Tuple[StemTransition]:
+        """
+        Returns transitions of all stems that are a prefix of the input, shorter stems first.
 
-            for i in range(1, len(inp) + 1):
-                stem = inp[0:i]
-                if ascii_tolerant:
-                    matches.extend(self.get_transitions_ascii_tolerant(stem))
-                else:
-                    matches.extend(self.get_transitions(stem=stem))
+        :param inp: input word
+        :param ascii_tolerant: if True, stems are matched ignoring diacritics, using ascii folded surfaces
+        :return: matching transitions
+        """
+        if not ascii_tolerant:
+            return tuple(self.stems.stem_trie.get_prefix_matches(inp))
 
-            return tuple(matches)
-        finally:
-            self.lock.release_read()
+        if self.ascii_trie is None:
+            self.generate_ascii_tolerant_map()
+        return tuple(self.stems.ascii_trie.get_prefix_matches(TurkishAlphabet.INSTANCE.to_ascii(inp)))
 
     def generate_ascii_tolerant_map(self):
-        self.lock.acquire_write()
-        self.ascii_keys: Dict[str, List[str]] = {}
+        """
+        Creates the trie of stems keyed by their ascii folded surfaces, used for ascii tolerant analysis. It is kept
+        up to date by later additions and removals.
+        """
+        with self.write_lock:
+            if self.stems.ascii_trie is not None:
+                return
+            stems = self.stems.copy()
+            ascii_trie = StemTransitionTrie()
+            for transition in stems.single_stems.values():
+                ascii_trie.add_(transition, TurkishAlphabet.INSTANCE.to_ascii(transition.surface))
+            for transitions in stems.multi_stems.values():
+                for transition in transitions:
+                    ascii_trie.add_(transition, TurkishAlphabet.INSTANCE.to_ascii(transition.surface))
+            stems.ascii_trie = ascii_trie
+            self.stems = stems
+
+    class Stems:
+        """
+        A snapshot of stem maps. Lists in the maps are replaced instead of being modified, so a copy only needs to
+        copy the maps, and maps of a copy share their buckets until they are changed. Trie of a copy is shared too,
+        only the nodes on the path of a changed surface are copied.
+
+        Attributes
+        ----------
+        single_stems : BucketMap
+            surfaces that belong to a single transition
+        multi_stems : BucketMap
+            surfaces that belong to more than one transition
+        different_stem_items : BucketMap
+            transitions of items whose stems are different from their roots
+        stem_trie : StemTransitionTrie
+            all transitions, for finding stems that are prefixes of an input
+        ascii_trie : StemTransitionTrie
+            all transitions keyed by their ascii folded surfaces. None until it is generated for ascii tolerant
+            analysis
+        shared_trie : bool
+            True if tries may be read by other snapshots. Then nodes are copied before they are changed
+        """
+
+        __slots__ = ("single_stems", "multi_stems", "different_stem_items", "stem_trie", "ascii_trie",
+                     "shared_trie")
+
+        def __init__(self, single_stems: BucketMap, multi_stems: BucketMap, different_stem_items: BucketMap,
+                     stem_trie: StemTransitionTrie, ascii_trie: Optional[StemTransitionTrie],
+                     shared_trie: bool = False):
+            self.single_stems = single_stems
+            self.multi_stems = multi_stems
+            self.different_stem_items = different_stem_items
+            self.stem_trie = stem_trie
+            self.ascii_trie = ascii_trie
+            self.shared_trie = shared_trie
+
+        def __getstate__(self):
+            return tuple(getattr(self, name) for name in self.__slots__)
+
+        def __setstate__(self, state):
+            for name, value in zip(self.__slots__, state):
+                setattr(self, name, value)
+
+        def copy(self) -> 'StemTransitionsMapBased.Stems':
+            return StemTransitionsMapBased.Stems(self.single_stems.copy(), self.multi_stems.copy(),
+                                                 self.different_stem_items.copy(), self.stem_trie, self.ascii_trie,
+                                                 shared_trie=True)
+
+        def trie_for_change(self, surface: str) -> StemTransitionTrie:
+            if self.shared_trie:
+                self.stem_trie = self.stem_trie.copy_path(surface)
+            return self.stem_trie
+
+        def ascii_trie_for_change(self, key: str) -> Optional[StemTransitionTrie]:
+            if self.ascii_trie is not None and self.shared_trie:
+                self.ascii_trie = self.ascii_trie.copy_path(key)
+            return self.ascii_trie
+
+        def add_to_tries(self, stem_transition: StemTransition):
+            self.trie_for_change(stem_transition.surface).add_(stem_transition)
+            key = TurkishAlphabet.INSTANCE.to_ascii(stem_transition.surface)
+            ascii_trie = self.ascii_trie_for_change(key)
+            if ascii_trie is not None:
+                ascii_trie.add_(stem_transition, key)
+
+        def remove_from_tries(self, stem_transition: StemTransition):
+            self.trie_for_change(stem_transition.surface).remove_(stem_transition)
+            key = TurkishAlphabet.INSTANCE.to_ascii(stem_transition.surface)
+            ascii_trie = self.ascii_trie_for_change(key)
+            if ascii_trie is not None:
+                ascii_trie.remove_(stem_transition, key)
+
+        def add_stem_transition(self, stem_transition: StemTransition):
+            surface_form = stem_transition.surface
+            if surface_form in self.multi_stems:
+                self.multi_stems[surface_form] = self.multi_stems[surface_form] + [stem_transition]
+            elif surface_form in self.single_stems:
+                self.multi_stems[surface_form] = [self.single_stems[surface_form], stem_transition]
+                self.single_stems.pop(surface_form)
+            else:
+                self.single_stems[surface_form] = stem_transition
+            self.add_to_tries(stem_transition)
+
+        def remove_stem_node(self, stem_transition: StemTransition):
+            surface_form = stem_transition.surface
+            if surface_form in self.multi_stems:
+                transitions = list(self.multi_stems[surface_form])
+                transitions.remove(stem_transition)
+                self.multi_stems[surface_form] = transitions
+                self.remove_from_tries(stem_transition)
+            elif surface_form in self.single_stems and self.single_stems.get(
+                    surface_form).item == stem_transition.item:
+                self.remove_from_tries(self.single_stems.pop(surface_form))
+
+            # BURADA HATA OLABILIR DIKKAT ET
+            # THERE WAS A NEGATION THAT NEGATES WHOLE IF STATEMENT BELOW, CHECK RESULTS
+            if not (stem_transition.item in self.different_stem_items and stem_transition in
+                    self.different_stem_items[stem_transition.item]):
+                try:
+                    transitions = list(self.different_stem_items[stem_transition.item])
+                    transitions.remove(stem_transition)
+                    self.different_stem_items[stem_transition.item] = transitions
+                except KeyError:
+                    logger.debug(f"Hata: {str(stem_transition.item)}")
+
+        def get_transitions(self, stem: str) -> Tuple[StemTransition, ...]:
+            if stem in self.single_stems:
+                return (self.single_stems[stem],)
+            if stem in self.multi_stems:
+                return tuple(self.multi_stems[stem])
+            return ()
 
-        try:
-            for s in self.single_stems.keys():
-                ascii_ = TurkishAlphabet.INSTANCE.to_ascii(s)
-                if TurkishAlphabet.INSTANCE.contains_ascii_related(s):
-                    if ascii_ not in self.ascii_keys.keys():
-                        self.ascii_keys[ascii_] = [s]
-                    else:
-                        self.ascii_keys[ascii_].append(s)
-
-            for sts in self.multi_stems.values():
-                for st in sts:
-                    s = st.surface
-                    ascii_ = TurkishAlphabet.INSTANCE.to_ascii(s)
-                    if TurkishAlphabet.INSTANCE.contains_ascii_related(s):
-                        if ascii_ in self.ascii_keys.keys():
-                            self.ascii_keys[ascii_].append(s)
-                        else:
-                            self.ascii_keys[ascii_] = [s]
-        finally:
-            self.lock.release_write()
+        def get_transitions_ascii_tolerant(self, stem: str) -> Tuple[StemTransition, ...]:
+            node = self.ascii_trie.find_node(TurkishAlphabet.INSTANCE.to_ascii(stem))
+            return () if node is None or node.transitions is None else tuple(node.transitions)
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import gc
 import time
 import logging
-import os
+import pickle
+import re
+import sys
 
-from typing import Tuple, TYPE_CHECKING, List, Optional
-from functools import lru_cache
-from pkg_resources import resource_filename
+from threading import Lock
+from typing import Tuple, TYPE_CHECKING, List, Optional, Iterable, Dict, Union
 
 if TYPE_CHECKING:
-    from zemberek.tokenization.token import Token
     from zemberek.morphology.analysis.single_analysis import SingleAnalysis
     from zemberek.morphology.ambiguity.ambiguity_resolver import AmbiguityResolver
 
 from zemberek.tokenization import TurkishTokenizer
+from zemberek.tokenization.token import Token
 from zemberek.core.turkish import TurkishAlphabet, StemAndEnding, PrimaryPos
 from zemberek.core.text import TextUtil
+from zemberek.morphology.analysis.analysis_cache import AnalysisCache
+from zemberek.morphology.analysis.full_form_table import FullFormTable
+from zemberek.morphology.analysis.lemma_analysis import LemmaAnalysis
 from zemberek.morphology.analysis.word_analysis import WordAnalysis
 from zemberek.morphology.analysis.sentence_analysis import SentenceAnalysis
 from zemberek.morphology.analysis.rule_based_analyzer import RuleBasedAnalyzer
@@ -24,11 +29,27 @@ from zemberek.morphology.generator import WordGenerator
 from zemberek.morphology.lexicon import RootLexicon
 from zemberek.morphology.morphotactics import TurkishMorphotactics, InformalTurkishMorphotactics
 from zemberek.morphology.ambiguity.perceptron_ambiguity_resolver import PerceptronAmbiguityResolver
+from zemberek.core.utils import resource_path
 
 logger = logging.getLogger(__name__)
 
 
 class TurkishMorphology:
+    """
+    Main entry point for morphological analysis.
+
+    Ambiguity resolver, word generator and unidentified token analyzer are only needed by some operations, so they
+    are created when they are first used. Builder can disable them completely.
+    """
+
+    SNAPSHOT_FORMAT = "zemberek-morphology-snapshot"
+    SNAPSHOT_VERSION = 2
+    SNAPSHOT_RECURSION_LIMIT = 10000
+
+    # words made of Turkish letters only are always a single Word token, unless all letters are Roman numeral
+    # letters. Such words do not need the lexer.
+    PLAIN_WORD_PATTERN = re.compile(f"[{TurkishAlphabet.INSTANCE.all_letters}]+")
+    ROMAN_NUMERAL_PATTERN = re.compile("[IVXLCDM]+")
 
     def __init__(self, builder: 'TurkishMorphology.Builder'):
         self.lexicon = builder.lexicon
@@ -36,21 +57,85 @@ class TurkishMorphology:
             else TurkishMorphotactics(self.lexicon)
         self.analyzer = RuleBasedAnalyzer.ignore_diacritics_instance(self.morphotactics) if \
             builder.ignore_diacritics_in_analysis else RuleBasedAnalyzer.instance(self.morphotactics)
-        self.unidentified_token_analyzer = UnidentifiedTokenAnalyzer(self.analyzer)
+        if builder.search_limits is not None:
+            self.analyzer.set_search_limits(builder.search_limits)
+        if builder.ignore_diacritics_in_analysis:
+            # ascii folded stem index is created now instead of on the first analysis.
+            self.morphotactics.stem_transitions.generate_ascii_tolerant_map()
+        table = builder.full_form_table
+        if table is not None and (table.informal != builder.informal_analysis or
+                                  table.ignore_diacritics != builder.ignore_diacritics_in_analysis):
+            raise ValueError(f"Full form table is created for informal={table.informal}, "
+                             f"ignore_diacritics={table.ignore_diacritics}. But morphology is created for "
+                             f"informal={builder.informal_analysis}, "
+                             f"ignore_diacritics={builder.ignore_diacritics_in_analysis}")
+        self.full_form_table: Optional[FullFormTable] = table
         self.tokenizer = builder.tokenizer
-        self.word_generator = WordGenerator(self.morphotactics)
 
         self.use_unidentified_token_analyzer = builder.use_unidentifiedTokenAnalyzer
+        self.use_word_generator = builder.use_word_generator
+        self.use_ambiguity_resolver = builder.use_ambiguity_resolver
+        self.component_lock = Lock()
+        self._unidentified_token_analyzer: Optional[UnidentifiedTokenAnalyzer] = None
+        self._word_generator: Optional[WordGenerator] = None
+        self._ambiguity_resolver: Optional['AmbiguityResolver'] = builder.ambiguity_resolver
 
-        if builder.ambiguity_resolver is None:
-            resource_path = resource_filename("zemberek", os.path.join("resources", "ambiguity", "model-compressed"))
-            try:
-                self.ambiguity_resolver = PerceptronAmbiguityResolver.from_resource(resource_path)
-            except IOError as e:
-                logger.error(e)
-                raise RuntimeError(f"Cannot initialize PerceptronAmbiguityResolver from resource {resource_path}")
+        if builder.cache is not None:
+            self.cache: Optional[AnalysisCache] = builder.cache
+        elif builder.use_cache:
+            self.cache = AnalysisCache(builder.cache_size, builder.cache_eviction_policy)
         else:
-            self.ambiguity_resolver = builder.ambiguity_resolver
+            self.cache = None
+        self.lemma_cache: Optional[AnalysisCache] = None if builder.lemma_cache_size is None else \
+            AnalysisCache(builder.lemma_cache_size)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["component_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.component_lock = Lock()
+
+    @property
+    def unidentified_token_analyzer(self) -> UnidentifiedTokenAnalyzer:
+        if self._unidentified_token_analyzer is None:
+            if not self.use_unidentified_token_analyzer:
+                raise RuntimeError("Unidentified token analyzer is disabled for this TurkishMorphology instance")
+            with self.component_lock:
+                if self._unidentified_token_analyzer is None:
+                    self._unidentified_token_analyzer = UnidentifiedTokenAnalyzer(self.analyzer)
+        return self._unidentified_token_analyzer
+
+    @property
+    def word_generator(self) -> WordGenerator:
+        if self._word_generator is None:
+            if not self.use_word_generator:
+                raise RuntimeError("Word generator is disabled for this TurkishMorphology instance")
+            with self.component_lock:
+                if self._word_generator is None:
+                    self._word_generator = WordGenerator(self.morphotactics)
+        return self._word_generator
+
+    @property
+    def ambiguity_resolver(self) -> 'AmbiguityResolver':
+        if self._ambiguity_resolver is None:
+            if not self.use_ambiguity_resolver:
+                raise RuntimeError("Ambiguity resolver is disabled for this TurkishMorphology instance")
+            with self.component_lock:
+                if self._ambiguity_resolver is None:
+                    self._ambiguity_resolver = TurkishMorphology.load_default_ambiguity_resolver()
+        return self._ambiguity_resolver
+
+    @staticmethod
+    def load_default_ambiguity_resolver() -> PerceptronAmbiguityResolver:
+        model_path = resource_path("ambiguity", "model-compressed")
+        try:
+            return PerceptronAmbiguityResolver.from_resource(model_path)
+        except IOError as e:
+            logger.error(e)
+            raise RuntimeError(f"Cannot initialize PerceptronAmbiguityResolver from resource {model_path}")
 
     @staticmethod
     def builder(lexicon: RootLexicon) -> 'TurkishMorphology.Builder':
@@ -63,9 +148,63 @@ class TurkishMorphology:
         logger.info(f"TurkishMorphology instance initialized in {time.time() - start_time}")
         return instance
 
-    @lru_cache(maxsize=250)
+    def save_snapshot(self, path: str):
+        """
+        Saves the fully built instance (lexicon, morphotactic graph, stem transitions, ascii tolerant stem map and
+        ambiguity resolver weights) to a binary file. Loading it with `from_snapshot` skips lexicon parsing and graph
+        construction. Contents of the analysis cache are not saved.
+
+        :param path: path of the snapshot file
+        """
+        # lazily created components are created now, so that they are part of the snapshot.
+        if self.use_ambiguity_resolver:
+            _ = self.ambiguity_resolver
+        if self.use_word_generator:
+            _ = self.word_generator
+        if self.use_unidentified_token_analyzer:
+            _ = self.unidentified_token_analyzer
+
+        with open(path, "wb") as f:
+            pickle.dump((self.SNAPSHOT_FORMAT, self.SNAPSHOT_VERSION), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # morphotactic graph is deeply linked, pickling it may need a higher recursion limit than the default.
+            recursion_limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(recursion_limit, self.SNAPSHOT_RECURSION_LIMIT))
+            try:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            finally:
+                sys.setrecursionlimit(recursion_limit)
+
+    @classmethod
+    def from_snapshot(cls, path: str) -> 'TurkishMorphology':
+        """
+        Loads an instance saved with `save_snapshot`. Snapshots should only be loaded from trusted sources, as they
+        are pickle files. A snapshot is only valid for the zemberek-python version that created it.
+
+        :param path: path of the snapshot file
+        :return: loaded TurkishMorphology instance
+        """
+        start_time = time.time()
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header != (cls.SNAPSHOT_FORMAT, cls.SNAPSHOT_VERSION):
+                raise ValueError(f"File {path} is not a compatible TurkishMorphology snapshot. Header: {header}")
+            recursion_limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(recursion_limit, cls.SNAPSHOT_RECURSION_LIMIT))
+            # unpickling creates hundreds of thousands of container objects, none of them is garbage. Cyclic garbage
+            # collections triggered by these allocations take most of the load time, so they are paused.
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                instance = pickle.load(f)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+                sys.setrecursionlimit(recursion_limit)
+        logger.debug(f"TurkishMorphology snapshot loaded in {time.time() - start_time}")
+        return instance
+
     def analyze(self, word: str = None, token: Token = None) -> WordAnalysis:
-        return self.analyze_without_cache(word=word, token=token)
+        return self.analyze_(word=word, token=token, use_cache=self.cache is not None)
 
     @staticmethod
     def normalize_for_analysis(word: str) -> str:
@@ -80,10 +219,67 @@ class TurkishMorphology:
     def analyze_sentence(self, sentence: str) -> List[WordAnalysis]:
 
         normalized = TextUtil.normalize_quotes_hyphens(sentence)
-        result = [
-            self.analyze(token=t) for t in self.tokenizer.tokenize(normalized)
-        ]
+        return self.analyze_tokens(self.tokenizer.tokenize(normalized))
+
+    def analyze_many(self, words: Iterable[str]) -> List[WordAnalysis]:
+        """
+        Analyzes a batch of words. Each distinct word is tokenized and normalized once and each distinct normalized
+        form is analyzed once, so the cost depends on the vocabulary of the batch rather than its length.
+
+        :param words: words to analyze
+        :return: analyses in the same order with the input
+        """
+        words = list(words)
+        word_tokens: Dict[str, Optional[Token]] = {}
+        for word in words:
+            if word not in word_tokens:
+                word_tokens[word] = self.tokenize_word(word) if word else None
 
+        token_analyses = self.analyze_unique_tokens(
+            [token for token in word_tokens.values() if token is not None], use_cache=self.cache is not None)
+
+        analyses: Dict[str, WordAnalysis] = {}
+        for word, token in word_tokens.items():
+            if token is not None:
+                analyses[word] = token_analyses[(token.content, token.type_)]
+            elif word:
+                analyses[word] = WordAnalysis(word, (), normalized_input=word)
+            else:
+                analyses[word] = WordAnalysis.EMPTY_INPUT_RESULT
+        return [analyses[word] for word in words]
+
+    def analyze_tokens(self, tokens: Iterable[Token]) -> List[WordAnalysis]:
+        """
+        Analyzes a batch of already tokenized input. Tokenizer is not used. Tokens with the same content and type are
+        analyzed once and each distinct normalized form is analyzed once.
+
+        :param tokens: tokens to analyze
+        :return: analyses in the same order with the input
+        """
+        tokens = list(tokens)
+        token_analyses = self.analyze_unique_tokens(tokens, use_cache=self.cache is not None)
+        return [token_analyses[(token.content, token.type_)] for token in tokens]
+
+    def analyze_unique_tokens(self, tokens: List[Token], use_cache: bool) -> \
+            Dict[Tuple[str, 'Token.Type'], WordAnalysis]:
+        unique_tokens: Dict[Tuple[str, Token.Type], Token] = {}
+        for token in tokens:
+            unique_tokens.setdefault((token.content, token.type_), token)
+
+        normalized_inputs: Dict[Tuple[str, Token.Type], str] = {}
+        type_results: Dict[str, Tuple[SingleAnalysis, ...]] = {}
+        for key, token in unique_tokens.items():
+            s = TurkishAlphabet.INSTANCE.normalize_apostrophe(self.normalize_for_analysis(token.content))
+            normalized_inputs[key] = s
+            if len(s) > 0 and s not in type_results:
+                type_results[s] = self.cache.get_(s, self.analyze_for_cache) if use_cache else \
+                    self.analyze_normalized(s)
+
+        result: Dict[Tuple[str, Token.Type], WordAnalysis] = {}
+        for key, token in unique_tokens.items():
+            s = normalized_inputs[key]
+            result[key] = WordAnalysis.EMPTY_INPUT_RESULT if len(s) == 0 else \
+                self.create_word_analysis(token, s, type_results[s], use_cache)
         return result
 
     def disambiguate(self, sentence: str, sentence_analysis: List[WordAnalysis]) -> SentenceAnalysis:
@@ -93,42 +289,240 @@ class TurkishMorphology:
         return self.disambiguate(sentence, self.analyze_sentence(sentence))
 
     def analyze_without_cache(self, word: str = None, token: Token = None) -> WordAnalysis:
+        return self.analyze_(word=word, token=token, use_cache=False)
+
+    def tokenize_word(self, word: str) -> Optional[Token]:
+        """
+        Returns the token of a word, or None if the tokenizer does not produce exactly one token for it. Plain
+        alphabetic words are recognized without running the lexer.
+
+        :param word: a non-empty word
+        :return: single token of the word or None
+        """
+        if TurkishMorphology.is_plain_word(word):
+            return None if self.tokenizer.type_ignored(Token.Type.Word) else \
+                Token(word, Token.Type.Word, 0, len(word) - 1)
+        tokens: Tuple[Token] = self.tokenizer.tokenize(word)
+        return tokens[0] if len(tokens) == 1 else None
+
+    @staticmethod
+    def is_plain_word(word: str) -> bool:
+        return TurkishMorphology.PLAIN_WORD_PATTERN.fullmatch(word) is not None and \
+            TurkishMorphology.ROMAN_NUMERAL_PATTERN.fullmatch(word) is None
+
+    def is_correct(self, word: str) -> bool:
+        """
+        Checks if a word has analyses, same as `analyze(word).is_correct()`. If the word is in the full form table,
+        result is found without analyzing it. Unidentified token analyzer cannot analyze plain words, so absence of
+        their analyses is answered from the table too.
+
+        :param word: word to check
+        :return: True if the word has analyses
+        """
+        if self.full_form_table is not None and word:
+            s = TurkishAlphabet.INSTANCE.normalize_apostrophe(self.normalize_for_analysis(word))
+            correct = self.full_form_table.is_correct(s)
+            if correct is not None and (correct or not self.use_unidentified_token_analyzer or
+                                        TurkishMorphology.is_plain_word(word)) and self.tokenize_word(word):
+                return correct
+        return self.analyze(word).is_correct()
+
+    def analyze_(self, word: str = None, token: Token = None, use_cache: bool = True) -> WordAnalysis:
         if word:
-            tokens: Tuple[Token] = self.tokenizer.tokenize(word)
-            return WordAnalysis(word, (), normalized_input=word) if len(tokens) != 1 else \
-                self.analyze_without_cache(token=tokens[0])
+            token = self.tokenize_word(word)
+            return WordAnalysis(word, (), normalized_input=word) if token is None else \
+                self.analyze_(token=token, use_cache=use_cache)
         else:  # token is not None
             word = token.content  # equal to token.getText()
             s = self.normalize_for_analysis(word)
             if len(s) == 0:
                 return WordAnalysis.EMPTY_INPUT_RESULT
             else:
-                if TurkishAlphabet.INSTANCE.contains_apostrophe(s):
-                    s = TurkishAlphabet.INSTANCE.normalize_apostrophe(s)
-                    result = self.analyze_words_with_apostrophe(s)
-                else:
-                    result = self.analyzer.analyze(s)
+                s = TurkishAlphabet.INSTANCE.normalize_apostrophe(s)
+                result = self.cache.get_(s, self.analyze_for_cache) if use_cache else self.analyze_normalized(s)
+                return self.create_word_analysis(token, s, result, use_cache)
+
+    def create_word_analysis(self, token: Token, s: str, result: Tuple[SingleAnalysis, ...],
+                             use_cache: bool = False) -> WordAnalysis:
+        if len(result) == 0 and self.use_unidentified_token_analyzer:
+            result = self.analyze_unidentified(token, use_cache)
+
+        if len(result) == 1 and result[0].item.is_unknown():
+            result = ()
+
+        return WordAnalysis(token.content, normalized_input=s, analysis_results=result)
 
-                if len(result) == 0 and self.use_unidentified_token_analyzer:
-                    result = self.unidentified_token_analyzer.analyze(token)
+    def analyze_normalized(self, s: str) -> Tuple[SingleAnalysis, ...]:
+        """
+        Analyzes an input that is already normalized with `normalize_for_analysis`. Unidentified token analysis is
+        not applied. Results of this method are what the analysis cache stores, unless a search limit truncates
+        them. Inputs in the full form table are not analyzed, their analyses are taken from the table.
 
-                if len(result) == 1 and result[0].item.is_unknown():
-                    result = ()
+        :param s: normalized input
+        :return: analyses of the input
+        """
+        return self.analyze_normalized_with_report(s).analyses
 
-                return WordAnalysis(word, normalized_input=s, analysis_results=result)
+    def analyze_normalized_with_report(self, s: str) -> RuleBasedAnalyzer.AnalysisReport:
+        if self.full_form_table is not None:
+            result = self.full_form_table.get(s, self.lexicon)
+            if result is not None:
+                return RuleBasedAnalyzer.AnalysisReport(result, None)
+        if TurkishAlphabet.INSTANCE.contains_apostrophe(s):
+            return self.analyze_words_with_apostrophe_report(s)
+        return self.analyzer.analyze_with_report(s)
+
+    def analyze_unidentified(self, token: Token, use_cache: bool) -> Tuple[SingleAnalysis, ...]:
+        """
+        Analyzes a token that has no analyses with the unidentified token analyzer. Its results depend on the type and
+        the original content of the token (letter case, dots of abbreviations etc.), not only on the normalized
+        input. So they are cached with (content, type) keys, next to the normalized inputs of the analysis cache. A
+        cached token takes two cache lookups, one for its normalized input and one for its own key, and cache
+        statistics count both of them.
+
+        :param token: token to analyze
+        :param use_cache: if True, analysis cache is used
+        :return: analyses of the token
+        """
+        if not use_cache:
+            return self.unidentified_token_analyzer.analyze(token)
+        return self.cache.get_((token.content, token.type_), lambda key: self.analyze_unidentified_for_cache(token))
+
+    def analyze_unidentified_for_cache(self, token: Token) \
+            -> Union[Tuple[SingleAnalysis, ...], AnalysisCache.Uncached]:
+        result = self.unidentified_token_analyzer.analyze(token)
+        # searches of the unidentified token analyzer do not report truncation, so their results are not cached when
+        # searches are bounded.
+        return result if self.analyzer.search_limits is None else AnalysisCache.Uncached(result)
+
+    def analyze_for_cache(self, s: str) -> Union[Tuple[SingleAnalysis, ...], AnalysisCache.Uncached]:
+        return TurkishMorphology.cache_value(self.analyze_normalized_with_report(s))
+
+    @staticmethod
+    def cache_value(report: RuleBasedAnalyzer.AnalysisReport) -> Union[tuple, AnalysisCache.Uncached]:
+        # truncated results depend on the load of the machine and the limits, they are returned but not cached.
+        return AnalysisCache.Uncached(report.analyses) if report.is_truncated() else report.analyses
+
+    def warm_up_cache(self, words: Iterable[str]):
+        """
+        Pre-fills the analysis cache with given words. Words should be ordered from the most frequent to the least
+        frequent. Does nothing if cache is disabled.
+
+        :param words: words to analyze, most frequent first
+        """
+        if self.cache is None:
+            return
+        keys = {}
+        for word in words:
+            s = TurkishAlphabet.INSTANCE.normalize_apostrophe(self.normalize_for_analysis(word))
+            if len(s) > 0:
+                keys[s] = None
+        self.cache.warm_up(keys.keys(), self.analyze_for_cache)
+
+    def warm_up_cache_from_file(self, path: str, limit: int = None):
+        """
+        Pre-fills the analysis cache from a word frequency file. See AnalysisCache.load_frequency_list for the format.
+
+        :param path: path of the frequency file
+        :param limit: maximum amount of words to use. Default is None, meaning cache capacity
+        """
+        if self.cache is None:
+            return
+        self.warm_up_cache(AnalysisCache.load_frequency_list(path, self.cache.max_size if limit is None else limit))
+
+    def invalidate_cache(self):
+        if self.cache is not None:
+            self.cache.clear()
+        if self.lemma_cache is not None:
+            self.lemma_cache.clear()
+
+    def lemmatize(self, word: str = None, token: Token = None, most_likely: bool = False) \
+            -> Tuple[LemmaAnalysis, ...]:
+        """
+        Finds lemmas of a word. Only dictionary items of the analyses are found, analyses are not created unless
+        the word is analyzed by the unidentified token analyzer or `most_likely` is True. Results are kept in the
+        lemma cache, which is separate from the analysis cache.
+
+        :param word: word to lemmatize
+        :param token: token to lemmatize if word is not given
+        :param most_likely: if True and there are more than one lemma, only the lemma of the analysis the ambiguity
+            resolver selects is returned. Word is disambiguated without any context
+        :return: distinct lemmas of the word, in the order of its analyses
+        """
+        if word:
+            token = self.tokenize_word(word)
+            if token is None:
+                return ()
+        s = TurkishAlphabet.INSTANCE.normalize_apostrophe(self.normalize_for_analysis(token.content))
+        if len(s) == 0:
+            return ()
+        result = self.lemma_cache.get_(s, self.lemmatize_for_cache) if self.lemma_cache is not None else \
+            self.lemmatize_normalized(s)
+        if len(result) == 0 and self.use_unidentified_token_analyzer:
+            result = LemmaAnalysis.from_analyses(self.analyze_unidentified(token, self.cache is not None))
+        if most_likely and len(result) > 1:
+            best = self.disambiguate(token.content, [self.analyze_(token=token)]).best_analysis()[0]
+            result = (LemmaAnalysis(best.item),)
+        return result
+
+    def lemmatize_sentence(self, sentence: str, most_likely: bool = False) -> List[Tuple[LemmaAnalysis, ...]]:
+        """
+        Finds lemmas of the words of a sentence, see `lemmatize`. If `most_likely` is True and some words have more
+        than one lemma, sentence is analyzed and disambiguated, and their lemmas are selected with the context.
+
+        :param sentence: sentence to lemmatize
+        :param most_likely: if True, only the most likely lemma of each word is returned
+        :return: lemmas of each token of the sentence
+        """
+        tokens = self.tokenizer.tokenize(TextUtil.normalize_quotes_hyphens(sentence))
+        result = [self.lemmatize(token=token) for token in tokens]
+        if most_likely and any(len(lemmas) > 1 for lemmas in result):
+            best = self.disambiguate(sentence, self.analyze_tokens(tokens)).best_analysis()
+            result = [lemmas if len(lemmas) <= 1 else (LemmaAnalysis(analysis.item),)
+                      for lemmas, analysis in zip(result, best)]
+        return result
+
+    def lemmatize_normalized(self, s: str) -> Tuple[LemmaAnalysis, ...]:
+        """
+        Lemmatizes an input that is already normalized with `normalize_for_analysis`. Unidentified token analysis is
+        not applied. Results of this method are what the lemma cache stores, unless a search limit truncates them.
+
+        :param s: normalized input
+        :return: distinct lemmas of the input
+        """
+        return self.lemmatize_normalized_with_report(s).analyses
+
+    def lemmatize_normalized_with_report(self, s: str) -> RuleBasedAnalyzer.AnalysisReport:
+        if self.full_form_table is not None:
+            items = self.full_form_table.get_items(s, self.lexicon)
+            if items is not None:
+                return RuleBasedAnalyzer.AnalysisReport(LemmaAnalysis.from_items(items), None)
+        if TurkishAlphabet.INSTANCE.contains_apostrophe(s):
+            # results depend on the analyses, words with apostrophes are analyzed.
+            report = self.analyze_words_with_apostrophe_report(s)
+            return RuleBasedAnalyzer.AnalysisReport(LemmaAnalysis.from_analyses(report.analyses), report.truncation)
+        return self.analyzer.lemmatize_with_report(s)
+
+    def lemmatize_for_cache(self, s: str) -> Union[Tuple[LemmaAnalysis, ...], AnalysisCache.Uncached]:
+        return TurkishMorphology.cache_value(self.lemmatize_normalized_with_report(s))
 
     def analyze_words_with_apostrophe(self, word: str) -> Tuple[SingleAnalysis, ...]:
+        return self.analyze_words_with_apostrophe_report(word).analyses
+
+    def analyze_words_with_apostrophe_report(self, word: str) -> RuleBasedAnalyzer.AnalysisReport:
         index = word.find(chr(39))
         if index > 0 and index != len(word) - 1:
             se = StemAndEnding(word[0:index], word[index + 1:])
             stem = TurkishAlphabet.INSTANCE.normalize(se.stem)
             without_quote = word.replace("'", "")
-            no_quotes_parses = self.analyzer.analyze(without_quote)
-            return () if len(no_quotes_parses) == 0 else \
-                tuple(p for p in no_quotes_parses if p.item.primary_pos == PrimaryPos.Noun and
-                      (p.contains_morpheme(TurkishMorphotactics.p3sg) or p.get_stem() == stem))
+            # only nouns are accepted, other stems are not searched at all.
+            report = self.analyzer.analyze_with_report(
+                without_quote, stem_filter=lambda t: t.item.primary_pos == PrimaryPos.Noun)
+            return RuleBasedAnalyzer.AnalysisReport(
+                tuple(p for p in report.analyses
+                      if p.contains_morpheme(TurkishMorphotactics.p3sg) or p.get_stem() == stem), report.truncation)
         else:
-            return ()
+            return RuleBasedAnalyzer.AnalysisReport((), None)
 
     class Builder:
         use_unidentifiedTokenAnalyzer = True
@@ -139,6 +533,15 @@ class TurkishMorphology:
             self.informal_analysis = False
             self.ignore_diacritics_in_analysis = False
             self.ambiguity_resolver: Optional['AmbiguityResolver'] = None
+            self.use_ambiguity_resolver = True
+            self.use_word_generator = True
+            self.use_cache = True
+            self.cache_size = AnalysisCache.DEFAULT_MAX_SIZE
+            self.cache_eviction_policy = AnalysisCache.EvictionPolicy.LRU
+            self.cache: Optional[AnalysisCache] = None
+            self.search_limits: Optional[RuleBasedAnalyzer.SearchLimits] = None
+            self.full_form_table: Optional[FullFormTable] = None
+            self.lemma_cache_size: Optional[int] = AnalysisCache.DEFAULT_MAX_SIZE
 
         def set_lexicon(self, lexicon: RootLexicon) -> 'TurkishMorphology.Builder':
             self.lexicon = lexicon
@@ -152,5 +555,71 @@ class TurkishMorphology:
             self.ignore_diacritics_in_analysis = True
             return self
 
+        def set_ambiguity_resolver(self, ambiguity_resolver: 'AmbiguityResolver') -> 'TurkishMorphology.Builder':
+            self.use_ambiguity_resolver = True
+            self.ambiguity_resolver = ambiguity_resolver
+            return self
+
+        def disable_ambiguity_resolver(self) -> 'TurkishMorphology.Builder':
+            self.use_ambiguity_resolver = False
+            self.ambiguity_resolver = None
+            return self
+
+        def disable_word_generator(self) -> 'TurkishMorphology.Builder':
+            self.use_word_generator = False
+            return self
+
+        def disable_unidentified_token_analyzer(self) -> 'TurkishMorphology.Builder':
+            self.use_unidentifiedTokenAnalyzer = False
+            return self
+
+        def use_analysis_cache(self, size: int = AnalysisCache.DEFAULT_MAX_SIZE,
+                               eviction_policy: AnalysisCache.EvictionPolicy = AnalysisCache.EvictionPolicy.LRU) \
+                -> 'TurkishMorphology.Builder':
+            self.use_cache = True
+            self.cache_size = size
+            self.cache_eviction_policy = eviction_policy
+            return self
+
+        def set_analysis_cache(self, cache: AnalysisCache) -> 'TurkishMorphology.Builder':
+            self.use_cache = True
+            self.cache = cache
+            return self
+
+        def disable_cache(self) -> 'TurkishMorphology.Builder':
+            self.use_cache = False
+            self.cache = None
+            return self
+
+        def use_lemma_cache(self, size: int = AnalysisCache.DEFAULT_MAX_SIZE) -> 'TurkishMorphology.Builder':
+            self.lemma_cache_size = size
+            return self
+
+        def disable_lemma_cache(self) -> 'TurkishMorphology.Builder':
+            self.lemma_cache_size = None
+            return self
+
+        def set_search_limits(self, max_frontier_size: int = None, max_expanded_paths: int = None,
+                              time_limit: float = None) -> 'TurkishMorphology.Builder':
+            """
+            Bounds the search of every analysis. When a limit is exceeded, analyses found until then are returned and
+            a warning is logged. Such results are not stored in the analysis and lemma caches, they are searched
+            again when they are requested again.
+
+            :param max_frontier_size: maximum amount of paths kept at each step of the search
+            :param max_expanded_paths: maximum amount of paths advanced for an analysis
+            :param time_limit: maximum duration of an analysis in seconds
+            """
+            self.search_limits = RuleBasedAnalyzer.SearchLimits(max_frontier_size, max_expanded_paths, time_limit)
+            return self
+
+        def use_full_form_table(self, table: FullFormTable) -> 'TurkishMorphology.Builder':
+            """
+            Sets a precompiled table of analyses, see FullFormTable. It must be created with the same lexicon and the
+            same informal and ignore diacritics settings.
+            """
+            self.full_form_table = table
+            return self
+
         def build(self) -> 'TurkishMorphology':
             return TurkishMorphology(self)
@@ -10,8 +10,8 @@ class AtomicCounter:
         self._lock = Lock()
 
     def get_and_increment(self):
-        value = self.count
         with self._lock:
+            value = self.count
             self.count += 1
         return value
 
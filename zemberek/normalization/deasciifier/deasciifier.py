@@ -1,18 +1,16 @@
 import pickle
-import os
 
-from pkg_resources import resource_filename
-from typing import Dict
+from threading import Lock
+from typing import Dict, Optional
+
+from zemberek.core.utils import resource_path
 
 
 class Deasciifier:
     turkish_context_size = 10
-    with open(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "turkish_pattern_table.pickle")),
-            "rb"
-    ) as f:
-        turkish_pattern_table: Dict[str, Dict] = pickle.load(f)
-    del f
+    # pattern table is loaded when the first Deasciifier is created.
+    turkish_pattern_table: Optional[Dict[str, Dict]] = None
+    pattern_table_lock = Lock()
     turkish_asciify_table = {u'ç': u'c', u'Ç': u'C', u'ğ': u'g', u'Ğ': u'G', u'ö': u'o',
                              u'Ö': u'O', u'ı': u'i', u'İ': u'I', u'ş': u's', u'Ş': u'S'}
     uppercase_letters = (u"A", u"B", u"C", u"D", u"E", u"F", u"G", u"H", u"I", u"J", u"K", u"L", u"M", u"N", u"O",
@@ -49,9 +47,18 @@ class Deasciifier:
                                    u'İ': u'I', u'ş': u's', u'Ş': u'S'}
 
     def __init__(self, ascii_string: str):
+        if Deasciifier.turkish_pattern_table is None:
+            Deasciifier.load_pattern_table()
         self.ascii_string = ascii_string
         self.turkish_string = ascii_string
 
+    @staticmethod
+    def load_pattern_table():
+        with Deasciifier.pattern_table_lock:
+            if Deasciifier.turkish_pattern_table is None:
+                with open(resource_path("normalization", "turkish_pattern_table.pickle"), "rb") as f:
+                    Deasciifier.turkish_pattern_table = pickle.load(f)
+
     def convert_to_turkish(self) -> str:
         for i, c in enumerate(self.turkish_string):
             if self.turkish_need_correction(c, i):
@@ -1,8 +1,6 @@
 from __future__ import annotations
 from typing import Tuple, FrozenSet, TYPE_CHECKING
-from pkg_resources import resource_filename
 
-import os
 
 if TYPE_CHECKING:
     from zemberek.morphology import TurkishMorphology
@@ -10,6 +8,7 @@ if TYPE_CHECKING:
 
 from zemberek.core.turkish import PrimaryPos
 from zemberek.normalization.character_graph import CharacterGraph
+from zemberek.core.utils import resource_path
 
 
 class StemEndingGraph:
@@ -26,7 +25,7 @@ class StemEndingGraph:
     @staticmethod
     def load_lines_from_resource(path: str = None) -> Tuple[str]:
         if not path:
-            path = resource_filename("zemberek", os.path.join("resources", "normalization", "endings.txt"))
+            path = resource_path("normalization", "endings.txt")
         with open(path, 'r', encoding='utf-8') as f:
             lines = tuple(line.replace('\n', "") for line in f.readlines())
         return lines
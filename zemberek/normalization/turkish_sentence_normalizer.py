@@ -1,9 +1,8 @@
 import math
 
-from pkg_resources import resource_filename
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from typing import List, Tuple, Dict, FrozenSet, Set, Union, OrderedDict as ODict
 
-import os
 import numpy as np
 from collections import OrderedDict
 
@@ -19,11 +18,12 @@ from zemberek.normalization.stem_ending_graph import StemEndingGraph
 from zemberek.normalization.character_graph_decoder import CharacterGraphDecoder
 from zemberek.normalization.turkish_spell_checker import TurkishSpellChecker
 from zemberek.normalization.deasciifier.deasciifier import Deasciifier
+from zemberek.core.utils import resource_path
 
 
 def load_replacements() -> Dict[str, str]:
     with open(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "multi-word-replacements.txt")),
+            resource_path("normalization", "multi-word-replacements.txt"),
             "r",
             encoding="utf-8"
     ) as f:
@@ -36,7 +36,7 @@ def load_replacements() -> Dict[str, str]:
 
 def load_no_split() -> FrozenSet[str]:
     with open(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "no-split.txt")),
+            resource_path("normalization", "no-split.txt"),
             "r",
             encoding="utf-8"
     ) as f:
@@ -50,7 +50,7 @@ def load_no_split() -> FrozenSet[str]:
 def load_common_split() -> Dict[str, str]:
     common_splits: Dict[str, str] = {}
     with open(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "split.txt")),
+            resource_path("normalization", "split.txt"),
             "r",
             encoding="utf-8"
     ) as f:
@@ -60,6 +60,11 @@ def load_common_split() -> Dict[str, str]:
     return common_splits
 
 
+def load_question_suffixes() -> FrozenSet[str]:
+    with open(resource_path("normalization", "question-suffixes.txt"), "r", encoding="utf-8") as f:
+        return frozenset(f.read().split('\n'))
+
+
 def load_multimap(resource: str) -> ODict[str, Tuple[str]]:
     with open(resource, "r", encoding="utf-8") as f:
         lines: List[str] = f.read().split('\n')
@@ -87,47 +92,106 @@ class TurkishSentenceNormalizer:
     END: 'TurkishSentenceNormalizer.Candidate'
     END_CANDIDATES: 'TurkishSentenceNormalizer.Candidates'
 
-    def __init__(self, morphology: TurkishMorphology):
-        self.morphology = morphology
-        self.analysis_converter: InformalAnalysisConverter = InformalAnalysisConverter(morphology.word_generator)
-        self.lm: SmoothLM = SmoothLM.builder(resource_filename("zemberek", os.path.join("resources", "lm.2gram.slm"))). \
-            log_base(np.e).build()
-
-        graph = StemEndingGraph(morphology)
-        decoder = CharacterGraphDecoder(graph.stem_graph)
-        self.spell_checker = TurkishSpellChecker(morphology, decoder=decoder,
-                                                 matcher=CharacterGraphDecoder.DIACRITICS_IGNORING_MATCHER)
-
-        self.replacements: Dict[str, str] = load_replacements()
-        self.no_split_words: FrozenSet[str] = load_no_split()
-        self.common_splits = load_common_split()
-
-        with open(
-                resource_filename("zemberek", os.path.join("resources", "normalization", "question-suffixes.txt")),
-                "r",
-                encoding="utf-8"
-        ) as f:
-            lines = f.read().split('\n')
-        del f
-
-        self.common_connected_suffixes: FrozenSet[str] = frozenset(lines)
+    def __init__(self, morphology: Union[TurkishMorphology, 'Future[TurkishMorphology]'],
+                 memory_map_lm: bool = False, executor: Executor = None):
+        """
+        :param morphology: morphology instance to use. It can also be a future of a morphology that is still being
+            built
+        :param memory_map_lm: if True, bigram language model data is memory mapped instead of being read into
+            memory. Useful when many worker processes use a normalizer at the same time.
+        :param executor: if given, resources are loaded concurrently with this executor and the constructor returns
+            without waiting. Accessing a component that is not loaded yet blocks until it is ready. Components that
+            depend on others are submitted after them, so executor should run tasks in submission order.
+        """
+        self.pending_components: Dict[str, Future] = {}
         self.always_apply_deasciifier = False
-
-        self.lookup_manual: Dict[str, Tuple[str]] = load_multimap(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "candidates-manual.txt")))
-        self.lookup_from_graph: Dict[str, Tuple[str]] = load_multimap(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "lookup-from-graph.txt"))
+        if isinstance(morphology, Future):
+            self.pending_components["morphology"] = morphology
+        else:
+            self.morphology = morphology
+
+        components = (
+            ("lm", self.load_lm, (memory_map_lm,)),
+            ("replacements", load_replacements, ()),
+            ("no_split_words", load_no_split, ()),
+            ("common_splits", load_common_split, ()),
+            ("common_connected_suffixes", load_question_suffixes, ()),
+            ("lookup_manual", load_multimap, (resource_path("normalization", "candidates-manual.txt"),)),
+            ("lookup_from_ascii", load_multimap, (resource_path("normalization", "ascii-map.txt"),)),
+            ("lookup_from_graph", self.load_lookup_from_graph, ()),
+            ("informal_ascii_tolerant_morphology", self.build_informal_ascii_tolerant_morphology, ()),
+            ("analysis_converter", self.create_analysis_converter, ()),
+            ("spell_checker", self.create_spell_checker, ()),
         )
-        self.lookup_from_ascii: Dict[str, Tuple[str]] = load_multimap(
-            resource_filename("zemberek", os.path.join("resources", "normalization", "ascii-map.txt")))
+        for name, function, args in components:
+            if executor is None:
+                setattr(self, name, function(*args))
+            else:
+                self.pending_components[name] = executor.submit(function, *args)
+
+    def __getattr__(self, name: str):
+        # only called for attributes that are not set yet, that is components that are still being loaded.
+        pending = self.__dict__.get("pending_components")
+        if pending is None or name not in pending:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = pending[name].result()
+        setattr(self, name, value)
+        return value
+
+    @staticmethod
+    def create_in_background(morphology: TurkishMorphology = None, memory_map_lm: bool = False,
+                             max_workers: int = None) -> 'TurkishSentenceNormalizer':
+        """
+        Creates a normalizer whose resources are loaded concurrently by a thread pool. Method returns immediately,
+        use `wait_until_ready` to block until all resources are loaded.
+
+        :param morphology: morphology instance to use. If None, default morphology is also built in background
+        :param memory_map_lm: if True, bigram language model data is memory mapped
+        :param max_workers: amount of loader threads. Default is None, meaning ThreadPoolExecutor's default
+        :return: normalizer instance
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zemberek-normalizer-init")
+        try:
+            if morphology is None:
+                morphology = executor.submit(TurkishMorphology.create_with_defaults)
+            return TurkishSentenceNormalizer(morphology, memory_map_lm=memory_map_lm, executor=executor)
+        finally:
+            # already submitted tasks still run, threads exit when they are done.
+            executor.shutdown(wait=False)
+
+    def wait_until_ready(self) -> 'TurkishSentenceNormalizer':
+        """
+        Blocks until all components are loaded. If loading of a component failed, its exception is raised.
+        """
+        for name in tuple(self.pending_components.keys()):
+            getattr(self, name)
+        return self
+
+    def load_lm(self, memory_map: bool) -> SmoothLM:
+        lm_builder = SmoothLM.builder(resource_path("lm.2gram.slm")).log_base(np.e)
+        if memory_map:
+            lm_builder.memory_map()
+        return lm_builder.build()
+
+    def load_lookup_from_graph(self) -> Dict[str, Tuple[str]]:
+        lookup_from_graph = load_multimap(resource_path("normalization", "lookup-from-graph.txt"))
         for s in self.lookup_manual.keys():
-            try:
-                self.lookup_from_graph.pop(s)
-            except KeyError:
-                pass
+            lookup_from_graph.pop(s, None)
+        return lookup_from_graph
 
-        self.informal_ascii_tolerant_morphology = TurkishMorphology.builder(morphology.lexicon) \
-            .use_informal_analysis().ignore_diacritics_in_analysis_().build()
+    def build_informal_ascii_tolerant_morphology(self) -> TurkishMorphology:
+        # this instance is only used for analysis, so it does not load a second ambiguity resolver or word generator.
+        return TurkishMorphology.builder(self.morphology.lexicon).use_informal_analysis() \
+            .ignore_diacritics_in_analysis_().disable_ambiguity_resolver().disable_word_generator().build()
+
+    def create_analysis_converter(self) -> InformalAnalysisConverter:
+        return InformalAnalysisConverter(self.morphology.word_generator)
+
+    def create_spell_checker(self) -> TurkishSpellChecker:
+        graph = StemEndingGraph(self.morphology)
+        decoder = CharacterGraphDecoder(graph.stem_graph)
+        return TurkishSpellChecker(self.morphology, decoder=decoder,
+                                   matcher=CharacterGraphDecoder.DIACRITICS_IGNORING_MATCHER)
 
     def normalize(self, sentence: str) -> str:
         processed = self.pre_process(sentence)
@@ -185,7 +249,7 @@ class TurkishSentenceNormalizer:
                 candidates.extend([c for c in spell_candidates if c not in candidates_set])
                 candidates_set.update(spell_candidates)
 
-            if len(candidates) == 0 or self.morphology.analyze(current).is_correct():
+            if len(candidates) == 0 or self.morphology.is_correct(current):
                 if current not in candidates_set:
                     candidates_set.add(current)
                     candidates.append(current)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import os
 import re
 import logging
 
-from pkg_resources import resource_filename
 from operator import itemgetter
 from typing import List, Set, Tuple, TYPE_CHECKING
 
@@ -16,6 +14,7 @@ from zemberek.morphology.analysis.word_analysis_surface_formatter import WordAna
 from zemberek.lm import SmoothLM
 from zemberek.normalization.stem_ending_graph import StemEndingGraph
 from zemberek.normalization.character_graph_decoder import CharacterGraphDecoder
+from zemberek.core.utils import resource_path
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ class TurkishSpellChecker:
             graph = StemEndingGraph(morphology)
             self.decoder = CharacterGraphDecoder(graph.stem_graph)
             self.unigram_model: SmoothLM = SmoothLM.builder(
-                resource=resource_filename("zemberek", os.path.join("resources", "lm-unigram.slm"))).build()
+                resource=resource_path("lm-unigram.slm")).build()
             self.char_matcher = matcher
         else:
             self.decoder = decoder
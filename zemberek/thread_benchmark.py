@@ -0,0 +1,107 @@
+"""
+Multi-threaded stress and scaling benchmark for morphological analysis.
+
+Words are analyzed by 1, 2, 4, ... threads sharing one TurkishMorphology instance. Results of every thread are
+compared with single threaded results, while another thread keeps adding and removing dictionary items. On a
+free-threaded CPython build throughput should increase with the thread count.
+
+Usage:
+    python -m zemberek.thread_benchmark [--lexicon LEXICON_CSV] [--words WORD_FILE] [--threads 8] [--rounds 3]
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from zemberek.core.turkish import PrimaryPos, SecondaryPos
+from zemberek.morphology import TurkishMorphology
+from zemberek.morphology.lexicon import DictionaryItem
+from zemberek.morphology.lexicon.root_lexicon import DictionaryReader
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s\nMsg: %(message)s\n')
+logger = logging.getLogger(__name__)
+
+# unknown words are included, they are analyzed by the unidentified token analyzer with runtime items.
+default_words = ("kalemin evlerimizden geliyorum yarın kar yağacak okula gidiyorum kitaplarımızdan ağaçlardan "
+                 "Ahmet'e Zeynep'in TBMM'de Gülşen'den 3'te 12.'si #etiket @ali bkz. xyzqler güzelleştirilemeyecek "
+                 "yapabileceklerimizden mavisi benim seninle değilim okuyacaktık").split()
+
+
+def analyze_all(morphology: TurkishMorphology, words: List[str]) -> Tuple[str, ...]:
+    return tuple(" | ".join(str(a) for a in morphology.analyze_without_cache(word)) for word in words)
+
+
+def mutate_lexicon(morphology: TurkishMorphology, stop: threading.Event, batch_size: int = 100) -> int:
+    """
+    Adds and removes a batch of items that none of the words use, so readers must not see any difference.
+    """
+    stem_transitions = morphology.morphotactics.stem_transitions
+    roots = ["zzyzx" + "".join("abcdefghij"[int(d)] for d in str(i)) for i in range(batch_size)]
+    items = [DictionaryItem(root.capitalize(), root, PrimaryPos.Noun, SecondaryPos.ProperNoun, pronunciation=root)
+             for root in roots]
+    count = 0
+    while not stop.is_set():
+        stem_transitions.add_dictionary_items(items)
+        stem_transitions.remove_dictionary_items(items)
+        count += 1
+    return count
+
+
+def run(morphology: TurkishMorphology, words: List[str], max_threads: int, rounds: int):
+    expected = analyze_all(morphology, words)
+    work = [words] * (rounds * max_threads)
+
+    thread_count = 1
+    single_rate = None
+    while thread_count <= max_threads:
+        stop = threading.Event()
+        writer = ThreadPoolExecutor(max_workers=1)
+        mutations = writer.submit(mutate_lexicon, morphology, stop)
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            results = list(executor.map(lambda w: analyze_all(morphology, w), work))
+        elapsed = time.time() - start
+
+        stop.set()
+        writer.shutdown()
+        mismatches = sum(1 for result in results if result != expected)
+        rate = len(work) * len(words) / elapsed
+        if single_rate is None:
+            single_rate = rate
+        logger.info(f"threads={thread_count} words/s={rate:.0f} speedup={rate / single_rate:.2f} "
+                    f"mismatches={mismatches} lexicon updates={mutations.result()}")
+        if mismatches > 0:
+            raise AssertionError(f"{mismatches} results are different from single threaded results")
+        thread_count *= 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lexicon", help="lexicon csv file. Default lexicon is used if it is not given")
+    parser.add_argument("--words", help="utf-8 file of words, separated with whitespace")
+    parser.add_argument("--threads", type=int, default=8, help="maximum amount of threads")
+    parser.add_argument("--rounds", type=int, default=3, help="amount of times each thread analyzes the words")
+    args = parser.parse_args()
+
+    if args.lexicon is None:
+        morphology = TurkishMorphology.create_with_defaults()
+    else:
+        morphology = TurkishMorphology.builder(DictionaryReader.load_from_resources(args.lexicon)).build()
+
+    if args.words is None:
+        words = list(default_words)
+    else:
+        with open(args.words, "r", encoding="utf-8") as f:
+            words = f.read().split()
+
+    run(morphology, words, args.threads, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,7 @@
-import os
 import re
 
-from pkg_resources import resource_filename
-from typing import Set, List, TYPE_CHECKING
+from threading import Lock
+from typing import Set, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from antlr4.atn.ATN import ATN
@@ -17,29 +16,40 @@ from queue import Queue
 
 from zemberek.core.turkish import TurkishAlphabet
 from zemberek.tokenization.antlr.custom_lexer_ATN_simulator import CustomLexerATNSimulator
+from zemberek.core.utils import resource_path
 
 
 class TurkishLexer(Lexer):
     _ATN: 'ATN'
-    abbreviations: Set[str] = set()
-    fi = resource_filename("zemberek", os.path.join("resources", "abbreviations.txt"))
-    with open(fi, "r", encoding="utf-8") as f:
-        for line in f:
-            if len(line.strip()) > 0:
-                abbr = re.sub("\\s+", "", line.strip())
-                if abbr.endswith("."):
-                    abbreviations.add(abbr)
-                    abbreviations.add(abbr.lower())
-                    abbreviations.add(abbr.translate(TurkishAlphabet.lower_map).lower())
-    del f
+    # abbreviations are loaded when the first lexer is created.
+    abbreviations: Optional[Set[str]] = None
+    abbreviations_lock = Lock()
     _decision_to_DFA: List[DFA]
     _shared_context_cache = PredictionContextCache()
 
     def __init__(self, inp: InputStream):
+        if TurkishLexer.abbreviations is None:
+            TurkishLexer.load_abbreviations()
         super().__init__(inp)
         self._interp = CustomLexerATNSimulator(self, self._ATN, self._decision_to_DFA, self._shared_context_cache)
         self.queue = Queue()
 
+    @staticmethod
+    def load_abbreviations():
+        with TurkishLexer.abbreviations_lock:
+            if TurkishLexer.abbreviations is not None:
+                return
+            abbreviations: Set[str] = set()
+            with open(resource_path("abbreviations.txt"), "r", encoding="utf-8") as f:
+                for line in f:
+                    if len(line.strip()) > 0:
+                        abbr = re.sub("\\s+", "", line.strip())
+                        if abbr.endswith("."):
+                            abbreviations.add(abbr)
+                            abbreviations.add(abbr.lower())
+                            abbreviations.add(abbr.translate(TurkishAlphabet.lower_map).lower())
+            TurkishLexer.abbreviations = abbreviations
+
     def nextToken(self) -> Token:
         if not self.queue.empty():
             return self.queue.get(block=False)